@@ -0,0 +1,187 @@
+"""
+Balance-tuning sweep: seeded headless careers for every point of a parameter grid,
+played across a process pool, with outcome metrics per grid point.
+
+Parameters are module-level constants that the game reads at call time, set in each
+worker before a career starts. Use a short name from PARAMS or any `module.NAME`;
+values are Python literals, so tuples work too:
+
+    python3 benchmarks/balance_sweep.py --param home_adv=1.0,1.4,1.8 \\
+        --param injury_tiers="((0.6, 6, 14), (0.9, 15, 60), (1.0, 61, 150))" \\
+        --seeds 8 --seasons 5 [--workers 4] [--no-transfers] [--json out.json]
+
+Metrics, averaged over the seeds of a grid point:
+  title_share   share of titles won by the career's most successful club
+  title_hhi     Herfindahl index of titles (1 / seasons if every title went elsewhere, 1 for one club)
+  budget_gini   Gini coefficient of club budgets at the end of the last season (0 = equal)
+  rating_drift  change of the league's average first-team rating per season
+"""
+import argparse
+import ast
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, HERE)
+os.chdir(ROOT)
+
+import warnings  # noqa: E402
+warnings.filterwarnings("ignore")
+
+import interactive_season  # noqa: E402  (a temp save dir per process, history included)
+import numpy as np  # noqa: E402
+from saveGame import DEFAULT_SAVE_PATH  # noqa: E402
+from seasonHistory import SeasonHistory  # noqa: E402
+from terminal import set_verbosity  # noqa: E402
+
+PARAMS = {
+    "home_adv": "matchEngineSchedules.HOME_ADV",
+    "rating_scale": "matchEngineSchedules.RATING_SCALE",
+    "budget_decay": "economy.BUDGET_DECAY",
+    "budget_floor": "economy.BUDGET_FLOOR",
+    "podium_rewards": "economy.PODIUM_REWARDS",
+    "objective_bonus": "economy.OBJECTIVE_BONUS",
+    "lottery_winners": "economy.LOTTERY_WINNERS",
+    "lottery_bonus": "economy.LOTTERY_BONUS",
+    "lottery_jackpot": "economy.LOTTERY_JACKPOT",
+    "lottery_jackpot_chance": "economy.LOTTERY_JACKPOT_CHANCE",
+    "dynasty_investment": "economy.DYNASTY_INVESTMENT",
+    "poach_top_chance": "transfersAI.POACH_TOP_CHANCE",
+    "poach_double_chance": "transfersAI.POACH_DOUBLE_CHANCE",
+    "poach_bottom_chance": "transfersAI.POACH_BOTTOM_CHANCE",
+    "poach_free_move_chance": "transfersAI.POACH_FREE_MOVE_CHANCE",
+    "injury_tiers": "injuries.INJURY_TIERS",
+    "youth_growth": "models.player.YOUTH_GROWTH",
+    "prime_growth": "models.player.PRIME_GROWTH",
+    "veteran_decline": "models.player.VETERAN_DECLINE",
+}
+METRICS = ("title_share", "title_hhi", "budget_gini", "rating_drift")
+
+
+def resolve(name):
+    """(module, attribute) for a PARAMS alias or a `module.NAME` path; the constant must exist."""
+    path = PARAMS.get(name, name)
+    module, _, attr = path.rpartition(".")
+    if not module or not hasattr(importlib.import_module(module), attr):
+        raise ValueError(f"unknown parameter {name!r}; use one of {', '.join(PARAMS)} or module.NAME")
+    return module, attr
+
+
+def parse_param(text):
+    name, sep, values = text.partition("=")
+    if not sep or not values:
+        raise argparse.ArgumentTypeError(f"expected name=v1,v2,... got {text!r}")
+    try:
+        parsed = ast.literal_eval(f"[{values}]")
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(f"values of {name} are not Python literals: {values!r}")
+    try:
+        resolve(name.strip())
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+    return name.strip(), parsed
+
+
+def gini(values):
+    x = np.sort(np.clip(np.asarray(values, dtype=float), 0, None))
+    if not x.size or not x.sum():
+        return 0.0
+    ranks = np.arange(1, x.size + 1)
+    return float((2 * ranks - x.size - 1).dot(x) / (x.size * x.sum()))
+
+
+def career_metrics(tables):
+    """Metrics for one career from its archived season tables (SeasonHistory.tables())."""
+    years = np.unique(tables["year"])
+    _, titles = np.unique(tables["team"][tables["pos"] == 1], return_counts=True)
+    shares = titles / len(years)
+    last = tables[tables["year"] == years[-1]]
+    first_avg = tables["avg_rating"][tables["year"] == years[0]].mean()
+    return {
+        "title_share": float(shares.max()),
+        "title_hhi": float((shares ** 2).sum()),
+        "budget_gini": gini(last["budget"]),
+        "rating_drift": float((last["avg_rating"].mean() - first_avg) / max(1, len(years) - 1)),
+    }
+
+
+def play(task):
+    """Worker: one seeded career with `overrides` applied; returns (point, seed, metrics)."""
+    point, overrides, seed, seasons, options = task
+    for name, value in overrides:
+        module, attr = resolve(name)
+        setattr(importlib.import_module(module), attr, value)
+    set_verbosity("silent")
+    interactive_season.run_once(seed, seasons, **options)
+    tables = np.array(SeasonHistory(os.path.dirname(DEFAULT_SAVE_PATH)).tables())
+    return point, seed, career_metrics(tables)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0],
+                                 formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__)
+    ap.add_argument("--param", type=parse_param, action="append", default=[],
+                    help="name=v1,v2,... (repeatable); the grid is every combination")
+    ap.add_argument("--seeds", type=int, default=8, help="careers per grid point")
+    ap.add_argument("--seed", type=int, default=1234, help="first seed; careers use seed, seed+1, ...")
+    ap.add_argument("--seasons", type=int, default=5, help="seasons per career")
+    ap.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    ap.add_argument("--no-transfers", action="store_true",
+                    help="close every preseason with Continue (much faster, skips the AI window)")
+    ap.add_argument("--list", action="store_true", help="list parameter names with current values and exit")
+    ap.add_argument("--json", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for name in PARAMS:
+            module, attr = resolve(name)
+            print(f"{name:<24} {PARAMS[name]:<36} {getattr(importlib.import_module(module), attr)!r}")
+        return None
+
+    names = [name for name, _ in args.param]
+    grid = list(itertools.product(*(values for _, values in args.param)))
+    options = {"max_menu_actions": 0, "close_with": 5 if args.no_transfers else 4}
+    tasks = [(point, list(zip(names, values)), args.seed + k, args.seasons, options)
+             for point, values in enumerate(grid) for k in range(args.seeds)]
+
+    start = time.perf_counter()
+    per_point = [[] for _ in grid]
+    # spawn: every worker imports the game afresh, with its own save directory
+    with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+        for done, (point, _, metrics) in enumerate(pool.imap_unordered(play, tasks), start=1):
+            per_point[point].append(metrics)
+            print(f"\r{done}/{len(tasks)} careers", end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    rows = []
+    for values, runs in zip(grid, per_point):
+        row = {"params": dict(zip(names, values)), "careers": len(runs)}
+        row.update({m: round(statistics.fmean(r[m] for r in runs), 4) for m in METRICS})
+        rows.append(row)
+
+    widths = [max(len(n), *(len(repr(v[i])) for v in grid)) for i, n in enumerate(names)]
+    print("  ".join(n.ljust(w) for n, w in zip(names, widths)) + "".join(f"{m:>14}" for m in METRICS))
+    for values, row in zip(grid, rows):
+        print("  ".join(repr(v).ljust(w) for v, w in zip(values, widths))
+              + "".join(f"{row[m]:>14.3f}" for m in METRICS))
+    print(f"\n{len(tasks)} careers of {args.seasons} seasons in {elapsed:.1f} s on {args.workers} workers")
+
+    report = {"seeds": args.seeds, "first_seed": args.seed, "seasons": args.seasons,
+              "transfers": not args.no_transfers, "results": rows}
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
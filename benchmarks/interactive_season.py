@@ -0,0 +1,94 @@
+"""
+End-to-end benchmark of the interactive game: main.main() driven by a seeded
+AutoManager policy through prompts.set_input_provider, with a seeded game RNG.
+Each run plays the same preseason menus, transfers, poaches and seasons, so wall
+time is comparable across commits. Runs are checked to be identical.
+
+    python3 benchmarks/interactive_season.py --seasons 3 --runs 3 [--json out.json]
+"""
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Always a throwaway save location: runs start fresh and never touch a real career
+_save_dir = tempfile.mkdtemp(prefix="mlsm-bench-")
+atexit.register(shutil.rmtree, _save_dir, ignore_errors=True)
+os.environ["MLSM_SAVE"] = os.path.join(_save_dir, "career.mlsm")
+
+import warnings  # noqa: E402
+warnings.filterwarnings("ignore")
+
+import main as game  # noqa: E402
+from saveGame import DEFAULT_SAVE_PATH  # noqa: E402
+from prompts import set_input_provider  # noqa: E402
+from scriptedInput import AutoManager, ScriptedInput, ScriptExhausted  # noqa: E402
+from terminal import set_verbosity  # noqa: E402
+
+
+def _fresh_save_dir():
+    folder = os.path.dirname(DEFAULT_SAVE_PATH)
+    for name in os.listdir(folder):
+        os.remove(os.path.join(folder, name))
+
+
+def run_once(seed, seasons, **policy_options):
+    _fresh_save_dir()
+    transcript = hashlib.sha256()
+    policy = AutoManager(seed=seed, seasons=seasons, **policy_options)
+
+    def recorded(msg):
+        answer = policy(msg)
+        transcript.update(f"{msg}\0{answer}\n".encode())
+        return answer
+
+    driver = ScriptedInput(policy=recorded)
+    set_input_provider(driver)
+    start = time.perf_counter()
+    try:
+        game.main(seed=seed)
+    except ScriptExhausted:
+        pass
+    finally:
+        set_input_provider(None)
+    return time.perf_counter() - start, driver.prompts, transcript.hexdigest()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--seasons", type=int, default=3)
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("--verbosity", default="silent")
+    ap.add_argument("--json", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    set_verbosity(args.verbosity)
+    runs = [run_once(args.seed, args.seasons) for _ in range(args.runs)]
+    times = sorted(t for t, _, _ in runs)
+    result = {
+        "seed": args.seed,
+        "seasons": args.seasons,
+        "prompts": runs[0][1],
+        "deterministic": len({digest for _, _, digest in runs}) == 1,
+        "seconds_min": round(times[0], 4),
+        "seconds_median": round(times[len(times) // 2], 4),
+        "seconds_per_season": round(times[len(times) // 2] / args.seasons, 4),
+    }
+    set_verbosity("normal")
+    print(json.dumps(result, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+League-size scaling benchmark: one headless season at 12, 50, 200 and 1000 clubs.
+
+Each size runs in its own process (so peak RSS is per size) with phase timing on, and
+the season is driven through the Transfer Hub so the AI window runs. For every phase it
+reports the time at each size and the growth exponent between consecutive sizes
+(time ~ clubs^k): ~1 for per-club work, ~2 for the round-robin match loop. Phases that
+grow faster than expected are the accidentally quadratic ones. The 1000-club season
+takes several minutes on its own; --sizes 12,50,200 is the quick check.
+
+    python3 benchmarks/league_scaling.py [--sizes 12,50,200] [--json out.json]
+"""
+import argparse
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+
+def run_child(size, seed):
+    """Play one season in this process and return its measurements."""
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, HERE)
+    os.chdir(ROOT)
+    os.environ["MLSM_LEAGUE_SIZE"] = str(size)
+    import warnings
+    warnings.filterwarnings("ignore")
+    import interactive_season
+    from instrumentation import timer
+    from terminal import set_verbosity
+
+    set_verbosity("silent")
+    timer.configure(enabled=True)
+    start = time.perf_counter()
+    interactive_season.run_once(seed, 1, max_menu_actions=0, close_with=4)
+    total = time.perf_counter() - start
+    season, wall, rows = timer.history[0]
+    return {
+        "clubs": size,
+        "fixtures": size * (size - 1),
+        "seconds_total": round(total, 3),
+        "seconds_season": round(wall, 3),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "phases": {name: round(secs, 4) for name, depth, n, secs in rows},
+    }
+
+
+def measure(size, seed, timeout):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", str(size), "--seed", str(seed)]
+    out = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, cwd=ROOT)
+    if out.returncode != 0:
+        raise RuntimeError(f"{size} clubs failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def growth(results):
+    """Phase -> list of exponents k between consecutive sizes, where time ~ clubs^k."""
+    out = {}
+    for a, b in zip(results, results[1:]):
+        ratio = math.log(b["clubs"] / a["clubs"])
+        for name, tb in b["phases"].items():
+            ta = a["phases"].get(name)
+            if ta and tb and ta > 1e-4:
+                out.setdefault(name, []).append(round(math.log(tb / ta) / ratio, 2))
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", default="12,50,200,1000")
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("--timeout", type=float, default=None, help="seconds allowed per size")
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.seed)))
+        return None
+
+    results = []
+    print(f"{'clubs':>6} {'fixtures':>9} {'season s':>10} {'max RSS MB':>11}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        r = measure(size, args.seed, args.timeout)
+        results.append(r)
+        print(f"{r['clubs']:>6} {r['fixtures']:>9} {r['seconds_season']:>10.2f} {r['max_rss_mb']:>11.1f}", flush=True)
+
+    exponents = growth(results)
+    if exponents:
+        print(f"\n{'phase':<28} " + " ".join(f"{r['clubs']:>9}" for r in results) + "   growth k")
+        for name in results[-1]["phases"]:
+            times = " ".join(f"{r['phases'].get(name, 0):>9.3f}" for r in results)
+            print(f"{name:<28} {times}   {exponents.get(name, [])}")
+
+    report = {"seed": args.seed, "results": results, "growth": exponents}
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Long-career memory growth check: plays a seeded headless career with tracemalloc
+snapshots at every season boundary, then fails if traced memory grew by more than
+--max-growth-mb between the end of the warm-up seasons and the last season.
+
+    python3 benchmarks/memory_growth.py --seasons 100 [--no-transfers] [--json out.json]
+"""
+import argparse
+import json
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, HERE)
+os.chdir(ROOT)
+
+import warnings  # noqa: E402
+warnings.filterwarnings("ignore")
+
+import interactive_season  # noqa: E402  (also points MLSM_SAVE at a temp dir)
+from instrumentation import memory  # noqa: E402
+from terminal import set_verbosity  # noqa: E402
+
+MB = 2 ** 20
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--seasons", type=int, default=100)
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("--warmup", type=int, default=3, help="seasons before the growth baseline")
+    ap.add_argument("--max-growth-mb", type=float, default=8.0)
+    ap.add_argument("--top", type=int, default=10, help="growth sites to report")
+    ap.add_argument("--no-transfers", action="store_true",
+                    help="close every preseason with Continue (much faster, skips the AI window)")
+    ap.add_argument("--verbosity", default="silent", help="'summary' prints each boundary's report")
+    ap.add_argument("--json", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    set_verbosity(args.verbosity)
+    memory.configure(top=args.top)
+    options = {"max_menu_actions": 0, "close_with": 5} if args.no_transfers else {}
+    elapsed, _, _ = interactive_season.run_once(args.seed, args.seasons, **options)
+    set_verbosity("normal")
+
+    history = memory.history
+    if len(history) <= args.warmup:
+        sys.exit(f"only {len(history)} season boundaries recorded; need more than --warmup {args.warmup}")
+    base, last = history[args.warmup - 1] if args.warmup else history[0], history[-1]
+    growth = (last["traced_bytes"] - base["traced_bytes"]) / MB
+
+    print(f"{'season':>6} {'traced MB':>10} {'peak MB':>8} {'rostered':>9} {'alive':>7}")
+    for r in history:
+        print(f"{r['season']:>6} {r['traced_bytes'] / MB:>10.2f} {r['peak_bytes'] / MB:>8.2f} "
+              f"{r['rostered_players']:>9} {r['live_players']:>7}")
+    print(f"\nTop growth sites since {history[0]['season']}:")
+    for where, size, count in last["top_growth"]:
+        print(f"  {size / 1024:>+10,.1f} KB {count:>+8} blocks  {where}")
+    print(f"\nGrowth {base['season']} -> {last['season']}: {growth:+.2f} MB "
+          f"(limit {args.max_growth_mb} MB) in {elapsed:.1f} s")
+
+    result = {
+        "seed": args.seed,
+        "seasons": len(history),
+        "growth_mb": round(growth, 3),
+        "max_growth_mb": args.max_growth_mb,
+        "history": history,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    if growth > args.max_growth_mb:
+        sys.exit(1)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Session start benchmark: cold `python3 main.py` vs a fork of the pre-warmed sessionServer.
+
+For each mode it opens a pseudo-terminal, starts a session, and measures the time until
+the first "Choice:" prompt is on screen, then samples the session process's memory:
+RSS, PSS (RSS with shared pages split between sharers) and private (unshared) pages.
+Private memory is what each extra concurrent player actually costs.
+
+    python3 benchmarks/session_start.py --sessions 5 [--json out.json]
+"""
+import argparse
+import json
+import os
+import pty
+import select
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT = b"Choice:"
+
+
+def _wait_for(fd, needle, timeout):
+    seen = b""
+    deadline = time.monotonic() + timeout
+    while needle not in seen:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise TimeoutError(f"no {needle!r} after {timeout}s; got {seen[-200:]!r}")
+        ready, _, _ = select.select([fd], [], [], left)
+        if ready:
+            try:
+                seen += os.read(fd, 65536)
+            except OSError:
+                break
+
+
+def memory_kb(pid):
+    """{'rss', 'pss', 'private'} in kB from /proc (Linux)."""
+    out = {"rss": 0, "pss": 0, "private": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                kb = int(rest.split()[0]) if rest.strip() and rest.split()[0].isdigit() else 0
+                if key == "Rss":
+                    out["rss"] = kb
+                elif key == "Pss":
+                    out["pss"] = kb
+                elif key in ("Private_Clean", "Private_Dirty"):
+                    out["private"] += kb
+    except OSError:
+        pass
+    return out
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(x) for x in f.read().split()]
+    except OSError:
+        return []
+
+
+def _session(cmd, env, find_pid=None, timeout=60.0):
+    master, slave = pty.openpty()
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdin=slave, stdout=slave, stderr=slave,
+                            cwd=ROOT, env=env, start_new_session=True)
+    os.close(slave)
+    pid = proc.pid
+    try:
+        _wait_for(master, PROMPT, timeout)
+        elapsed = time.perf_counter() - start
+        if find_pid:
+            pid = find_pid()
+        mem = memory_kb(pid)
+    finally:
+        for target in {proc.pid, pid}:
+            try:
+                os.kill(target, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        proc.wait(timeout=10)
+        os.close(master)
+    return elapsed, mem
+
+
+def bench_cold(n, env):
+    cmd = [sys.executable, os.path.join(ROOT, "main.py")]
+    return [_session(cmd, env) for _ in range(n)]
+
+
+def bench_prefork(n, env):
+    server = subprocess.Popen([sys.executable, os.path.join(ROOT, "sessionServer.py")],
+                              cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        server.stdout.readline()  # "ready" banner once the model is warm
+        cmd = [sys.executable, "-S", os.path.join(ROOT, "sessionClient.py")]
+        results = []
+        for _ in range(n):
+            before = set(_children(server.pid))
+
+            def newest_child():
+                fresh = [p for p in _children(server.pid) if p not in before]
+                return fresh[-1] if fresh else server.pid
+
+            results.append(_session(cmd, env, newest_child))
+            time.sleep(0.05)
+        return results, memory_kb(server.pid)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def summarize(runs):
+    times = [t for t, _ in runs]
+    return {
+        "start_ms_median": round(statistics.median(times) * 1000, 1),
+        "start_ms_max": round(max(times) * 1000, 1),
+        "rss_kb_median": statistics.median(m["rss"] for _, m in runs),
+        "pss_kb_median": statistics.median(m["pss"] for _, m in runs),
+        "private_kb_median": statistics.median(m["private"] for _, m in runs),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=5)
+    ap.add_argument("--json", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    tmp = tempfile.mkdtemp(prefix="mlsm-bench-")
+    env = dict(os.environ, MLSM_SAVE=os.path.join(tmp, "none.mlsm"),
+               MLSM_SOCKET=os.path.join(tmp, "mlsm.sock"), PYTHONWARNINGS="ignore")
+
+    cold = summarize(bench_cold(args.sessions, env))
+    runs, server_mem = bench_prefork(args.sessions, env)
+    prefork = summarize(runs)
+    prefork["server_rss_kb"] = server_mem["rss"]
+
+    result = {"sessions": args.sessions, "cold": cold, "prefork": prefork}
+    print(f"{'mode':<8} {'start ms (med/max)':>20} {'RSS MB':>8} {'PSS MB':>8} {'private MB':>11}")
+    for mode, r in (("cold", cold), ("prefork", prefork)):
+        print(f"{mode:<8} {r['start_ms_median']:>10.1f} /{r['start_ms_max']:>8.1f} "
+              f"{r['rss_kb_median'] / 1024:>8.1f} {r['pss_kb_median'] / 1024:>8.1f} "
+              f"{r['private_kb_median'] / 1024:>11.1f}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    return result
+
+
+if __name__ == "__main__":
+    main()
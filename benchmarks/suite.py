@@ -0,0 +1,456 @@
+"""
+Micro and macro benchmark suite with fixed seeds and synthetic leagues.
+
+Covers pricing (est_cost_eur single/bulk), organize_squad for every formation at several
+squad sizes, simulate_match, build_home_and_away + assign_dates, ai_transfers against
+free-agent pools of 75 / 1k / 10k, make_free_agent_pool, league forking for lookahead
+(against a deepcopy of the league), ledger appends (time and memory, against a list of
+dicts) and queries, budget projection, the price-label store (batched appends, and the
+training set from its aggregate against re-parsing the CSV) and a complete headless season.
+Every case is rebuilt from the same seed on each repeat, so numbers are comparable
+across commits on one machine. Results go to JSON; pass --baseline to compare against
+a run stored on the same host (timings from another machine say nothing about a
+regression, so no baseline is committed: record one before the change, compare after).
+Cases marked slow (ai_transfers on the 1k / 10k pools price every agent through the
+model and take minutes) only run with --slow.
+
+    python3 benchmarks/suite.py --json before.json [--slow]
+    python3 benchmarks/suite.py --baseline before.json --tolerance 0.25 [--only organize]
+"""
+import argparse
+import copy
+import functools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, HERE)
+os.chdir(ROOT)  # playerCost loads model02.pkl relative to the working directory
+
+import warnings  # noqa: E402
+warnings.filterwarnings("ignore")
+
+import interactive_season  # noqa: E402  (also points MLSM_SAVE at a temp dir)
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from constants import FORMATIONS, INIT_YEAR, TEAMS_INIT  # noqa: E402
+from economy import forecast_positions, project_budgets  # noqa: E402
+from leagueFork import LeagueFork  # noqa: E402
+from ledger import KINDS, Ledger  # noqa: E402
+from matchEngineSchedules import (  # noqa: E402
+    assign_dates, build_home_and_away, round_robin_template, schedule_season, simulate_batch, simulate_match, simulate_matchday,
+)
+from models.team import Team, generate_league_squads  # noqa: E402
+from organizeSquad import organize_squad  # noqa: E402
+from playerCost import FEATURES, est_cost_eur, model  # noqa: E402
+from priceLabels import LabelStore  # noqa: E402
+from rngStreams import streams  # noqa: E402
+from terminal import set_verbosity  # noqa: E402
+from transfersAI import ai_transfers, make_free_agent_pool  # noqa: E402
+from utils import season_dates  # noqa: E402
+
+SEED = 2025
+BENCHMARKS = {}
+_scratch = None  # TemporaryDirectory for files cases write, one per run (see main)
+
+
+def benchmark(name, repeat=5, number=1, slow=False, memory=False):
+    """
+    Register `fn(seed) -> (callable, units)`. fn is untimed setup, run once per repeat;
+    the returned callable is what gets timed and `units` is what it processes. With
+    memory=True one extra call runs under tracemalloc to report its peak allocation.
+    """
+    def register(fn):
+        BENCHMARKS[name] = (fn, repeat, number, slow, memory)
+        return fn
+    return register
+
+
+@functools.lru_cache(maxsize=None)
+def _league(seed):
+    streams.seed(seed)
+    teams = [Team(m) for m in TEAMS_INIT]
+    generate_league_squads(teams)
+    return teams
+
+
+@functools.lru_cache(maxsize=None)
+def _pool(num, seed):
+    streams.seed(seed)
+    return make_free_agent_pool(num)
+
+
+def league(seed=SEED):
+    """Fresh copy of the seeded 12-club league."""
+    return copy.deepcopy(_league(seed))
+
+
+def pool(num, seed=SEED):
+    """Fresh copy of a seeded free-agent pool of `num` generated players (before culling)."""
+    return copy.deepcopy(_pool(num, seed))
+
+
+# ---- pricing ----
+@benchmark("est_cost_eur.single", repeat=5)
+def _price_single(seed):
+    rng = random.Random(seed)
+    pairs = [(rng.randint(18, 35), rng.randint(70, 92)) for _ in range(50)]
+    return lambda: [est_cost_eur(a, r) for a, r in pairs], len(pairs)
+
+
+@benchmark("est_cost_eur.bulk_1k", repeat=5)
+def _price_bulk(seed):
+    rng = random.Random(seed)
+    X = pd.DataFrame([(rng.randint(18, 35), rng.randint(70, 92)) for _ in range(1000)], columns=FEATURES)
+    return lambda: model.predict(X), len(X)
+
+
+# ---- squad organisation ----
+def _organize_case(formation, size):
+    @benchmark(f"organize_squad.{formation}.{size}", repeat=5)
+    def case(seed):
+        team = league(seed)[0]
+        team.formation = formation
+        extra = size - len(team.all_players())
+        if extra > 0:
+            team.reserves += pool(extra + 10, seed)[:extra]
+        return lambda: [organize_squad(team) for _ in range(50)], 50
+
+
+for _formation in FORMATIONS:
+    for _size in (21, 32, 64):
+        _organize_case(_formation, _size)
+
+
+# ---- match day and schedule ----
+@benchmark("simulate_match", repeat=5)
+def _simulate(seed):
+    teams = league(seed)
+    fixtures = build_home_and_away(teams)
+    day = season_dates(INIT_YEAR)[3]
+
+    def run():
+        streams.seed(seed)
+        for A, B, venue in fixtures:
+            simulate_match(A, B, venue, day)
+    return run, len(fixtures)
+
+
+@benchmark("simulate_matchday", repeat=5)
+def _simulate_matchday(seed):
+    teams = league(seed)
+    matchdays = schedule_season(teams, *season_dates(INIT_YEAR)[3:5])
+
+    def run():
+        rng = np.random.default_rng(seed)
+        for when, fixtures in matchdays:
+            simulate_matchday(fixtures, when, rng)
+    return run, sum(len(f) for _, f in matchdays)
+
+
+@benchmark("simulate_matchday.xi", repeat=5)
+def _simulate_matchday_xi(seed):
+    teams = league(seed)
+    matchdays = schedule_season(teams, *season_dates(INIT_YEAR)[3:5])
+
+    def run():
+        rng = np.random.default_rng(seed)
+        for when, fixtures in matchdays:
+            simulate_matchday(fixtures, when, rng, model="xi")
+    return run, sum(len(f) for _, f in matchdays)
+
+
+@benchmark("simulate_batch.1m", repeat=5)
+def _simulate_batch(seed):
+    rng = np.random.default_rng(seed)
+    n = 1_000_000
+    rA, rB, home = rng.uniform(78, 88, n), rng.uniform(78, 88, n), rng.choice([-1, 1], n)
+    return lambda: simulate_batch(rA, rB, home, np.random.default_rng(seed)), n
+
+
+@benchmark("schedule_season", repeat=5)
+def _schedule_season(seed):
+    teams = league(seed)
+    start, end = season_dates(INIT_YEAR)[3:5]
+
+    def run():
+        round_robin_template.cache_clear()
+        schedule_season(teams, start, end)
+    return run, 1
+
+
+@benchmark("build_home_and_away+assign_dates", repeat=5)
+def _schedule(seed):
+    teams = league(seed)
+    start, end = season_dates(INIT_YEAR)[3:5]
+    return lambda: assign_dates(build_home_and_away(teams), start, end), 1
+
+
+# ---- transfers ----
+def _ai_transfers_case(size, repeat, slow):
+    @benchmark(f"ai_transfers.pool_{size}", repeat=repeat, slow=slow)
+    def case(seed):
+        # Fresh copies each repeat: ai_transfers mutates budgets, squads and the pool
+        teams, agents = league(seed), pool(size, seed)
+
+        def run():
+            streams.seed(seed)
+            for t in teams:
+                ai_transfers(t, agents)
+        return run, len(teams)
+
+
+for _size, _repeat, _slow in ((75, 5, False), (1000, 1, True), (10000, 1, True)):
+    _ai_transfers_case(_size, _repeat, _slow)
+
+
+@benchmark("make_free_agent_pool", repeat=5)
+def _make_pool(seed):
+    def run():
+        streams.seed(seed)
+        make_free_agent_pool(75)
+    return run, 75
+
+
+# ---- lookahead ----
+@benchmark("league_fork.fork", repeat=5)
+def _fork(seed):
+    base = LeagueFork.snapshot(league(seed))
+    return lambda: [base.fork() for _ in range(1000)], 1000
+
+
+@benchmark("league_fork.deepcopy", repeat=5)
+def _deepcopy(seed):
+    teams = league(seed)
+    return lambda: copy.deepcopy(teams), 1
+
+
+@benchmark("league_fork.simulate.1k", repeat=5)
+def _fork_simulate(seed):
+    base = LeagueFork.snapshot(league(seed))
+    return lambda: base.simulate(1000, np.random.default_rng(seed)), 1000
+
+
+# ---- ledger ----
+def _ledger_events(seed, n):
+    rng = np.random.default_rng(seed)
+    teams = league(seed)
+    kinds = [KINDS[k] for k in rng.integers(0, len(KINDS), n).tolist()]
+    clubs = [teams[i] for i in rng.integers(0, len(teams), n).tolist()]
+    return list(zip(clubs, rng.integers(-200, 200, n).tolist(), kinds))
+
+
+@benchmark("ledger.append.100k", repeat=5, memory=True)
+def _ledger_append(seed):
+    events = _ledger_events(seed, 100_000)
+
+    def run():
+        book = Ledger()
+        for team, amount, kind in events:
+            book.record(team, amount, kind)
+        return book
+    return run, len(events)
+
+
+@benchmark("ledger.append.dicts.100k", repeat=5, memory=True)
+def _ledger_dicts(seed):
+    # What per-event dict logging would cost, for comparison
+    events = _ledger_events(seed, 100_000)
+
+    def run():
+        return [{"team": team.name, "season": 2025, "kind": kind, "amount": amount, "counterparty": None}
+                for team, amount, kind in events]
+    return run, len(events)
+
+
+@benchmark("ledger.net_spend.1m", repeat=5)
+def _ledger_query(seed):
+    rng = np.random.default_rng(seed)
+    n = 1_000_000
+    book = Ledger()
+    book.names = [f"club {i}" for i in range(200)]
+    book._extend(np.rec.fromarrays(
+        [rng.integers(0, 200, n), rng.integers(2025, 2125, n), rng.integers(0, len(KINDS), n),
+         rng.integers(-200, 200, n), np.full(n, -1)], names=list(Ledger().rows().dtype.names)))
+    return lambda: book.net_spend(), n
+
+
+@benchmark("project_budgets.3x2k", repeat=5)
+def _project(seed):
+    teams = league(seed)
+    positions = forecast_positions(teams, 3, 2000, rng=np.random.default_rng(seed))
+    return lambda: project_budgets(teams, positions, rng=np.random.default_rng(seed)), positions[..., 0].size
+
+
+# ---- price labels ----
+def _labels_csv():
+    """A fresh CSV path inside this run's scratch folder."""
+    global _scratch
+    if _scratch is None:
+        _scratch = tempfile.TemporaryDirectory(prefix="mlsm-labels-")
+    return os.path.join(tempfile.mkdtemp(dir=_scratch.name), "price_labels.csv")
+
+
+def _labels(seed, n):
+    rng = np.random.default_rng(seed)
+    return list(zip(rng.integers(69, 96, n).tolist(), rng.integers(16, 35, n).tolist(),
+                    rng.integers(1, 251, n).tolist()))
+
+
+@functools.lru_cache(maxsize=None)
+def _label_store(seed, n):
+    store = LabelStore(_labels_csv(), flush_every=n)
+    for rating, age, price in _labels(seed, n):
+        store.add("Bench FC", INIT_YEAR, rating, age, 10, price)
+    store.flush()
+    return store
+
+
+@benchmark("price_labels.add+flush.1k", repeat=5)
+def _labels_add(seed):
+    store = LabelStore(_labels_csv())
+    labels = _labels(seed, 1000)
+
+    def run():
+        for rating, age, price in labels:
+            store.add("Bench FC", INIT_YEAR, rating, age, 10, price)
+        store.flush()
+    return run, len(labels)
+
+
+@benchmark("price_labels.training_set.100k", repeat=5)
+def _labels_training(seed):
+    store = _label_store(seed, 100_000)
+    return lambda: store.training_set(), 100_000
+
+
+@benchmark("price_labels.csv_groupby.100k", repeat=5)
+def _labels_reparse(seed):
+    # The aggregate's alternative: re-read every labelled row
+    store = _label_store(seed, 100_000)
+    return lambda: pd.read_csv(store.csv_path).groupby(["age", "rating"])["user_price_M"].agg(["count", "mean", "var"]), 100_000
+
+
+# ---- whole game ----
+@benchmark("headless_season", repeat=3)
+def _season(seed):
+    # Straight to the Transfer Hub every preseason: "Continue" would skip the AI window
+    return lambda: interactive_season.run_once(seed, 1, max_menu_actions=0, close_with=4), 1
+
+
+def run_case(name, seed, repeat=None):
+    fn, default_repeat, number, _, memory = BENCHMARKS[name]
+    repeat = repeat or default_repeat
+    times, units = [], 1
+    for _ in range(repeat):
+        call, units = fn(seed)
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        times.append((time.perf_counter() - start) / number)
+    median = statistics.median(times)
+    result = {
+        "repeat": repeat,
+        "units": units,
+        "seconds_min": round(min(times), 6),
+        "seconds_median": round(median, 6),
+        "us_per_unit": round(median / units * 1e6, 2),
+    }
+    if memory:
+        call, units = fn(seed)
+        tracemalloc.start()
+        kept = call()  # hold the result so what it keeps alive counts
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del kept
+        result["bytes_per_unit"] = round(result["peak_bytes"] / units, 1)
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """Rows (name, baseline s, current s, ratio, regressed) for cases present in both."""
+    rows = []
+    for name, cur in results.items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            continue
+        ratio = cur["seconds_median"] / old["seconds_median"] if old["seconds_median"] else float("inf")
+        rows.append((name, old["seconds_median"], cur["seconds_median"], ratio, ratio > 1 + tolerance))
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--seed", type=int, default=SEED)
+    ap.add_argument("--only", action="append", default=[], help="run cases whose name contains this (repeatable)")
+    ap.add_argument("--slow", action="store_true", help="include the slow cases")
+    ap.add_argument("--repeat", type=int, help="override every case's repeat count")
+    ap.add_argument("--list", action="store_true", help="list case names and exit")
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--baseline", help="compare against a previous --json file")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = +25%%)")
+    args = ap.parse_args(argv)
+
+    names = [n for n, (_, _, _, slow, _) in BENCHMARKS.items()
+             if (args.slow or not slow) and (not args.only or any(o in n for o in args.only))]
+    if args.list:
+        print("\n".join(names))
+        return None
+
+    global _scratch
+    set_verbosity("silent")
+    results = {}
+    print(f"{'case':<40} {'median ms':>11} {'min ms':>10} {'us/unit':>10}")
+    try:
+        for name in names:
+            r = results[name] = run_case(name, args.seed, args.repeat)
+            memory = f"  {r['bytes_per_unit']:,.1f} B/unit peak" if "peak_bytes" in r else ""
+            print(f"{name:<40} {r['seconds_median'] * 1000:>11.2f} {r['seconds_min'] * 1000:>10.2f} {r['us_per_unit']:>10.1f}"
+                  f"{memory}", flush=True)
+    finally:
+        set_verbosity("normal")
+        _label_store.cache_clear()  # its stores live in the scratch folder
+        if _scratch is not None:
+            _scratch.cleanup()
+            _scratch = None
+
+    report = {
+        "seed": args.seed,
+        "slow": args.slow,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "host": platform.node(),
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("host") != platform.node():
+            print(f"\nwarning: baseline recorded on {baseline.get('host') or 'an unknown host'}, not {platform.node()}; "
+                  "timings are only comparable on the same machine", file=sys.stderr)
+        rows = compare(results, baseline, args.tolerance)
+        print(f"\n{'case':<40} {'base ms':>10} {'now ms':>10} {'ratio':>7}")
+        for name, old, cur, ratio, bad in rows:
+            print(f"{name:<40} {old * 1000:>10.2f} {cur * 1000:>10.2f} {ratio:>7.2f}{'  REGRESSED' if bad else ''}")
+        regressed = [r[0] for r in rows if r[4]]
+        if regressed:
+            print(f"\n{len(regressed)} case(s) slower than baseline by more than {args.tolerance:.0%}")
+            sys.exit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
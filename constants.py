@@ -28,6 +28,29 @@ ORIGINS = {
     "Atletico Madrid": ["Spain","Belgium","Argentina","Netherlands","Brazil"],
 }
 
+# Home cities for generated clubs beyond TEAMS_INIT (MLSM_LEAGUE_SIZE / --league-size)
+CLUB_CITIES = {
+    "France": ["Lyon","Marseille","Nice","Bordeaux","Nantes","Rennes","Lille","Toulouse"],
+    "Morocco": ["Casablanca","Rabat","Fes","Tangier"],
+    "Argentina": ["Buenos Aires","Rosario","Cordoba","La Plata"],
+    "Belgium": ["Brussels","Bruges","Ghent","Antwerp","Liege"],
+    "Nigeria": ["Lagos","Enugu","Kano","Ibadan"],
+    "England": ["Manchester","Leeds","Newcastle","Birmingham","Sheffield","Bristol","Leicester","Everton"],
+    "Brazil": ["Sao Paulo","Rio","Santos","Porto Alegre","Recife"],
+    "Colombia": ["Medellin","Bogota","Cali"],
+    "Uruguay": ["Montevideo","Salto"],
+    "Spain": ["Sevilla","Valencia","Bilbao","Villarreal","Malaga","Zaragoza","Vigo","Getafe"],
+    "United States": ["Seattle","Atlanta","Austin","Columbus"],
+    "Netherlands": ["Amsterdam","Eindhoven","Rotterdam","Utrecht","Alkmaar"],
+    "Chile": ["Santiago","Valparaiso"],
+    "Germany": ["Dortmund","Leipzig","Leverkusen","Frankfurt","Stuttgart","Bremen","Hamburg","Cologne"],
+    "Japan": ["Tokyo","Osaka","Kashima","Yokohama"],
+    "Portugal": ["Lisbon","Braga","Guimaraes","Coimbra"],
+    "Italy": ["Turin","Rome","Florence","Bergamo","Genoa","Bologna","Verona","Udine"],
+    "Mexico": ["Monterrey","Guadalajara","Puebla","Toluca"],
+}
+CLUB_SUFFIXES = ["FC","United","City","Athletic","Sporting","Rovers","Olympic","Dynamo"]
+
 FORMATIONS = {
     "4-3-3": {"GK":1,"CB":2,"LB":1,"RB":1,"CM":3,"LW":1,"RW":1,"ST":1},
     "4-4-2": {"GK":1,"CB":2,"LB":1,"RB":1,"CDM":1,"CAM":1,"LW":1,"RW":1,"ST":2},
@@ -1,24 +1,43 @@
-import random
+import numpy as np
+
+from leagueFork import LeagueFork
+from rngStreams import streams
+from terminal import SUMMARY, echo, echo_lines, enabled
+
+# Yearly budget carry-over and its floor in €M
+BUDGET_DECAY = 0.97
+BUDGET_FLOOR = 50
+
+# End-of-season payouts in €M
+PODIUM_REWARDS = (70, 60, 50)
+OBJECTIVE_BONUS = 10
+LOTTERY_WINNERS = 2
+LOTTERY_BONUS = 50
+LOTTERY_JACKPOT = 75
+LOTTERY_JACKPOT_CHANCE = 0.25
+DYNASTY_INVESTMENT = 200
+
+
 def next_season_base_budget(t):
-    return max(50, int(t.budget * 0.97))
+    return max(BUDGET_FLOOR, int(t.budget * BUDGET_DECAY))
 
 
 def process_rewards_penalties(table):
+    rng = streams.random("economy")
     if not table:
-        print("\n=== NEXT SEASON BUDGETS ===\n(no teams registered)")
+        echo("\n=== NEXT SEASON BUDGETS ===\n(no teams registered)", level=SUMMARY)
         return
 
     events = []
 
     # Rewards for top 3
-    if len(table) >= 1: table[0].receive(70)
-    if len(table) >= 2: table[1].receive(60)
-    if len(table) >= 3: table[2].receive(50)
+    for t, reward in zip(table, PODIUM_REWARDS):
+        t.receive(reward, "prize")
 
     # Objective bonus
     for pos, t in enumerate(table, start=1):
         if pos <= getattr(t, "objective", 0):
-            t.receive(10)
+            t.receive(OBJECTIVE_BONUS, "objective_bonus")
 
     # Track dynasty streaks (3+ consecutive top-3 finishes)
     dynasty_exists = False
@@ -31,10 +50,10 @@ def process_rewards_penalties(table):
     # Randomly boost two teams outside the top 3 to avoid stagnation
     non_podium = [t for pos, t in enumerate(table, start=1) if pos > 3]
     if non_podium:
-        bonus_recipients = random.sample(non_podium, k=min(2, len(non_podium)))
+        bonus_recipients = rng.sample(non_podium, k=min(LOTTERY_WINNERS, len(non_podium)))
         for beneficiary in bonus_recipients:
-            bonus = 75 if random.random() < 0.25 else 50
-            beneficiary.receive(bonus)
+            bonus = LOTTERY_JACKPOT if rng.random() < LOTTERY_JACKPOT_CHANCE else LOTTERY_BONUS
+            beneficiary.receive(bonus, "lottery")
             events.append(("Lottery Bonus", beneficiary.name, bonus))
 
 
@@ -43,9 +62,12 @@ def process_rewards_penalties(table):
         non_top3 = [t for pos, t in enumerate(table, start=1) if pos > 3]
         lowest_eligible = sorted(non_top3, key=lambda team: team.avg_rating())[:2]
         if lowest_eligible:
-            beneficiary = random.choice(lowest_eligible)
-            beneficiary.receive(200)
-            events.append(("International Investment", beneficiary.name, 200))
+            beneficiary = rng.choice(lowest_eligible)
+            beneficiary.receive(DYNASTY_INVESTMENT, "investment")
+            events.append(("International Investment", beneficiary.name, DYNASTY_INVESTMENT))
+
+    if not enabled(SUMMARY):
+        return
 
     sorted_table = sorted(table, key=lambda team: team.budget, reverse=True)
     name_width = max(len(team.name) for team in sorted_table)
@@ -53,12 +75,92 @@ def process_rewards_penalties(table):
     budget_width = max(len("Budget"), max(len(display) for display in budget_strings))
 
     if events:
-        print("\n=== FINANCIAL EVENTS ===")
-        for label, name, amount in events:
-            print(f"- {label:<24} {name:<{name_width}} +€{amount:,}M")
-
-    print("\n=== NEXT SEASON BASE BUDGETS (APPLIED) ===")
-    print(f"{'Team'.ljust(name_width)}  {'Budget'.rjust(budget_width)}")
-    print(f"{'-' * name_width}  {'-' * budget_width}")
-    for team, budget_display in zip(sorted_table, budget_strings):
-        print(f"{team.name.ljust(name_width)}  {budget_display.rjust(budget_width)}")
+        echo("\n=== FINANCIAL EVENTS ===", level=SUMMARY)
+        echo_lines((f"- {label:<24} {name:<{name_width}} +€{amount:,}M" for label, name, amount in events),
+                   level=SUMMARY)
+
+    echo("\n=== NEXT SEASON BASE BUDGETS (APPLIED) ===", level=SUMMARY)
+    echo_lines([
+        f"{'Team'.ljust(name_width)}  {'Budget'.rjust(budget_width)}",
+        f"{'-' * name_width}  {'-' * budget_width}",
+    ] + [
+        f"{team.name.ljust(name_width)}  {budget_display.rjust(budget_width)}"
+        for team, budget_display in zip(sorted_table, budget_strings)
+    ], level=SUMMARY)
+
+
+# =========================
+# BUDGET PROJECTION
+# =========================
+def forecast_positions(teams, seasons, runs=2000, season=None, rng=None):
+    """
+    Sampled finishing positions, int array (seasons, runs, clubs) in `teams` order: the
+    rest of `season` (if one is under way) and then fresh seasons, all played with
+    LeagueFork at today's club strengths.
+    """
+    rng = rng if rng is not None else streams.generator("lookahead")
+    out = np.empty((seasons, runs, len(teams)), dtype=np.int64)
+    for s in range(seasons):
+        fork = LeagueFork.snapshot(teams, season if s == 0 else None)
+        order = [fork.index[t] for t in teams]
+        out[s] = fork.simulate(runs, rng)[:, order]
+    return out
+
+
+def project_budgets(teams, positions=None, seasons=1, runs=2000, season=None, rng=None):
+    """
+    Budget distributions after each coming season's economy, as an array
+    (seasons, runs, clubs) in `teams` order. Every trajectory applies the end-of-season
+    rules of main and process_rewards_penalties to sampled finishing positions: decay
+    with floor, podium prizes, objective bonuses, the lottery outside the podium and the
+    dynasty investment, with top-3 streaks carried along. `positions` is
+    (seasons, runs, clubs) of 1-based places, e.g. from forecast_positions (the default).
+    Transfer spending and ratings changes are not modelled.
+
+        budgets = project_budgets(teams, seasons=1)
+        np.quantile(budgets[0, :, teams.index(user)], 0.1)   # what user can count on next summer
+    """
+    rng = rng if rng is not None else streams.generator("lookahead")
+    if positions is None:
+        positions = forecast_positions(teams, seasons, runs, season, rng)
+    positions = np.asarray(positions)
+    seasons, runs, n = positions.shape
+
+    budget = np.repeat(np.array([[t.budget for t in teams]], dtype=np.int64), runs, axis=0)
+    streak = np.repeat(np.array([[t.top3_streak for t in teams]], dtype=np.int64), runs, axis=0)
+    objective = np.array([t.objective for t in teams])
+    prize = np.zeros(n + 1, dtype=np.int64)
+    podium = PODIUM_REWARDS[:n]
+    prize[1:len(podium) + 1] = podium
+    by_rating = np.argsort([t.avg_rating() for t in teams], kind="stable")
+    winners = min(LOTTERY_WINNERS, max(0, n - 3))
+    rows = np.arange(runs)
+
+    out = np.empty((seasons, runs, n), dtype=np.int64)
+    for s in range(seasons):
+        pos = positions[s]
+        budget = np.maximum(BUDGET_FLOOR, np.trunc(budget * BUDGET_DECAY).astype(np.int64))
+        budget += prize[pos]
+        budget += OBJECTIVE_BONUS * (pos <= objective)
+        streak = np.where(pos <= 3, streak + 1, 0)
+        dynasty = (streak >= 3).any(axis=1)
+
+        outside = pos > 3
+        if winners:
+            # Random keys with the podium pushed last: the first `winners` are a uniform sample
+            keys = np.where(outside, rng.random((runs, n)), 2.0)
+            picked = np.argpartition(keys, winners - 1, axis=1)[:, :winners]
+            jackpot = rng.random((runs, winners)) < LOTTERY_JACKPOT_CHANCE
+            np.add.at(budget, (rows[:, None], picked), np.where(jackpot, LOTTERY_JACKPOT, LOTTERY_BONUS))
+
+        # Dynasty: one of the two lowest-rated clubs outside the podium, at random
+        eligible = outside[:, by_rating]
+        lowest = eligible & (np.cumsum(eligible, axis=1) <= 2)
+        count = lowest.sum(axis=1)
+        nth = (rng.random(runs) * count).astype(np.int64) + 1
+        pick = by_rating[np.argmax(np.cumsum(lowest, axis=1) == nth[:, None], axis=1)]
+        invest = dynasty & (count > 0)
+        budget[rows[invest], pick[invest]] += DYNASTY_INVESTMENT
+        out[s] = budget
+    return out
+
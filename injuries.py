@@ -1,29 +1,34 @@
-import random
+from rngStreams import streams
 from datetime import timedelta
+from terminal import NORMAL, echo, log
+
+# Injury length tiers: (cumulative probability, min days, max days), checked in order
+INJURY_TIERS = ((0.6, 6, 14), (0.9, 15, 90), (1.0, 91, 230))
+
+
 def assign_season_injuries(team, season_start, season_end, is_user=False):
+    rng = streams.random("injuries")
     avg = team.avg_rating()
-    n = random.randint(2, 5)
+    n = rng.randint(2, 5)
     pool = team.all_players()
     if not pool:
         return
 
-    picks = random.sample(pool, k=min(n, len(pool)))
+    picks = rng.sample(pool, k=min(n, len(pool)))
     span = (season_end - season_start).days
 
     if is_user:
-        print(f"\n🩹 {team.name} Season Injuries:")
+        echo(f"\n🩹 {team.name} Season Injuries:")
 
     for who in picks:
         # Weighted duration selection
-        roll = random.random()
-        if roll < 0.6:        # 60% chance
-            days = random.randint(6, 14)
-        elif roll < 0.9:      # 30% chance
-            days = random.randint(15, 90)
-        else:                 # 10% chance
-            days = random.randint(91, 230)
-
-        start_offset = 0 if span <= days else random.randint(0, span - days)
+        roll = rng.random()
+        for cutoff, lo, hi in INJURY_TIERS:
+            if roll < cutoff:
+                break
+        days = rng.randint(lo, hi)
+
+        start_offset = 0 if span <= days else rng.randint(0, span - days)
         when = season_start + timedelta(days=start_offset)
         who.injured_until = when + timedelta(days=days)
 
@@ -33,7 +38,7 @@ def assign_season_injuries(team, season_start, season_end, is_user=False):
                 "🟡 Moderate" if days <= 90 else
                 "🔴 Severe"
             )
-            print(f"  {tier:<9} | {who.rating} OVR - {who.name:<25} | Out {days:>3} days")
+            log(NORMAL, "  {:<9} | {} OVR - {:<25} | Out {:>3} days", tier, who.rating, who.name, days)
 
 
 
@@ -43,4 +48,4 @@ def recover_injuries(team, when, is_user=False):
         if p.injured_until and when >= p.injured_until:
             p.injured_until = None
             if is_user:
-                print(f"✅ {p.name} has recovered on {when.isoformat()}")
\ No newline at end of file
+                log(NORMAL, "✅ {} has recovered on {}", p.name, when)
\ No newline at end of file
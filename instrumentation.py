@@ -0,0 +1,198 @@
+import cProfile
+import gc
+import json
+import os
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+from terminal import SUMMARY, echo, echo_lines, flush
+
+# Opt-in season instrumentation.
+#   MLSM_TIMING=1             per-season phase timing table
+#   MLSM_PROFILE=a,b | all    also run those phases under cProfile (implies timing)
+#   MLSM_PROFILE_DIR=path     where .prof files go (default: profiles/)
+#   MLSM_COUNTERS=path        append one JSON line of hot-path call counts per season
+#   MLSM_MEMORY=N             tracemalloc snapshot at each season boundary, top N growth sites
+# main.py exposes the same switches as --timing / --profile / --profile-dir / --counters / --memory.
+
+# Hot-path call counters. Sites bump them inline (calls["name"] += 1), which is cheap
+# enough to leave on unconditionally; they are reset at each season start.
+COUNTED = ("est_cost_eur", "organize_squad", "avg_rating", "weakest_positions",
+           "all_players", "random_name")
+calls = Counter()
+
+
+class PhaseTimer:
+    def __init__(self, enabled=False, profile=(), profile_dir="profiles", counters_path=None):
+        self.profile = set(profile)
+        self.counters_path = counters_path
+        self.enabled = enabled or bool(self.profile)
+        self.profile_dir = profile_dir
+        self.season = None
+        self.totals = {}      # phase -> [calls, seconds], insertion order = first seen
+        self.history = []     # (season, wall seconds, report rows) for every finished season
+        self.depth = {}
+        self._stack = []
+        self._profiler = None
+        self._season_start = None
+
+    @classmethod
+    def from_env(cls):
+        profile = [p.strip() for p in os.environ.get("MLSM_PROFILE", "").split(",") if p.strip()]
+        return cls(enabled=os.environ.get("MLSM_TIMING", "") not in ("", "0"),
+                   profile=profile, profile_dir=os.environ.get("MLSM_PROFILE_DIR", "profiles"),
+                   counters_path=os.environ.get("MLSM_COUNTERS") or None)
+
+    def configure(self, enabled=None, profile=None, profile_dir=None, counters_path=None):
+        if counters_path is not None:
+            self.counters_path = counters_path
+        if profile is not None:
+            self.profile = set(profile)
+        if profile_dir is not None:
+            self.profile_dir = profile_dir
+        if enabled is not None or profile:
+            self.enabled = bool(enabled) or bool(self.profile)
+
+    def start_season(self, season):
+        self.season = season
+        self.totals = {}
+        self.depth = {}
+        self._season_start = time.perf_counter()
+        calls.clear()
+
+    @contextmanager
+    def phase(self, name):
+        # Phase boundaries flush terminal output, timed or not, so a status line
+        # printed before a long phase shows up before the work starts
+        flush()
+        if not self.enabled:
+            try:
+                yield
+            finally:
+                flush()
+            return
+        profiler = None
+        if self._profiler is None and ("all" in self.profile or name in self.profile):
+            profiler = self._profiler = cProfile.Profile()
+            profiler.enable()
+        self.depth.setdefault(name, len(self._stack))
+        entry = self.totals.setdefault(name, [0, 0.0])
+        self._stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            entry[0] += 1
+            entry[1] += elapsed
+            flush()
+            if profiler is not None:
+                profiler.disable()
+                self._profiler = None
+                os.makedirs(self.profile_dir, exist_ok=True)
+                profiler.dump_stats(os.path.join(self.profile_dir, f"{self.season}-{name}.prof"))
+
+    def report(self):
+        """Timing rows for the current season: (phase, depth, calls, seconds)."""
+        return [(name, self.depth.get(name, 0), n, secs) for name, (n, secs) in self.totals.items()]
+
+    def write_counters(self):
+        """Append this season's call counts as one JSON line."""
+        record = {"season": self.season}
+        record.update({name: calls[name] for name in COUNTED})
+        record.update({name: n for name, n in calls.items() if name not in record})
+        folder = os.path.dirname(self.counters_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.counters_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        return record
+
+    def end_season(self):
+        if self.counters_path and self._season_start is not None:
+            self.write_counters()
+        if not self.enabled or self._season_start is None:
+            return None
+        wall = time.perf_counter() - self._season_start
+        rows = self.report()
+        self.history.append((self.season, wall, rows))
+        echo(f"\n=== TIMING {self.season} (wall {wall * 1000:,.1f} ms) ===", level=SUMMARY)
+        echo_lines([f"{'Phase':<36} {'Calls':>6} {'ms':>10} {'%':>6}"] + [
+            f"{'  ' * depth + name:<36} {n:>6} {secs * 1000:>10,.1f} {100 * secs / wall if wall else 0:>6.1f}"
+            for name, depth, n, secs in rows
+        ], level=SUMMARY)
+        return wall, rows
+
+
+class MemoryTracker:
+    """
+    tracemalloc snapshots at season boundaries. Each boundary reports traced memory, the
+    players still on rosters, every Player object still alive, and the `top` source lines
+    whose allocations grew most since the first boundary.
+    """
+    def __init__(self, top=0, frames=1):
+        self.top = top
+        self.frames = frames
+        self.history = []     # one dict per boundary, see season_boundary
+        self._first = None
+
+    @property
+    def enabled(self):
+        return self.top > 0
+
+    @classmethod
+    def from_env(cls):
+        value = os.environ.get("MLSM_MEMORY", "")
+        return cls(top=int(value) if value.isdigit() else (10 if value else 0))
+
+    def configure(self, top=None):
+        if top is not None:
+            self.top = top
+
+    def start(self):
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def season_boundary(self, season, teams):
+        if not self.enabled or not tracemalloc.is_tracing():
+            return None
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        record = {
+            "season": season,
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "rostered_players": sum(len(t.all_players()) for t in teams),
+            "live_players": sum(1 for o in gc.get_objects() if type(o).__name__ == "Player"),
+            "top_growth": [],
+        }
+        if self._first is None:
+            self._first = snapshot
+        else:
+            record["top_growth"] = [
+                (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+                for stat in snapshot.compare_to(self._first, "lineno")[:self.top]
+            ]
+        self.history.append(record)
+
+        first = self.history[0]
+        echo(f"\n=== MEMORY {season} === traced {current / 2**20:,.1f} MB "
+             f"({(current - first['traced_bytes']) / 2**20:+,.1f} since {first['season']}), "
+             f"peak {peak / 2**20:,.1f} MB, players {record['rostered_players']} rostered / "
+             f"{record['live_players']} alive", level=SUMMARY)
+        echo_lines((f"  {size / 1024:>+10,.1f} KB {count:>+8} blocks  {where}"
+                    for where, size, count in record["top_growth"]), level=SUMMARY)
+        return record
+
+
+timer = PhaseTimer.from_env()
+phase = timer.phase
+memory = MemoryTracker.from_env()
@@ -0,0 +1,154 @@
+import numpy as np
+
+from constants import BENCH, STARTERS
+from matchEngineSchedules import VENUE_SIGN, round_robin_template, simulate_batch
+from rngStreams import streams
+
+# Copy-on-write league state for lookahead decisions. A snapshot records what the rest of
+# the season depends on (points and goals, budgets, club strengths, first teams and the
+# fixtures still to play) without copying a single Player. Every club's first team and
+# reserves are captured as tuples once, in a base shared by all forks of the snapshot, so
+# later changes to the real squads never leak into a fork. fork() only copies a few small
+# per-club arrays and the dict of clubs whose rosters it changed; a change rebuilds just
+# that club's tuples. Nothing done on a fork touches the real league, so a fork is simply
+# dropped when the decision is made.
+#
+#   base = LeagueFork.snapshot(teams, season)
+#   trial = base.fork()
+#   trial.sign(club, player, fee)
+#   gain = base.expected_position(club, rng=np.random.default_rng(7)) \
+#        - trial.expected_position(club, rng=np.random.default_rng(7))
+#
+# Reusing one seed for both sides replays the same random numbers against both rosters,
+# so a few hundred runs are enough to tell the two apart.
+
+
+def _strength(team, first_team):
+    # Same figure as Team.avg_rating, which the classic match engine plays on
+    if not first_team:
+        return team.avg_target
+    return round(sum(p.rating for p in first_team) / len(first_team), 1)
+
+
+class LeagueFork:
+    def __init__(self, teams, index, fixtures, stats, budgets, strength, base, rosters):
+        self.teams = teams          # shared by every fork; never modified through one
+        self.index = index          # team -> position in teams, shared
+        self.fixtures = fixtures    # (3, n) int array: home club, away club, venue sign; shared
+        self.stats = stats          # (3, clubs) int array: points, goals for, goals against
+        self.budgets = budgets
+        self.strength = strength
+        self._base = base           # (first_team, reserves) per club at the snapshot, shared
+        self._rosters = rosters     # club index -> (first_team, reserves) once changed here
+
+    @classmethod
+    def snapshot(cls, teams, season=None):
+        """
+        Capture the league now. With a Season, the fixtures left are those after its
+        cursor (and its club order is used); without one, a full double round-robin
+        from a fresh table, i.e. the next season.
+        """
+        teams = tuple(season.teams if season is not None else teams)
+        index = {t: i for i, t in enumerate(teams)}
+        if season is not None:
+            rows = [(index[A], index[B], VENUE_SIGN.get(venue, 0))
+                    for _, fixtures in season.matchdays[season.cursor:] for A, B, venue in fixtures]
+            stats = np.array([[t.points for t in teams], [t.gf for t in teams], [t.ga for t in teams]],
+                             dtype=np.int64).reshape(3, len(teams))
+        else:
+            rows = [(i, j, VENUE_SIGN.get(venue, 0))
+                    for day in round_robin_template(len(teams)) for i, j, venue in day]
+            stats = np.zeros((3, len(teams)), dtype=np.int64)
+        fixtures = np.array(rows, dtype=np.int64).reshape(-1, 3).T.copy()
+        fixtures.flags.writeable = False
+        budgets = np.array([t.budget for t in teams], dtype=float)
+        base = tuple((tuple(t.first_team()), tuple(t.reserves)) for t in teams)
+        strength = np.array([_strength(t, first) for t, (first, _) in zip(teams, base)], dtype=float)
+        return cls(teams, index, fixtures, stats, budgets, strength, base, {})
+
+    def fork(self):
+        """An independent child; costs a few microseconds whatever the squad sizes."""
+        return LeagueFork(self.teams, self.index, self.fixtures, self.stats.copy(),
+                          self.budgets.copy(), self.strength.copy(), self._base, self._rosters.copy())
+
+    def roster(self, team):
+        """(first_team, reserves) as this fork sees them."""
+        i = self.index[team]
+        return self._rosters.get(i, self._base[i])
+
+    def budget(self, team):
+        return self.budgets[self.index[team]]
+
+    def sign(self, team, player, fee=0):
+        """
+        Add `player` to `team` for `fee`. Like organize_squad, he takes the first-team
+        place of the weakest player at his position (or the weakest overall if none play
+        there) when he is better, and otherwise joins the reserves.
+        """
+        i = self.index[team]
+        first, reserves = self.roster(team)
+        if len(first) < STARTERS + BENCH:
+            first += (player,)
+        else:
+            same = [p for p in first if p.pos == player.pos] or first
+            weakest = min(same, key=lambda p: p.rating)
+            if player.rating > weakest.rating:
+                first = tuple(p for p in first if p is not weakest) + (player,)
+                reserves += (weakest,)
+            else:
+                reserves += (player,)
+        self._set_roster(i, first, reserves)
+        self.budgets[i] -= fee
+
+    def release(self, team, player, fee=0):
+        """Remove `player` from `team`, receiving `fee`; the best reserve fills a first-team gap."""
+        i = self.index[team]
+        first, reserves = self.roster(team)
+        if player in first:
+            first = tuple(p for p in first if p is not player)
+            if reserves:
+                best = max(reserves, key=lambda p: p.rating)
+                first += (best,)
+                reserves = tuple(p for p in reserves if p is not best)
+        elif player in reserves:
+            reserves = tuple(p for p in reserves if p is not player)
+        else:
+            raise ValueError(f"{player.name} is not at {team.name}")
+        self._set_roster(i, first, reserves)
+        self.budgets[i] += fee
+
+    def _set_roster(self, i, first, reserves):
+        self._rosters[i] = (first, reserves)
+        self.strength[i] = _strength(self.teams[i], first)
+
+    def simulate(self, runs=1000, rng=None):
+        """
+        Play the fixtures left `runs` times in one batch with the classic engine. Returns
+        final 1-based table positions as an int array (runs, clubs), ties broken like
+        Standings (points, goal difference, goals for, then club order).
+        """
+        rng = rng if rng is not None else streams.generator("lookahead")
+        n = len(self.teams)
+        points, gf, ga = (np.repeat(row[None, :], runs, axis=0) for row in self.stats)
+        a, b, home = self.fixtures
+        if a.size:
+            outcome, gA, gB = simulate_batch(np.tile(self.strength[a], runs), np.tile(self.strength[b], runs),
+                                             np.tile(home, runs), rng)
+            offset = np.repeat(np.arange(runs) * n, a.size)
+            ia, ib = offset + np.tile(a, runs), offset + np.tile(b, runs)
+
+            def total(weights_a, weights_b):
+                return (np.bincount(ia, weights_a, runs * n)
+                        + np.bincount(ib, weights_b, runs * n)).astype(np.int64).reshape(runs, n)
+
+            points += total(np.choose(outcome + 1, (0, 1, 3)), np.choose(outcome + 1, (3, 1, 0)))
+            gf += total(gA, gB)
+            ga += total(gB, gA)
+        order = np.lexsort((-gf, ga - gf, -points))
+        positions = np.empty_like(order)
+        np.put_along_axis(positions, order, np.arange(1, n + 1)[None, :].repeat(runs, axis=0), axis=1)
+        return positions
+
+    def expected_position(self, team, runs=500, rng=None):
+        """Mean final position of `team` over `runs` simulated remainders of the season."""
+        return float(self.simulate(runs, rng)[:, self.index[team]].mean())
@@ -0,0 +1,151 @@
+import os
+
+import numpy as np
+
+# Append-only record of every budget movement. Entries live in preallocated typed columns
+# (doubled when full), so recording one is a handful of array stores and queries are
+# NumPy reductions rather than loops over Python objects. Amounts are signed from the
+# club's side: -30 for a €30M signing, +70 for a title prize. A transfer between clubs is
+# two entries, one per club, each naming the other as counterparty (-1: nobody).
+#
+# Club ids are positions in the league's club list (passed to open(); otherwise handed
+# out in order of first appearance). The file in the save folder holds ENTRY_DTYPE rows.
+ENTRY_DTYPE = np.dtype([
+    ("team", "<i4"), ("season", "<i2"), ("kind", "u1"), ("amount", "<i8"), ("counterparty", "<i4"),
+])
+KINDS = (
+    "other", "signing", "poach_paid", "poach_received", "release_fee", "severance",
+    "budget_reset", "prize", "objective_bonus", "lottery", "investment", "survey_reward",
+)
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+TRANSFER_KINDS = ("signing", "poach_paid", "poach_received", "release_fee", "severance")
+
+
+class Ledger:
+    def __init__(self, capacity=1024):
+        self.path = None
+        self._reset(capacity)
+
+    def _reset(self, capacity=1024):
+        self.season = 0
+        self.names = []
+        self._ids = {}
+        self._cols = {name: np.zeros(capacity, dtype=ENTRY_DTYPE[name]) for name in ENTRY_DTYPE.names}
+        self.size = 0
+        self._flushed = 0
+
+    # ---------- career lifecycle ----------
+    def open(self, path, teams, resume=False):
+        """
+        Start recording a career into `path`, with ids in `teams` order. A new career
+        truncates the file; a resumed one reloads it so queries cover every season.
+        """
+        self._reset()
+        self.path = path
+        for t in teams:
+            self.team_id(t)
+        if resume and os.path.exists(path):
+            self._extend(np.fromfile(path, dtype=ENTRY_DTYPE))
+            self._flushed = self.size
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def flush(self):
+        """Append entries recorded since the last flush to the file (no-op without one)."""
+        if self.path is None or self._flushed == self.size:
+            return
+        with open(self.path, "ab") as f:
+            f.write(self.rows(self._flushed).tobytes())
+        self._flushed = self.size
+
+    # ---------- writing ----------
+    def team_id(self, team):
+        tid = self._ids.get(team.name)
+        if tid is None:
+            tid = self._ids[team.name] = len(self.names)
+            self.names.append(team.name)
+        return tid
+
+    def record(self, team, amount, kind="other", counterparty=None):
+        i = self.size
+        if i == len(self._cols["team"]):
+            self._grow(2 * i)
+        cols = self._cols
+        cols["team"][i] = self.team_id(team)
+        cols["season"][i] = self.season
+        cols["kind"][i] = KIND_CODES[kind]
+        cols["amount"][i] = amount
+        cols["counterparty"][i] = -1 if counterparty is None else self.team_id(counterparty)
+        self.size = i + 1
+
+    def _grow(self, capacity):
+        for name, col in self._cols.items():
+            grown = np.zeros(capacity, dtype=col.dtype)
+            grown[:self.size] = col[:self.size]
+            self._cols[name] = grown
+
+    def _extend(self, rows):
+        if self.size + len(rows) > len(self._cols["team"]):
+            self._grow(max(2 * len(self._cols["team"]), self.size + len(rows)))
+        for name, col in self._cols.items():
+            col[self.size:self.size + len(rows)] = rows[name]
+        self.size += len(rows)
+
+    # ---------- reading ----------
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """Memory held by the columns, spare capacity included."""
+        return sum(col.nbytes for col in self._cols.values())
+
+    def column(self, name):
+        """Read-only view of one column's recorded entries."""
+        view = self._cols[name][:self.size]
+        view.flags.writeable = False
+        return view
+
+    def rows(self, start=0):
+        """Entries from `start` on as an ENTRY_DTYPE record array (a copy)."""
+        out = np.empty(self.size - start, dtype=ENTRY_DTYPE)
+        for name, col in self._cols.items():
+            out[name] = col[start:self.size]
+        return out
+
+    def _mask(self, kinds=None, season=None):
+        mask = np.ones(self.size, dtype=bool)
+        if kinds is not None:
+            mask &= np.isin(self.column("kind"), [KIND_CODES[k] for k in kinds])
+        if season is not None:
+            mask &= self.column("season") == season
+        return mask
+
+    def by_season(self, kinds=None):
+        """
+        (seasons, totals): totals[club, s] is the sum of amounts for club id `club` in
+        seasons[s], over entries of `kinds` (default all, i.e. the net budget change).
+        """
+        mask = self._mask(kinds)
+        season = self.column("season")[mask].astype(np.int64)
+        if not season.size:
+            return np.zeros(0, dtype=np.int64), np.zeros((len(self.names), 0), dtype=np.int64)
+        seasons, col = np.unique(season, return_inverse=True)
+        idx = self.column("team")[mask].astype(np.int64) * len(seasons) + col
+        totals = np.bincount(idx, weights=self.column("amount")[mask], minlength=len(self.names) * len(seasons))
+        return seasons, totals.astype(np.int64).reshape(len(self.names), len(seasons))
+
+    def net_spend(self):
+        """(seasons, spend): transfer money out minus money in, per club per season."""
+        seasons, totals = self.by_season(TRANSFER_KINDS)
+        return seasons, -totals
+
+    def by_kind(self, season=None):
+        """totals[club, code] summed over every season, or just `season`; codes index KINDS."""
+        mask = self._mask(season=season)
+        idx = self.column("team")[mask].astype(np.int64) * len(KINDS) + self.column("kind")[mask]
+        totals = np.bincount(idx, weights=self.column("amount")[mask], minlength=len(self.names) * len(KINDS))
+        return totals.astype(np.int64).reshape(len(self.names), len(KINDS))
+
+
+ledger = Ledger()
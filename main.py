@@ -1,3 +1,4 @@
+import os
 import random
 import time
 from constants import *
@@ -6,13 +7,21 @@ from matchEngineSchedules import *
 from prompts import prompt_int
 from economy import process_rewards_penalties, next_season_base_budget
 from organizeSquad import organize_squad
-from models.team import Team
+from models.team import Team, generate_league_squads, league_meta
 from utils import *
-from injuries import recover_injuries, assign_season_injuries
+from injuries import assign_season_injuries
 from preseason import preseason_loop
 from transfersAI import *
 from transfersPlayer import *
 from survey import *
+from saveGame import SaveFormatError, save_path
+from saveJournal import Journal
+from seasonHistory import SeasonHistory
+from ledger import ledger
+from season import Season
+from terminal import SUMMARY, echo, echo_lines
+from instrumentation import memory, timer
+from rngStreams import streams
 
 BOARD_FIRING_MESSAGES = [
     "Board Statement: {team} cannot overlook missing our objective. Your contract is terminated immediately.",
@@ -24,10 +33,8 @@ BOARD_TENURE_FIRING_MESSAGE = (
     "The club parts ways with you effective immediately."
 )
 
-def standings_table(teams):
-    return sorted(teams, key=lambda t: (t.points, t.gf - t.ga, t.gf), reverse=True)
 def apply_retirements(teams):
-    print("\nApplying retirements")
+    echo("\nApplying retirements")
     for t in teams:
         keep_starters, keep_bench, keep_res = [], [], []
         for lst, keep in [(t.starters, keep_starters), (t.bench, keep_bench), (t.reserves, keep_res)]:
@@ -44,73 +51,114 @@ def reset_user_manager_tenure(team):
 # =========================
 # MAIN FLOW (CONTINUOUS SEASONS)
 # =========================
-def main():
-    random.seed(time.time_ns())
-    teams = [Team(m) for m in TEAMS_INIT]
-    for t in teams:
-        t.generate_initial_squad()
-
-    print("Pick your team:")
-    for i, t in enumerate(teams):
-        print(f"  {i+1}. {t.name}  (Avg {t.avg_target}, Budget €{t.budget:,}, Obj {t.objective}, {t.formation})")
-    me_idx = prompt_int("Choice: ", 1, len(teams)) - 1
-    user = teams[me_idx]
-    reset_user_manager_tenure(user)
-    print(f"\nYou manage {user.name}.\n")
-
-    year = INIT_YEAR
-    prev_table = None
+def main(seed=None, league_size=None, match_model=None):
+    seed = time.time_ns() if seed is None else seed
+    random.seed(seed)  # anything still on the global stream
+    streams.seed(seed)
+    memory.start()
+    league_size = league_size or int(os.environ.get("MLSM_LEAGUE_SIZE", 0)) or None
+    path = save_path()
+    journal = Journal(path)
+    history = SeasonHistory(os.path.dirname(path) or ".")
+    ledger_path = os.path.join(os.path.dirname(path) or ".", "ledger.bin")
+    resumed = None
+    if os.path.exists(path) and yesno("Resume saved career? (y/n): "):
+        try:
+            resumed = journal.recover()
+        except (OSError, SaveFormatError) as exc:
+            echo(f"Could not load save ({exc}). Starting a new career.")
+
+    phase, cursor = "new", 0
+    if resumed:
+        teams, user, year, prev_table, phase, cursor = resumed
+        ledger.open(ledger_path, teams, resume=True)
+        echo(f"\nResuming {user.name}, season {year}-{year+1}.\n")
+    else:
+        teams = [Team(m) for m in league_meta(league_size)]
+        generate_league_squads(teams)
+        ledger.open(ledger_path, teams)
+
+        echo("Pick your team:")
+        for i, t in enumerate(teams):
+            echo(f"  {i+1}. {t.name}  (Avg {t.avg_target}, Budget €{t.budget:,}, Obj {t.objective}, {t.formation})")
+        me_idx = prompt_int("Choice: ", 1, len(teams)) - 1
+        user = teams[me_idx]
+        reset_user_manager_tenure(user)
+        echo(f"\nYou manage {user.name}.\n")
+
+        year = INIT_YEAR
+        prev_table = None
+        history.clear()
+        journal.compact(teams, user, year, prev_table)
+
+    def checkpoint(phase, cursor=0):
+        journal.checkpoint(teams, user, year, prev_table, phase, cursor)
+        ledger.flush()  # entries on disk match the state the journal would recover
 
     while True:
         TM_OPEN, TM_CLOSE, PROCESSING_DAY, SEASON_START, SEASON_END = season_dates(year)
-        print(f"\n================  SEASON {year}-{year+1}  ================")
-
-        for t in teams:
-            t.reset_season_stats()
-            t.top_up_youth(is_user=(t is user))
-
-        preseason_loop(user, teams, TM_OPEN, TM_CLOSE,
-                       make_free_agent_pool, champion_poach_user, user_poach_players,
-                       ai_transfers, user_transfers, organize_squad, trim_ai_reserves,
-                       prev_table)
-
-        apply_retirements(teams)
-
-        print("\nAssigning season injuries...")
-        for t in teams:
-            assign_season_injuries(t, SEASON_START, SEASON_END, is_user=(t is user))
-        print("Injuries assigned.\n")
-
-        fixtures = build_home_and_away(teams)
-        scheduled = assign_dates(fixtures, SEASON_START, SEASON_END)
-
-        print(f"--- Season {SEASON_START} to {SEASON_END} ---\n")
-        for when, (A, B, venue) in scheduled:
-            recover_injuries(A, when, is_user=(A is user))
-            recover_injuries(B, when, is_user=(B is user))
-            organize_squad(A)
-            organize_squad(B)
-            simulate_match(A, B, venue, when)
-
-        table = standings_table(teams)
-        print("\n=== FINAL TABLE ===")
-        print("Pos Team                Pts   GF  GA  GD   AvgRoster  Budget(€)")
-        for i, t in enumerate(table, start=1):
-            print(f"{i:>2}. {t.name:<18} {t.points:>3}  {t.gf:>3} {t.ga:>3} {t.gf-t.ga:>3}   {t.avg_rating():>9}  €{t.budget:,}")
-
-        season_end_retirements(teams)
-
-        for t in teams:
-            for p in t.all_players():
-                p.season_progression()
-
-        print("\n=== NEXT SEASON BASE BUDGETS (APPLIED) ===")
-        for t in teams:
-            base = next_season_base_budget(t)
-            t.budget = base
-        
-        process_rewards_penalties(table)
-        
+        echo(f"\n================  SEASON {year}-{year+1}  ================", level=SUMMARY)
+        timer.start_season(year)
+        ledger.season = year
+
+        if phase == "new":
+            with timer.phase("youth_top_up"):
+                for t in teams:
+                    t.reset_season_stats()
+                    t.top_up_youth(is_user=(t is user))
+                checkpoint("preseason")
+
+        if phase in ("new", "preseason"):
+            with timer.phase("preseason"):
+                preseason_loop(user, teams, TM_OPEN, TM_CLOSE,
+                               make_free_agent_pool, champion_poach_user, user_poach_players,
+                               ai_transfers, user_transfers, organize_squad, trim_ai_reserves,
+                               prev_table, after_action=lambda: checkpoint("preseason"))
+
+            with timer.phase("retirements"):
+                apply_retirements(teams)
+
+            echo("\nAssigning season injuries...")
+            with timer.phase("injuries"):
+                for t in teams:
+                    assign_season_injuries(t, SEASON_START, SEASON_END, is_user=(t is user))
+                echo("Injuries assigned.\n")
+                checkpoint("season", 0)
+            cursor = 0
+
+        with timer.phase("fixtures"):
+            # cursor = matchdays already played; the journal records it after each one
+            season = Season(teams, year, user, cursor, match_model)
+
+        echo(f"--- Season {SEASON_START} to {SEASON_END} ---\n")
+        with timer.phase("match_loop"):
+            for matchday in season.iter_matchdays():
+                checkpoint("season", matchday.index + 1)
+
+        table = season.table()
+        echo("\n=== FINAL TABLE ===\nPos Team                Pts   GF  GA  GD   AvgRoster  Budget(€)", level=SUMMARY)
+        echo_lines((
+            f"{i:>2}. {t.name:<18} {t.points:>3}  {t.gf:>3} {t.ga:>3} {t.gf-t.ga:>3}   {t.avg_rating():>9}  €{t.budget:,}"
+            for i, t in enumerate(table, start=1)
+        ), level=SUMMARY)
+        with timer.phase("history"):
+            history.record_season(year, table, user)
+
+        with timer.phase("progression"):
+            season_end_retirements(teams)
+
+            for t in teams:
+                for p in t.all_players():
+                    p.season_progression()
+
+        with timer.phase("economy"):
+            echo("\n=== NEXT SEASON BASE BUDGETS (APPLIED) ===")
+            for t in teams:
+                base = next_season_base_budget(t)
+                t.charge(t.budget - base, "budget_reset")
+
+            process_rewards_penalties(table)
+        timer.end_season()
 
         user_pos = next((i for i, t in enumerate(table, start=1) if t is user), None)
         if user_pos is not None:
@@ -131,9 +179,9 @@ def main():
             if getattr(user, "top3_streak", 0) >= 2:
                 fire_chance = 0.05
             if user_pos is not None and user_pos > user.objective:
-                if random.random() < fire_chance:
+                if streams.random("board").random() < fire_chance:
                     forced_switch = True
-                    firing_message = random.choice(BOARD_FIRING_MESSAGES).format(team=user.name)
+                    firing_message = streams.random("board").choice(BOARD_FIRING_MESSAGES).format(team=user.name)
 
         previous_user = user
         if forced_switch:
@@ -143,8 +191,29 @@ def main():
         if new_user is not previous_user:
             reset_user_manager_tenure(new_user)
         user = new_user
+        memory.season_boundary(year, teams)
         prev_table = table[:]
         year += 1
+        phase, cursor = "new", 0
+        journal.compact(teams, user, year, prev_table)
+        ledger.flush()
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="MLSoccerMode")
+    parser.add_argument("--seed", type=int, default=int(os.environ["MLSM_SEED"]) if os.environ.get("MLSM_SEED") else None)
+    parser.add_argument("--league-size", type=int, default=None, help="number of clubs for a new career (default 12, or MLSM_LEAGUE_SIZE)")
+    parser.add_argument("--match-model", choices=MATCH_MODELS, default=None,
+                        help="match engine: classic (team average) or xi (starting XI, Poisson goals)")
+    parser.add_argument("--timing", action="store_true", help="print a per-season phase timing table")
+    parser.add_argument("--profile", default="", help="comma-separated phases to run under cProfile ('all' for every phase)")
+    parser.add_argument("--profile-dir", default=None, help="where to write .prof files")
+    parser.add_argument("--memory", type=int, nargs="?", const=10, default=None,
+                        help="report memory growth at each season boundary (top N growth sites, default 10)")
+    parser.add_argument("--counters", default=None, help="append per-season hot-path call counts (JSON lines) to this file")
+    args = parser.parse_args()
+    timer.configure(enabled=args.timing or None,
+                    profile=[p for p in args.profile.split(",") if p] or None,
+                    profile_dir=args.profile_dir, counters_path=args.counters)
+    memory.configure(top=args.memory)
+    main(args.seed, args.league_size, args.match_model)
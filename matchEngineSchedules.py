@@ -1,7 +1,8 @@
-import random
+from rngStreams import streams
 import math
 import numpy as np
 from datetime import timedelta
+from functools import lru_cache
 
 def spread_pick(dates, k):
     """Evenly pick k entries across date list."""
@@ -24,14 +25,20 @@ def frisa_dates(start, end):
         d += timedelta(days=1)
 
 
+# Rating points a home side gains (and the visitor loses), and the rating gap that moves
+# the win odds by one logistic unit. Read at call time, so tuning runs can override them.
+HOME_ADV = 1.4
+RATING_SCALE = 5.5
+
+
 def match_probabilities(rA, rB, venue):
-    home_adv = 1.4
+    home_adv = HOME_ADV
     if venue == "homeA": rA, rB = rA + home_adv, rB - home_adv
     elif venue == "homeB": rA, rB = rA - home_adv, rB + home_adv
 
     gap = max(-15, min(15, rA - rB))
     p_draw = max(0.12, min(0.28 - 0.015 * abs(gap), 0.28))
-    T = 5.5
+    T = RATING_SCALE
 
     def sigmoid(x):
         return 1 / (1 + pow(2.71828, -x))
@@ -45,30 +52,163 @@ def match_probabilities(rA, rB, venue):
 
 
 def result_score(a_wins):
+    rng = streams.random("matches")
     if a_wins is True:
-        gA = random.choice([1, 2, 2, 3, 3, 4])
-        gB = random.choice([0, 0, 1, 1, 2])
+        gA = rng.choice([1, 2, 2, 3, 3, 4])
+        gB = rng.choice([0, 0, 1, 1, 2])
         if gB >= gA:
             gB = max(0, gA - 1)
     elif a_wins is False:
-        gB = random.choice([1, 2, 2, 3, 3, 4])
-        gA = random.choice([0, 0, 1, 1, 2])
+        gB = rng.choice([1, 2, 2, 3, 3, 4])
+        gA = rng.choice([0, 0, 1, 1, 2])
         if gA >= gB:
             gA = max(0, gB - 1)
     else:
-        g = random.choice([0, 1, 1, 2, 2])
+        g = rng.choice([0, 1, 1, 2, 2])
         return g, g
     return gA, gB
 
 
-_neutral_idx = 0
+# =========================
+# BATCHED ENGINE
+# =========================
+# Same model as match_probabilities/result_score, over arrays of fixtures. Goal tables are
+# the lists result_score picks from; drawing an index uniformly reproduces random.choice.
+WIN_GOALS = np.array([1, 2, 2, 3, 3, 4])
+LOSE_GOALS = np.array([0, 0, 1, 1, 2])
+DRAW_GOALS = np.array([0, 1, 1, 2, 2])
+VENUE_SIGN = {"homeA": 1, "homeB": -1}
+
+
+def match_probabilities_batch(rA, rB, home):
+    """
+    (pA, p_draw) arrays for strengths rA, rB and home = +1 (A hosts), -1 (B hosts) or 0.
+    As match_probabilities; B wins with the remaining 1 - pA - p_draw.
+    """
+    shift = HOME_ADV * np.asarray(home, dtype=float)
+    gap = np.clip((np.asarray(rA, dtype=float) + shift) - (np.asarray(rB, dtype=float) - shift), -15, 15)
+    p_draw = np.clip(0.28 - 0.015 * np.abs(gap), 0.12, 0.28)
+    pA = np.maximum((1 - p_draw) / (1 + np.exp(-gap / RATING_SCALE)), 0.12)
+    return pA, p_draw
+
+
+def simulate_batch(rA, rB, home, rng):
+    """
+    Outcomes (1 = A wins, 0 = draw, -1 = B wins) and goals for every fixture at once,
+    with one Generator call per distribution.
+    """
+    pA, p_draw = match_probabilities_batch(rA, rB, home)
+    n = pA.shape[0]
+    roll = rng.random(n)
+    outcome = np.where(roll < pA, 1, np.where(roll < pA + p_draw, 0, -1))
+    win = WIN_GOALS[rng.integers(0, WIN_GOALS.size, n)]
+    lose = LOSE_GOALS[rng.integers(0, LOSE_GOALS.size, n)]
+    lose = np.where(lose >= win, np.maximum(0, win - 1), lose)
+    draw = DRAW_GOALS[rng.integers(0, DRAW_GOALS.size, n)]
+    gA = np.where(outcome == 1, win, np.where(outcome == 0, draw, lose))
+    gB = np.where(outcome == 1, lose, np.where(outcome == 0, draw, win))
+    return outcome, gA, gB
+
+
+# =========================
+# XI ENGINE (MLSM_MATCH_MODEL=xi)
+# =========================
+# Attack and defence come from the actual starting XI, averaged per position group;
+# goals are Poisson with log-rate base + XG_SLOPE * (attack - opposing defence) +/- home.
+# Calibrated against the classic engine: same win/draw/loss split for evenly matched
+# clubs at home (47/24/29%) and with a 5-point edge (67/19/14% vs 67/16/16%), ~1.5 goals
+# per club per match; lopsided games score a little more.
+MATCH_MODELS = ("classic", "xi")
+POSITION_GROUP = {"GK": 0, "CB": 1, "LB": 1, "RB": 1, "CDM": 2, "CM": 2, "CAM": 2, "LW": 3, "RW": 3, "ST": 3}
+ATTACK_WEIGHTS = np.array([0.0, 0.10, 0.35, 0.55])   # gk, defence, midfield, attack
+DEFENCE_WEIGHTS = np.array([0.25, 0.45, 0.30, 0.0])
+XG_BASE, XG_SLOPE, XG_HOME = 1.42, 0.06, 0.15
+
+
+def lineup_arrays(teams, size=11):
+    """(ratings, groups) arrays of shape (len(teams), size) from each club's starters; NaN pads short XIs."""
+    xis = [t.starters[:size] or t.first_team()[:size] for t in teams]
+    if all(len(xi) == size for xi in xis):
+        # Usual case: one flat list per attribute, converted once
+        players = [p for xi in xis for p in xi]
+        ratings = np.array([p.rating for p in players], dtype=float).reshape(len(teams), size)
+        groups = np.array([POSITION_GROUP.get(p.pos, 2) for p in players], dtype=np.int8).reshape(len(teams), size)
+        return ratings, groups
+    ratings = np.full((len(teams), size), np.nan)
+    groups = np.zeros((len(teams), size), dtype=np.int8)
+    for i, xi in enumerate(xis):
+        ratings[i, :len(xi)] = [p.rating for p in xi]
+        groups[i, :len(xi)] = [POSITION_GROUP.get(p.pos, 2) for p in xi]
+    return ratings, groups
+
+
+def xi_strengths(ratings, groups):
+    """(attack, defence) per row; a position group missing from an XI counts at the XI mean."""
+    present = ~np.isnan(ratings)
+    filled = np.where(present, ratings, 0.0)
+    xi_mean = filled.sum(axis=1) / np.maximum(present.sum(axis=1), 1)
+    group_mean = np.empty((ratings.shape[0], 4))
+    for g in range(4):
+        mask = present & (groups == g)
+        count = mask.sum(axis=1)
+        group_mean[:, g] = np.where(count > 0, (filled * mask).sum(axis=1) / np.maximum(count, 1), xi_mean)
+    return group_mean @ ATTACK_WEIGHTS, group_mean @ DEFENCE_WEIGHTS
+
+
+def simulate_xi_batch(attA, defA, attB, defB, home, rng):
+    """Outcomes and goals for every fixture from two Poisson draws."""
+    home = np.asarray(home, dtype=float)
+    lamA = XG_BASE * np.exp(XG_SLOPE * (attA - defB) + XG_HOME * home)
+    lamB = XG_BASE * np.exp(XG_SLOPE * (attB - defA) - XG_HOME * home)
+    gA, gB = rng.poisson(lamA), rng.poisson(lamB)
+    return np.sign(gA - gB), gA, gB
 
 
 def simulate_match(teamA, teamB, venue, when):
-    rA = teamA.avg_rating()
-    rB = teamB.avg_rating()
+    return _play(teamA, teamB, venue, teamA.avg_rating(), teamB.avg_rating(), streams.random("matches").random())
+
+
+def simulate_matchday(fixtures, when, rng=None, model="classic"):
+    """
+    Play a whole matchday in one batch (simulate_batch, or simulate_xi_batch for
+    model="xi"): every club's strength is computed once, the day's results are drawn
+    together and points/goals are applied in one pass. Returns [(A, B, gA, gB), ...].
+    """
+    if not fixtures:
+        return []
+    if rng is None:
+        rng = streams.generator("matches")
+    home = [VENUE_SIGN.get(venue, 0) for _, _, venue in fixtures]
+    if model == "xi":
+        clubs = [t for A, B, _ in fixtures for t in (A, B)]   # A0, B0, A1, B1, ...
+        attack, defence = xi_strengths(*lineup_arrays(clubs))
+        outcome, gA, gB = simulate_xi_batch(attack[0::2], defence[0::2], attack[1::2], defence[1::2], home, rng)
+    else:
+        ratings = {}
+        for A, B, _ in fixtures:
+            for t in (A, B):
+                if t not in ratings:
+                    ratings[t] = t.avg_rating()
+        rA = [ratings[A] for A, _, _ in fixtures]
+        rB = [ratings[B] for _, B, _ in fixtures]
+        outcome, gA, gB = simulate_batch(rA, rB, home, rng)
+    ptsA = np.choose(outcome + 1, (0, 1, 3)).tolist()
+    ptsB = np.choose(outcome + 1, (3, 1, 0)).tolist()
+
+    results = []
+    for (A, B, _), a, b, pa, pb in zip(fixtures, gA.tolist(), gB.tolist(), ptsA, ptsB):
+        A.points += pa
+        B.points += pb
+        A.gf += a
+        A.ga += b
+        B.gf += b
+        B.ga += a
+        results.append((A, B, a, b))
+    return results
+
+
+def _play(teamA, teamB, venue, rA, rB, roll):
     pA, pD, pB = match_probabilities(rA, rB, venue)
-    roll = random.random()
     if roll < pA:
         gA, gB = result_score(True)
         teamA.points += 3
@@ -103,6 +243,54 @@ def build_home_and_away(teams):
     return fixtures
 
 
+@lru_cache(maxsize=None)
+def round_robin_template(n):
+    """
+    Double round-robin for n clubs by the circle method, as club indices:
+    a tuple of matchdays, each a tuple of (i, j, venue). Every club plays at most once per
+    matchday (exactly once for even n; odd n gives each club one bye per half), every pair
+    meets twice, once at each ground. 2 * (n - 1) matchdays for even n, 2 * n for odd.
+    Cached per league size.
+    """
+    ring = list(range(n)) + ([None] if n % 2 else [])
+    m = len(ring)
+    first_half = []
+    for r in range(m - 1):
+        day = []
+        for k in range(m // 2):
+            i, j = ring[k], ring[m - 1 - k]
+            if i is None or j is None:
+                continue
+            # Alternate grounds so no club is stuck at home or away for long runs
+            home_first = (r % 2 == 0) if k == 0 else (k % 2 == 1)
+            day.append((i, j, "homeA" if home_first else "homeB"))
+        first_half.append(tuple(day))
+        ring = [ring[0], ring[-1]] + ring[1:-1]
+    second_half = [tuple((i, j, "homeB" if v == "homeA" else "homeA") for i, j, v in day)
+                   for day in first_half]
+    return tuple(first_half + second_half)
+
+
+def build_matchdays(teams):
+    """round_robin_template mapped onto clubs: a list of matchdays of (A, B, venue)."""
+    return [[(teams[i], teams[j], venue) for i, j, venue in day]
+            for day in round_robin_template(len(teams))]
+
+
+def schedule_season(teams, season_start, season_end):
+    """
+    [(date, fixtures), ...] with matchdays spread evenly over the season's Fri/Sat/Sun
+    dates. Leagues with more matchdays than weekend dates share dates between matchdays.
+    """
+    matchdays = build_matchdays(teams)
+    if not matchdays:
+        return []
+    all_weekend = list(frisa_dates(season_start, season_end))
+    if not all_weekend:
+        raise RuntimeError("Season calendar has no Fri/Sat/Sun dates.")
+    return list(zip(spread_pick(all_weekend, len(matchdays)), matchdays))
+
+
 def assign_dates(fixtures, season_start, season_end):
     if not fixtures:
         return []
@@ -1,6 +1,13 @@
-import random
+from rngStreams import streams
 from playerCost import est_cost_eur
 from utils import clamp
+
+# Yearly rating change ranges (inclusive): growth under 20, growth until 34, decline after
+YOUTH_GROWTH = (1, 5)
+PRIME_GROWTH = (1, 4)
+VETERAN_DECLINE = (0, 4)
+
+
 class Player:
     def __init__(self, name, pos, nation, age, rating, potential_plus):
         self.name = name
@@ -13,9 +20,16 @@ class Player:
         self.retiring_notice = False
         self.potential_range = self._assign_potential_range()
         self.display_potential_range = False
+        self._value_key = None
+        self._value = None
 
     def value(self):
-        return est_cost_eur(self.age, self.rating)
+        # Price depends only on (age, rating); reuse the last model call until either changes
+        key = (self.age, self.rating)
+        if key != self._value_key:
+            self._value = est_cost_eur(self.age, self.rating)
+            self._value_key = key
+        return self._value
     
     def _assign_potential_range(self):
         """Assign a potential range bucket based on the player's potential."""
@@ -37,19 +51,20 @@ class Player:
         return self.injured_until is None or when > self.injured_until
 
     def season_progression(self):
+        rng = streams.random("players")
         # Growth till 34: +1..+4 for youth, +1..+3 for others; decline after
         if self.age < 20:
-            grow = random.randint(1, 5)
+            grow = rng.randint(*YOUTH_GROWTH)
             self.rating = min(self.potential, self.rating + grow)
         elif self.age < 34:
-            grow = random.randint(1, 4)
+            grow = rng.randint(*PRIME_GROWTH)
             self.rating = min(self.potential, self.rating + grow)
         else:
-            drop = random.randint(0, 4)
+            drop = rng.randint(*VETERAN_DECLINE)
             self.rating = max(50, self.rating - drop)
 
         # 25% chance to permanently reveal potential range if not already visible
-        if not getattr(self, "display_potential_range", False) and random.random() < 0.30:
+        if not getattr(self, "display_potential_range", False) and rng.random() < 0.30:
             self.display_potential_range = True
 
         self.age += 1
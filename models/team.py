@@ -1,24 +1,99 @@
 from constants import *
-from statistics import mean
 from models.player import Player
-import random
+from rngStreams import streams
+import numpy as np
 from utils import clamp
 from randomName import random_name
+from terminal import DEBUG, log
+from instrumentation import calls
+from ledger import ledger
+
+RATING_MIN, RATING_MAX = 75, 89
+
+
+def _numpy_rng(rng=None):
+    return rng if rng is not None else streams.generator("league")
+
+
+def generate_league_ratings(targets, n, spread=4.0, rng=None):
+    """
+    Ratings for every club in one pass: returns an int array of shape (len(targets), n).
+    Gaussian draws are clamped to [RATING_MIN, RATING_MAX], then the gap to each club's
+    target sum is redistributed in closed form (same result as adding/removing one point
+    per player, round-robin, until the sum matches or every player hits a bound).
+    """
+    rng = _numpy_rng(rng)
+    targets = np.asarray(targets, dtype=float).reshape(-1, 1)
+    arr = np.clip(np.rint(rng.normal(targets, spread, size=(targets.shape[0], n))), RATING_MIN, RATING_MAX).astype(np.int64)
+    diff = np.rint(targets[:, 0] * n).astype(np.int64) - arr.sum(axis=1)
+
+    sign = np.sign(diff)[:, None]
+    room = np.where(sign > 0, RATING_MAX - arr, arr - RATING_MIN)
+    need = np.abs(diff)[:, None]
+
+    # filled[:, k] = units moved after k full round-robin passes
+    levels = np.arange(RATING_MAX - RATING_MIN + 1)
+    filled = np.minimum(room[:, :, None], levels).sum(axis=1)
+    k = (filled <= need).sum(axis=1, keepdims=True) - 1
+    step = np.minimum(room, k)
+    leftover = need - np.take_along_axis(filled, k, axis=1)
+    open_slots = room > k
+    step += open_slots & (np.cumsum(open_slots, axis=1) <= leftover)
+    return arr + sign * step
+
 
 def generate_rating_set(n, target_avg, spread=4.0):
-    arr = [clamp(round(random.gauss(target_avg, spread)), 75, 89) for _ in range(n)]
-    want = target_avg * n
-    diff = round(want - sum(arr))
-    step = 1 if diff > 0 else -1
-    i = 0
-    while diff != 0 and i < 20000:
-        j = i % n
-        new_val = clamp(arr[j] + step, 75, 89)
-        if new_val != arr[j]:
-            arr[j] = new_val
-            diff -= step
-        i += 1
-    return arr
+    return generate_league_ratings([target_avg], n, spread)[0].tolist()
+
+
+def generate_club_meta(count, taken=(), rng=None):
+    """
+    Metadata for `count` generated clubs, in the shape of TEAMS_INIT entries plus "origins":
+    a home city and nation, a target rating, a budget that grows with it and a formation.
+    Objectives are left to league_meta, which ranks the whole league.
+    """
+    rng = rng or streams.random("league")
+    names = set(taken)
+    nations = list(CLUB_CITIES)
+    clubs = []
+    for _ in range(count):
+        home = rng.choice(nations)
+        city = rng.choice(CLUB_CITIES[home])
+        name = base = f"{city} {rng.choice(CLUB_SUFFIXES)}"
+        k = 2
+        while name in names:
+            name, k = f"{base} {k}", k + 1
+        names.add(name)
+        avg = int(clamp(round(rng.gauss(82, 2.5)), 77, 88))
+        budget = max(50, int(round((avg - 76) * 15 + rng.uniform(-20, 40))))
+        origins = [home] + rng.sample([n for n in nations if n != home], 4)
+        clubs.append({"name": name, "avg": avg, "budget": budget, "objective": 0,
+                      "formation": rng.choice(list(FORMATIONS)), "stadium": f"{city} Arena",
+                      "origins": origins})
+    return clubs
+
+
+def league_meta(size=None, rng=None):
+    """
+    Club metadata for a league of `size` clubs (default: the TEAMS_INIT dozen). Smaller
+    leagues take the first clubs of TEAMS_INIT; larger ones add generated clubs, whose
+    objective is their rank by target rating across the whole league. Objectives never
+    exceed the number of clubs.
+    """
+    size = len(TEAMS_INIT) if size is None else size
+    if size < 2:
+        raise ValueError("a league needs at least 2 clubs")
+    if size <= len(TEAMS_INIT):
+        return [dict(m, objective=min(m["objective"], size)) for m in TEAMS_INIT[:size]]
+    clubs = [dict(m) for m in TEAMS_INIT]
+    generated = generate_club_meta(size - len(clubs), taken=[m["name"] for m in clubs], rng=rng)
+    ranked = sorted(clubs + generated, key=lambda m: m["avg"], reverse=True)
+    rank = {}
+    for pos, m in enumerate(ranked, start=1):
+        rank.setdefault(m["avg"], pos)
+    for m in generated:
+        m["objective"] = rank[m["avg"]]
+    return clubs + generated
 
 
 def suggest_bench_positions(formation, size):
@@ -36,6 +111,30 @@ def suggest_bench_positions(formation, size):
     return out
 
 
+def generate_league_squads(teams, rng=None):
+    """
+    Build Starters + Bench for every club at once. Ratings, ages, potential bumps,
+    nationalities and XI shuffles are drawn as (clubs x players) arrays; only the
+    Player objects and their names are created one by one.
+    """
+    if not teams:
+        return
+    rng = _numpy_rng(rng)
+    shape = (len(teams), STARTERS + BENCH)
+    ratings = -np.sort(-generate_league_ratings([t.avg_target for t in teams], shape[1], rng=rng), axis=1)
+    ages = rng.integers(18, 36, size=shape)
+    pluses = rng.integers(1, 4, size=shape)
+    n_origins = np.array([len(t.origins) for t in teams])[:, None]
+    nation_idx = (rng.random(shape) * n_origins).astype(np.int64)
+    xi_order = rng.random((len(teams), STARTERS)).argsort(axis=1)
+
+    for i, t in enumerate(teams):
+        t._fill_initial_squad(
+            ratings[i].tolist(), ages[i].tolist(), pluses[i].tolist(),
+            nation_idx[i].tolist(), xi_order[i].tolist(),
+        )
+
+
 class Team:
     def __init__(self, meta):
         self.name = meta["name"]
@@ -44,7 +143,7 @@ class Team:
         self.objective = meta["objective"]
         self.formation = meta["formation"]
         self.stadium = meta["stadium"]
-        self.origins = ORIGINS[self.name]
+        self.origins = meta.get("origins") or ORIGINS[self.name]
         self.starters = []
         self.bench = []
         self.reserves = []
@@ -65,14 +164,17 @@ class Team:
         self.cleanup_poach_protected()
 
     def all_players(self):
+        calls["all_players"] += 1
         return self.starters + self.bench + self.reserves
 
     def first_team(self):
         return self.starters + self.bench  # no reserves
 
     def avg_rating(self):
+        calls["avg_rating"] += 1
         roster = self.first_team()
-        return round(mean(p.rating for p in roster), 1) if roster else self.avg_target
+        # int / int is correctly rounded, so this equals statistics.mean at a fraction of the cost
+        return round(sum(p.rating for p in roster) / len(roster), 1) if roster else self.avg_target
 
     def cleanup_poach_protected(self):
         roster = set(self.all_players())
@@ -93,48 +195,23 @@ class Team:
         if player in self.poach_protected:
             self.poach_protected.remove(player)
 
-    def generate_initial_squad(self):
-        # Build XI positions from formation, assign randomly so initial strengths vary
+    def generate_initial_squad(self, rng=None):
+        generate_league_squads([self], rng)
+
+    def _fill_initial_squad(self, ratings, ages, pluses, nation_idx, xi_order):
+        # XI positions from formation, assigned in a random order so initial strengths vary
         xi_positions = []
         for pos, c in FORMATIONS[self.formation].items():
             xi_positions += [pos] * c
-        random.shuffle(xi_positions)
-
-        # Generate ratings for Starters + Bench, centered on team average
-        total_needed = STARTERS + BENCH
-        ratings = generate_rating_set(total_needed, self.avg_target)
-        ratings.sort(reverse=True)  # best first
-
-        # Starters = highest ratings
-        for i, pos in enumerate(xi_positions):
-            nation = random.choice(self.origins)
-            self.starters.append(
-                Player(
-                    random_name(nation),
-                    pos,
-                    nation,
-                    random.randint(18, 35),
-                    ratings[i],
-                    random.randint(1, 3),
-                )
-            )
+        positions = [xi_positions[i] for i in xi_order] + suggest_bench_positions(self.formation, BENCH)
 
-        # Bench = next best ratings
-        bench_positions = suggest_bench_positions(self.formation, BENCH)
-        cursor = STARTERS
-        for pos in bench_positions:
-            nation = random.choice(self.origins)
-            self.bench.append(
-                Player(
-                    random_name(nation),
-                    pos,
-                    nation,
-                    random.randint(18, 35),
-                    ratings[cursor],
-                    random.randint(1, 3),
-                )
-            )
-            cursor += 1
+        # Ratings arrive sorted best first: starters take the top STARTERS, bench the rest
+        players = []
+        for pos, rating, age, plus, ni in zip(positions, ratings, ages, pluses, nation_idx):
+            nation = self.origins[ni]
+            players.append(Player(random_name(nation), pos, nation, age, rating, plus))
+        self.starters = players[:STARTERS]
+        self.bench = players[STARTERS:STARTERS + BENCH]
 
     # In class Team
     def pick_weighted_origin(self):
@@ -146,19 +223,20 @@ class Team:
         first_w = 0.40
         rest_w = (1.0 - first_w) / (len(arr) - 1)
         weights = [first_w] + [rest_w] * (len(arr) - 1)
-        return random.choices(arr, weights=weights, k=1)[0]
+        return streams.random("league").choices(arr, weights=weights, k=1)[0]
 
     def top_up_youth(self, is_user):
+        rng = streams.random("league")
         def add_player(target_list, count):
             for _ in range(count):
-                pos = random.choice(["GK", "CB", "LB", "RB", "CDM", "CAM", "CM", "ST", "LW", "RW"])
+                pos = rng.choice(["GK", "CB", "LB", "RB", "CDM", "CAM", "CM", "ST", "LW", "RW"])
                 nation = self.pick_weighted_origin()
-                age = random.randint(YOUTH_AGE_MIN, YOUTH_AGE_MAX)
-                ovr = random.randint(YOUTH_OVR_MIN, YOUTH_OVR_MAX)
+                age = rng.randint(YOUTH_AGE_MIN, YOUTH_AGE_MAX)
+                ovr = rng.randint(YOUTH_OVR_MIN, YOUTH_OVR_MAX)
                 pot_min, pot_max = (YOUTH_POT_USER if is_user else YOUTH_POT_AI)
-                potential_plus = random.randint(max(1, pot_min - ovr), max(1, pot_max - ovr))
+                potential_plus = rng.randint(max(1, pot_min - ovr), max(1, pot_max - ovr))
                 potential = ovr + potential_plus
-                if potential > 91 and random.randint(1, 20) != 1:
+                if potential > 91 and rng.randint(1, 20) != 1:
                     potential = 91
                     potential_plus = max(1, potential - ovr)
                 tag = "❖ "  # normal youth
@@ -174,11 +252,12 @@ class Team:
         """
         Identify the soft spots in the XI. If a formation slot has no natural player,
         treat it as rating 0 so we surface true gaps (e.g., missing LB entirely).
-        Also print a short diagnostic explaining why each returned position needs help.
+        Also log (DEBUG) a short diagnostic explaining why each returned position needs help.
         Set return_details=True to get the rich records used for prioritisation.
         """
+        calls["weakest_positions"] += 1
         if not self.starters:
-            print(f"{self.name}: weakest_positions fallback (no starters set) -> ST, CB, CM.")
+            log(DEBUG, "{}: weakest_positions fallback (no starters set) -> ST, CB, CM.", self.name)
             fallback = [
                 {"pos": "ST", "avg": self.avg_target, "count": 0, "delta": 0},
                 {"pos": "CB", "avg": self.avg_target, "count": 0, "delta": 0},
@@ -218,26 +297,30 @@ class Team:
         weakest = scored[:3]
 
         for info in weakest:
-            pos = info["pos"]
             if info["count"] == 0:
-                reason = "no natural player for required formation slot."
+                log(DEBUG, "{}: need {} — no natural player for required formation slot.",
+                    self.name, info["pos"])
             else:
-                reason = (
-                    f"avg starter rating {info['avg']:.1f} vs XI avg {xi_avg:.1f} "
-                    f"({info['delta']:+.1f})."
-                )
-            print(f"{self.name}: need {pos} — {reason}")
+                log(DEBUG, "{}: need {} — avg starter rating {:.1f} vs XI avg {:.1f} ({:+.1f}).",
+                    self.name, info["pos"], info["avg"], xi_avg, info["delta"])
 
         if return_details:
             return weakest
         return [item["pos"] for item in weakest]
 
 
-    def pay(self, amount):
+    # Every budget movement goes through pay/charge/receive so the ledger sees it
+    def pay(self, amount, kind="other", counterparty=None):
         if amount > self.budget:
             return False
-        self.budget -= amount
+        self.charge(amount, kind, counterparty)
         return True
 
-    def receive(self, amount):
+    def charge(self, amount, kind="other", counterparty=None):
+        """Like pay, but always goes through, even into a negative budget."""
+        self.budget -= amount
+        ledger.record(self, -amount, kind, counterparty)
+
+    def receive(self, amount, kind="other", counterparty=None):
         self.budget += amount
+        ledger.record(self, amount, kind, counterparty)
@@ -1,4 +1,5 @@
 from constants import FORMATIONS, BENCH, STARTERS
+from instrumentation import calls
 
 SIMILAR_POS = {
     "GK":  ["ST"],
@@ -26,6 +27,7 @@ def organize_squad(team, on=None):
       2) Bench: ensure GK and CB first, then best remaining.
       3) Reserves: leftovers + injured.
     """
+    calls["organize_squad"] += 1
     def available(p):
         # Available now or by a given date 'on'
         return p.injured_until is None if on is None else (p.injured_until is None or on > p.injured_until)
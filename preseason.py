@@ -1,8 +1,10 @@
-import random
+from rngStreams import streams
 from prompts import prompt_int
-from ui import print_subtitle, run_menu, show_player_list
+from ui import ListingView, print_subtitle, run_menu, show_player_list
 from utils import yesno
 from constants import FORMATIONS
+from terminal import echo, echo_lines
+from instrumentation import timer
 
 
 def _fmt_currency(amount):
@@ -22,37 +24,37 @@ def end_contracts_flow(team):
         if not yesno("\nRelease someone? (y/n): "):
             break
 
-        print("\nChoose a group to release from:")
-        print("  1) Starters")
-        print("  2) Bench")
-        print("  3) Reserves")
+        echo("\nChoose a group to release from:")
+        echo("  1) Starters")
+        echo("  2) Bench")
+        echo("  3) Reserves")
         lst_choice = prompt_int("Group (1-3): ", 1, 3)
 
         pools = {1: ("Starters", team.starters), 2: ("Bench", team.bench), 3: ("Reserves", team.reserves)}
         pool_name, pool = pools[lst_choice]
         if not pool:
-            print(f"{pool_name} currently has no players.")
+            echo(f"{pool_name} currently has no players.")
             continue
 
-        show_player_list(f"{pool_name} (selected)", pool)
-        idx = prompt_int(f"Release which player (1..{len(pool)}): ", 1, len(pool)) - 1
-        victim = pool[idx]
+        view = ListingView(f"{pool_name} (selected)")
+        view.update(pool)
+        victim = view.choose("Release which player ")
         value = victim.value()
         fee = 1  # flat €1M release payout
 
-        print(f"\n{victim.name} — estimated value {_fmt_currency(value)}.")
-        print(f"Release payout: {_fmt_currency(fee)}.")
-        print(f"Club budget before release: {_fmt_currency(team.budget)}.")
+        echo(f"\n{victim.name} — estimated value {_fmt_currency(value)}.")
+        echo(f"Release payout: {_fmt_currency(fee)}.")
+        echo(f"Club budget before release: {_fmt_currency(team.budget)}.")
         if yesno("Confirm release? (y/n): "):
-            if team.pay(fee):
-                pool.pop(idx)
+            if team.pay(fee, "release_fee"):
+                pool.remove(victim)
                 if hasattr(team, "unprotect_player"):
                     team.unprotect_player(victim)
-                print(f"Released {victim.name}. New budget {_fmt_currency(team.budget)}.")
+                echo(f"Released {victim.name}. New budget {_fmt_currency(team.budget)}.")
                 # caller can reorganize after returning, or import locally:
                 # from organizeSquad import organize_squad; organize_squad(team)
             else:
-                print("Not enough funds to cover the release payout.")
+                echo("Not enough funds to cover the release payout.")
 
 def action_view_squad(user, organize_squad):
     def _inner():
@@ -66,18 +68,18 @@ def action_change_formation(user, organize_squad):
     def _inner():
         print_subtitle("Change Team Formation")
         formations = list(FORMATIONS.keys())
-        print(f"Current formation: {user.formation}")
+        echo(f"Current formation: {user.formation}")
         for i, formation in enumerate(formations, 1):
             marker = " (current)" if formation == user.formation else ""
-            print(f"  {i}) {formation}{marker}")
+            echo(f"  {i}) {formation}{marker}")
         choice = prompt_int(f"Pick a formation (1-{len(formations)}): ", 1, len(formations)) - 1
         selected = formations[choice]
         if selected == user.formation:
-            print(f"{user.name} already lines up in a {selected}. No changes made.")
+            echo(f"{user.name} already lines up in a {selected}. No changes made.")
         else:
             user.formation = selected
             organize_squad(user)
-            print(f"{user.name} will now play a {selected}. Squad reorganized to match the new shape.")
+            echo(f"{user.name} will now play a {selected}. Squad reorganized to match the new shape.")
         return "again"
     return _inner
 
@@ -95,27 +97,29 @@ def action_manage_no_poach(user, organize_squad):
                     roster.append((group_name, player))
 
             if not roster:
-                print("\nYou currently have no players to protect.")
+                echo("\nYou currently have no players to protect.")
                 break
 
             protected = getattr(user, "poach_protected", [])
-            print(f"\nProtection slots used: {len(protected)}/3")
+            echo(f"\nProtection slots used: {len(protected)}/3")
             if protected:
-                print("Currently protected:")
+                echo("Currently protected:")
                 for p in protected:
                     flag = p.flag() if hasattr(p, "flag") else f"({p.nation})"
-                    print(f"  - {p.name} {flag} {p.pos} {p.rating} OVR")
+                    echo(f"  - {p.name} {flag} {p.pos} {p.rating} OVR")
             else:
-                print("No players are protected right now.")
+                echo("No players are protected right now.")
 
-            print("\nToggle protection for a player (0 to finish):")
+            echo("\nToggle protection for a player (0 to finish):")
+            rows = []
             for idx, (group_name, player) in enumerate(roster, 1):
                 flag = player.flag() if hasattr(player, "flag") else f"({player.nation})"
                 marker = "*" if player in protected else " "
-                print(
+                rows.append(
                     f"  {idx:>2}. [{marker}] {group_name:<8} {player.pos:<3} "
                     f"{player.name:<25} {flag}  {player.rating:>2} OVR  {player.age:>2}y"
                 )
+            echo_lines(rows)
 
             choice = prompt_int(f"Select (0..{len(roster)}): ", 0, len(roster))
             if choice == 0:
@@ -126,20 +130,20 @@ def action_manage_no_poach(user, organize_squad):
             if picked in protected:
                 if hasattr(user, "unprotect_player"):
                     user.unprotect_player(picked)
-                print(f"Removed protection from {picked.name}.")
+                echo(f"Removed protection from {picked.name}.")
             else:
                 if len(protected) >= 3:
-                    print("You already protect 3 players. Remove someone before adding another.")
+                    echo("You already protect 3 players. Remove someone before adding another.")
                 else:
                     if hasattr(user, "protect_player"):
                         user.protect_player(picked)
-                    print(f"{picked.name} is now protected from poaching.")
+                    echo(f"{picked.name} is now protected from poaching.")
         protected = getattr(user, "poach_protected", [])
         if protected:
             names = ", ".join(p.name for p in protected)
-            print(f"\nFinal protected list: {names}.")
+            echo(f"\nFinal protected list: {names}.")
         else:
-            print("\nNo players are currently protected.")
+            echo("\nNo players are currently protected.")
         return "again"
     return _inner
 
@@ -149,37 +153,44 @@ def action_transfer_hub(user, teams, TM_OPEN, TM_CLOSE,
                         prev_table=None):
     def _inner():
         print_subtitle(f"Transfer Window: {TM_OPEN.isoformat()} → {TM_CLOSE.isoformat()}")
-        fa = make_free_agent_pool()
+        with timer.phase("hub.free_agent_pool"):
+            fa = make_free_agent_pool()
         poach_premium_rate = 0.15
-        champion_poach_user(prev_table, user, premium_rate=poach_premium_rate)
-        user_poach_players(user, teams, premium_rate=poach_premium_rate)
+        with timer.phase("hub.champion_poach"):
+            champion_poach_user(prev_table, user, premium_rate=poach_premium_rate)
+        with timer.phase("hub.user_poach"):
+            user_poach_players(user, teams, premium_rate=poach_premium_rate)
         order = teams[:]
-        random.shuffle(order)
+        streams.random("transfers").shuffle(order)
 
-        user_transfers(user, fa)
+        with timer.phase("hub.user_transfers"):
+            user_transfers(user, fa)
 
-        for t in order:
-            if t is user:
+        with timer.phase("hub.ai_transfers"):
+            for t in order:
+                if t is user:
+                    organize_squad(t)
+                    continue
+                ai_transfers(t, fa)
                 organize_squad(t)
-                continue
-            ai_transfers(t, fa)
-            organize_squad(t)
-            trim_ai_reserves(t)
+                trim_ai_reserves(t)
         return "back"
     return _inner
 
 def action_continue(user, teams, champion_poach_user, organize_squad, prev_table=None):
     def _inner():
-        champion_poach_user(prev_table, user, top_chance=0.20, bottom_chance=0.20, premium_rate=0.20)
-        for t in teams:
-            organize_squad(t)
+        with timer.phase("continue.champion_poach"):
+            champion_poach_user(prev_table, user, top_chance=0.20, bottom_chance=0.20, premium_rate=0.20)
+        with timer.phase("continue.organize"):
+            for t in teams:
+                organize_squad(t)
         return "back"
     return _inner
 
 def preseason_loop(user, teams, TM_OPEN, TM_CLOSE,
                    make_free_agent_pool, champion_poach_user, user_poach_players,
                    ai_transfers, user_transfers, organize_squad, trim_ai_reserves,
-                   prev_table=None):
+                   prev_table=None, after_action=None):
     options = [
         ("See Squad / End Contracts", action_view_squad(user, organize_squad)),
         ("Set No-Poach Clauses", action_manage_no_poach(user, organize_squad)),
@@ -192,4 +203,4 @@ def preseason_loop(user, teams, TM_OPEN, TM_CLOSE,
         )),
         ("Continue to next season", action_continue(user, teams, champion_poach_user, organize_squad, prev_table)),
     ]
-    run_menu("Preseason Menu", options)
+    run_menu("Preseason Menu", options, after_action=after_action)
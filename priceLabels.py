@@ -0,0 +1,168 @@
+import atexit
+import csv
+import os
+
+import numpy as np
+import pandas as pd
+
+from playerCost import FEATURES, model
+
+try:
+    import fcntl
+except ImportError:  # no advisory locks on Windows; single-process use only
+    fcntl = None
+
+# User price labels from the survey. Rows are buffered and appended to the CSV in
+# batches; the survey flushes at the end of each round, and atexit is only a backstop.
+# Alongside the CSV, <name>.agg.npz keeps count, mean and M2 (sum of squared deviations)
+# of the user price for every (age, rating) cell, so training sets and drift reports
+# cost O(grid) however long the CSV grows. Each flush locks the files,
+# merges its rows into whatever is on disk (other hosted sessions may have flushed
+# meanwhile) and records the CSV size it covers; an aggregate that does not match the
+# CSV (missing, or left behind by a crash) is rebuilt from the CSV once.
+CSV_HEADER = ["timestamp", "team", "year", "rating", "age", "model_value_M", "user_price_M"]
+AGES = np.arange(15, 46)
+RATINGS = np.arange(40, 100)
+
+
+def _empty():
+    shape = (len(AGES), len(RATINGS))
+    return np.zeros(shape, dtype=np.int64), np.zeros(shape), np.zeros(shape)
+
+
+def _cells(ages, ratings, prices):
+    """(count, mean, m2) grids for raw labels; labels outside the grid are dropped."""
+    a = np.asarray(ages, dtype=np.int64) - AGES[0]
+    r = np.asarray(ratings, dtype=np.int64) - RATINGS[0]
+    x = np.asarray(prices, dtype=float)
+    keep = (a >= 0) & (a < len(AGES)) & (r >= 0) & (r < len(RATINGS))
+    idx = a[keep] * len(RATINGS) + r[keep]
+    size = len(AGES) * len(RATINGS)
+    count = np.bincount(idx, minlength=size)
+    total = np.bincount(idx, weights=x[keep], minlength=size)
+    mean = np.divide(total, count, out=np.zeros(size), where=count > 0)
+    m2 = np.bincount(idx, weights=(x[keep] - mean[idx]) ** 2, minlength=size)
+    shape = (len(AGES), len(RATINGS))
+    return count.reshape(shape), mean.reshape(shape), m2.reshape(shape)
+
+
+def _merge(a, b):
+    """Combine two (count, mean, m2) aggregates (Chan et al. parallel variance)."""
+    na, ma, sa = a
+    nb, mb, sb = b
+    n = na + nb
+    delta = mb - ma
+    share = np.divide(nb, n, out=np.zeros(n.shape), where=n > 0)
+    return n, ma + delta * share, sa + sb + delta ** 2 * na * share
+
+
+class LabelStore:
+    def __init__(self, csv_path="price_labels.csv", flush_every=32):
+        self.csv_path = csv_path
+        self.agg_path = os.path.splitext(csv_path)[0] + ".agg.npz"
+        self.flush_every = flush_every
+        self.pending = []
+
+    def add(self, team, year, rating, age, model_value, user_price, timestamp=""):
+        self.pending.append([timestamp, team, "" if year is None else year,
+                             rating, age, model_value, user_price])
+        if len(self.pending) >= self.flush_every:
+            self.flush()
+
+    # ---------- disk ----------
+    def _load(self):
+        """(count, mean, m2) and the CSV size they cover; empty if no aggregate yet."""
+        if not os.path.exists(self.agg_path):
+            return _empty(), 0
+        with np.load(self.agg_path) as f:
+            return (f["count"], f["mean"], f["m2"]), int(f["csv_bytes"])
+
+    def _save(self, agg, csv_bytes):
+        tmp = self.agg_path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, count=agg[0], mean=agg[1], m2=agg[2], csv_bytes=csv_bytes)
+        os.replace(tmp, self.agg_path)
+
+    def _rebuild(self):
+        if not os.path.exists(self.csv_path):
+            return _empty()
+        ages, ratings, prices = [], [], []
+        with open(self.csv_path, newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    ages.append(int(row["age"]))
+                    ratings.append(int(row["rating"]))
+                    prices.append(float(row["user_price_M"]))
+                except (KeyError, TypeError, ValueError):
+                    continue  # torn or hand-edited line
+        return _cells(ages, ratings, prices)
+
+    def _locked(self):
+        lock = open(self.csv_path + ".lock", "a")
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock  # closing it releases the lock
+
+    def flush(self):
+        """Append buffered rows to the CSV and fold them into the aggregate."""
+        if not self.pending:
+            return
+        rows, self.pending = self.pending, []
+        with self._locked():
+            agg, covered = self._load()
+            size = os.path.getsize(self.csv_path) if os.path.exists(self.csv_path) else 0
+            if covered != size:
+                agg = self._rebuild()
+            with open(self.csv_path, "a", newline="") as f:
+                writer = csv.writer(f)
+                if not size:
+                    writer.writerow(CSV_HEADER)
+                writer.writerows(rows)
+            ages, ratings, prices = zip(*((r[4], r[3], r[6]) for r in rows))
+            agg = _merge(agg, _cells(ages, ratings, prices))
+            self._save(agg, os.path.getsize(self.csv_path))
+
+    # ---------- queries ----------
+    def aggregate(self):
+        """(count, mean, var) grids over AGES x RATINGS, unflushed rows included."""
+        agg, _ = self._load()
+        if self.pending:
+            agg = _merge(agg, _cells(*zip(*((r[4], r[3], r[6]) for r in self.pending))))
+        count, mean, m2 = agg
+        var = np.divide(m2, count - 1, out=np.zeros(count.shape), where=count > 1)
+        return count, mean, var
+
+    def training_set(self, min_count=1):
+        """One row per labelled cell: age, rating, mean user price (price_M), count, var."""
+        count, mean, var = self.aggregate()
+        a, r = np.nonzero(count >= min_count)
+        return pd.DataFrame({"age": AGES[a], "rating": RATINGS[r], "price_M": mean[a, r],
+                             "count": count[a, r], "var": var[a, r]})
+
+    def drift_report(self, min_count=1):
+        """training_set plus the current model's estimate and the gap per cell, largest gaps first."""
+        cells = self.training_set(min_count)
+        if cells.empty:
+            return cells.assign(model_M=[], drift_M=[])
+        cells["model_M"] = np.maximum(np.rint(model.predict(cells[FEATURES])), 1)
+        cells["drift_M"] = cells["price_M"] - cells["model_M"]
+        return cells.sort_values("drift_M", key=np.abs, ascending=False, ignore_index=True)
+
+
+_stores = {}
+
+
+def label_store(csv_path="price_labels.csv"):
+    """The process-wide store for `csv_path`."""
+    store = _stores.get(csv_path)
+    if store is None:
+        store = _stores[csv_path] = LabelStore(csv_path)
+    return store
+
+
+def flush_all():
+    for store in _stores.values():
+        store.flush()
+
+
+atexit.register(flush_all)
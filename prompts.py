@@ -1,9 +1,47 @@
+from typing import Callable, Optional
+
+from terminal import echo, flush
+
+InputProvider = Callable[[str], str]
+_input_provider: Optional[InputProvider] = None
+
+
+def set_input_provider(provider: Optional[InputProvider]) -> None:
+    """Route every prompt through `provider(msg) -> str` instead of input(); None restores input()."""
+    global _input_provider
+    _input_provider = provider
+
+
+def read_input(msg):
+    flush()
+    if _input_provider is not None:
+        return _input_provider(msg)
+    return input(msg)
+
+
 def prompt_int(msg, lo, hi):
     while True:
+        raw = read_input(msg)
         try:
-            v = int(input(msg))
+            v = int(raw)
             if lo <= v <= hi:
                 return v
-        except Exception:
+        except ValueError:
             pass
-        print(f"Enter a number between {lo} and {hi}.")
\ No newline at end of file
+        echo(f"Enter a number between {lo} and {hi}.")
+
+
+def prompt_choice(msg, lo, hi, commands=()):
+    """Like prompt_int, but also accepts one of the given single-word commands."""
+    while True:
+        raw = read_input(msg).strip().lower()
+        if raw in commands:
+            return raw
+        try:
+            v = int(raw)
+            if lo <= v <= hi:
+                return v
+        except ValueError:
+            pass
+        extra = f" or one of: {', '.join(commands)}" if commands else ""
+        echo(f"Enter a number between {lo} and {hi}{extra}.")
@@ -1,6 +1,8 @@
-import random
 from typing import Optional, Set
 
+from instrumentation import calls
+from rngStreams import streams
+
 NAME_BANK = {
     "France": {
         "male": ["Lucas","Hugo","Louis","Jules","Adam","Noah","Nathan","Gabriel","Ethan","Tom",
@@ -112,13 +114,15 @@ NAME_BANK = {
 _SYLL = ["al","an","ar","be","da","di","en","el","fa","jo","ka","li","ma","mo","ni","ra","ro","sa","ti","ul","vi"]
 
 def _spanish_double_surnames(last_list):
-    a, b = random.sample(last_list, 2)
+    rng = streams.random("names")
+    a, b = rng.sample(last_list, 2)
     return f"{a} {b}"
 
 def _dutch_with_prefix(last_list, prefixes):
-    last = random.choice(last_list)
-    if random.random() < 0.4 and prefixes:
-        return f"{random.choice(prefixes)} {last}"
+    rng = streams.random("names")
+    last = rng.choice(last_list)
+    if rng.random() < 0.4 and prefixes:
+        return f"{rng.choice(prefixes)} {last}"
     return last
 
 def _ensure_unique(name: str, used_names: Optional[Set[str]]) -> str:
@@ -133,18 +137,20 @@ def _ensure_unique(name: str, used_names: Optional[Set[str]]) -> str:
     return out
 
 def random_name(nation: str, used_names: Optional[Set[str]] = None) -> str:
+    calls["random_name"] += 1
+    rng = streams.random("names")
     bank = NAME_BANK.get(nation)
     if not bank:
-        name = ("X " + "".join(random.choice(_SYLL) for _ in range(2))).title()
+        name = ("X " + "".join(rng.choice(_SYLL) for _ in range(2))).title()
         return _ensure_unique(name, used_names)
 
-    first = random.choice(bank["male"])
+    first = rng.choice(bank["male"])
     if nation in {"Spain","Chile","Colombia","Argentina","Uruguay"}:
         last = _spanish_double_surnames(bank["last"])
     elif nation == "Netherlands":
         last = _dutch_with_prefix(bank["last"], bank.get("prefix", []))
     else:
-        last = random.choice(bank["last"])
+        last = rng.choice(bank["last"])
 
     full = f"{last} {first}" if bank.get("order") == "family_first" else f"{first} {last}"
     return _ensure_unique(full, used_names)
\ No newline at end of file
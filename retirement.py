@@ -1,9 +1,10 @@
-import random
+from rngStreams import streams
 
 def season_end_retirements(teams):
+    rng = streams.random("retirement")
     for t in teams:
         for p in t.all_players():
-            if p.age >= 39 or (p.age > 34 and random.random() < 0.5):
+            if p.age >= 39 or (p.age > 34 and rng.random() < 0.5):
                 p.retiring_notice = True
                 if not p.name.startswith("RET "):
                     p.name = "RET " + p.name
@@ -0,0 +1,75 @@
+import random
+import zlib
+
+import numpy as np
+
+# Independent, seedable random streams per subsystem. Every stream is a child of one
+# root SeedSequence, keyed by the subsystem's name rather than by creation order, so
+# adding draws to (or a new stream for) one subsystem never shifts another's numbers:
+# changing transfer logic leaves match results from the same seed untouched.
+#
+#   streams.seed(1234)
+#   rng = streams.random("injuries")       # random.Random for scalar draws
+#   gen = streams.generator("matches")     # numpy Generator for batched draws
+#
+# Subsystems in use: league, players, names, injuries, transfers, economy, matches,
+# retirement, board, survey, lookahead.
+
+
+def _key(name):
+    return zlib.crc32(name.encode("utf-8"))
+
+
+class RNGRegistry:
+    def __init__(self, seed=None):
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Reset every stream. seed=None draws fresh OS entropy; returns the root entropy."""
+        self.root = np.random.SeedSequence(seed)
+        self._generators = {}
+        self._randoms = {}
+        return self.root.entropy
+
+    def sequence(self, name, *path):
+        """The SeedSequence behind stream `name` (extra path items give sub-streams)."""
+        return np.random.SeedSequence(self.root.entropy,
+                                      spawn_key=self.root.spawn_key + (_key(name),) + path)
+
+    def generator(self, name):
+        gen = self._generators.get(name)
+        if gen is None:
+            gen = self._generators[name] = np.random.default_rng(self.sequence(name, 0))
+        return gen
+
+    def random(self, name):
+        """stdlib Random on its own branch of `name`: cheaper than numpy for single draws."""
+        rng = self._randoms.get(name)
+        if rng is None:
+            state = self.sequence(name, 1).generate_state(4, np.uint64)
+            rng = self._randoms[name] = random.Random(int.from_bytes(state.tobytes(), "little"))
+        return rng
+
+    def spawn(self, name, n):
+        """n further independent Generators under `name`, e.g. one per worker process."""
+        return [np.random.default_rng(s) for s in self.sequence(name, 2).spawn(n)]
+
+    # ---- bulk draws on a subsystem's Generator ----
+    def randint(self, name, lo, hi, size):
+        """Integers in [lo, hi], both inclusive like random.randint."""
+        return self.generator(name).integers(lo, hi + 1, size=size)
+
+    def uniform(self, name, size, lo=0.0, hi=1.0):
+        return self.generator(name).uniform(lo, hi, size=size)
+
+    def chance(self, name, p, size):
+        """Boolean array, True with probability p (scalar or array)."""
+        return self.generator(name).random(size) < p
+
+    def pick(self, name, seq, size):
+        """`size` items of seq drawn uniformly with replacement."""
+        idx = self.generator(name).integers(0, len(seq), size=size)
+        return [seq[i] for i in idx.tolist()]
+
+
+streams = RNGRegistry()
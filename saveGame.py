@@ -0,0 +1,233 @@
+import os
+import struct
+import zlib
+from datetime import date
+
+import numpy as np
+
+from models.player import Player
+from models.team import Team
+
+# File layout (little endian):
+#   magic "MLSM" | u16 version | u32 zlib-compressed body length | u64 generation | body
+# Body = header struct, interned string table, then fixed-order typed columns.
+# The generation ties a snapshot to the journal written on top of it (saveJournal).
+MAGIC = b"MLSM"
+VERSION = 2
+
+
+def save_path():
+    """The career save file, $MLSM_SAVE read now (sessionServer sets it per session)."""
+    return os.environ.get("MLSM_SAVE", os.path.join("data", "career.mlsm"))
+
+
+DEFAULT_SAVE_PATH = save_path()  # as of import; main asks save_path() at start
+
+_HEAD = struct.Struct("<4sHIQ")
+_BODY_HEAD = struct.Struct("<iiIIIII")  # year, user_idx, teams, players, origins, protected, prev_table
+
+GROUPS = ("starters", "bench", "reserves")
+_FLAG_RETIRING = 1
+_FLAG_SHOW_POT = 2
+
+TEAM_COLUMNS = [
+    ("name", "<u4"), ("stadium", "<u4"), ("formation", "<u4"),
+    ("avg_target", "<i2"), ("budget", "<i8"), ("objective", "<i2"),
+    ("points", "<i4"), ("gf", "<i4"), ("ga", "<i4"), ("top3_streak", "<i2"),
+    ("user_manager_seasons", "<i2"), ("user_manager_objective_met", "u1"),
+    ("origin_count", "<u2"), ("protected_count", "<u2"),
+]
+PLAYER_COLUMNS = [
+    ("team", "<u4"), ("group", "u1"), ("name", "<u4"), ("pos", "<u4"), ("nation", "<u4"),
+    ("age", "<i2"), ("rating", "<i2"), ("potential", "<i2"), ("injured_until", "<i4"), ("flags", "u1"),
+]
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+class _Strings:
+    """Interns strings so names, positions and nations are stored once."""
+    def __init__(self):
+        self.index = {}
+        self.items = []
+
+    def __call__(self, s):
+        sid = self.index.get(s)
+        if sid is None:
+            sid = self.index[s] = len(self.items)
+            self.items.append(s)
+        return sid
+
+    def encode(self):
+        blob = "\0".join(self.items).encode("utf-8")
+        return struct.pack("<II", len(self.items), len(blob)) + blob
+
+
+def _iter_roster(teams):
+    for ti, t in enumerate(teams):
+        for gi, group in enumerate(GROUPS):
+            for p in getattr(t, group):
+                yield ti, gi, p
+
+
+def league_players(teams):
+    """Every rostered player in save order (team, then starters/bench/reserves)."""
+    return [p for _, _, p in _iter_roster(teams)]
+
+
+def encode_league(teams, user, year, prev_table=None, generation=0):
+    """Serialize league state to bytes (see module header for layout)."""
+    strings = _Strings()
+    players = list(_iter_roster(teams))
+    player_idx = {id(p): i for i, (_, _, p) in enumerate(players)}
+    team_idx = {id(t): i for i, t in enumerate(teams)}
+
+    origins, protected = [], []
+    for t in teams:
+        t.cleanup_poach_protected()
+        origins += [strings(o) for o in t.origins]
+        protected += [player_idx[id(p)] for p in t.poach_protected]
+    tc = {
+        "name": [strings(t.name) for t in teams],
+        "stadium": [strings(t.stadium) for t in teams],
+        "formation": [strings(t.formation) for t in teams],
+        "origin_count": [len(t.origins) for t in teams],
+        "protected_count": [len(t.poach_protected) for t in teams],
+    }
+    for field in ("avg_target", "budget", "objective", "points", "gf", "ga",
+                  "top3_streak", "user_manager_seasons", "user_manager_objective_met"):
+        tc[field] = [getattr(t, field) for t in teams]
+
+    pc = {
+        "team": [ti for ti, _, _ in players],
+        "group": [gi for _, gi, _ in players],
+        "name": [strings(p.name) for _, _, p in players],
+        "pos": [strings(p.pos) for _, _, p in players],
+        "nation": [strings(p.nation) for _, _, p in players],
+        "age": [p.age for _, _, p in players],
+        "rating": [p.rating for _, _, p in players],
+        "potential": [p.potential for _, _, p in players],
+        "injured_until": [p.injured_until.toordinal() if p.injured_until else 0 for _, _, p in players],
+        "flags": [(_FLAG_RETIRING if p.retiring_notice else 0)
+                  | (_FLAG_SHOW_POT if getattr(p, "display_potential_range", False) else 0)
+                  for _, _, p in players],
+    }
+
+    table = [team_idx[id(t)] for t in (prev_table or [])]
+    parts = [
+        _BODY_HEAD.pack(year, team_idx.get(id(user), -1), len(teams), len(players),
+                        len(origins), len(protected), len(table)),
+        strings.encode(),
+    ]
+    parts += [np.asarray(tc[field], dtype=dtype).tobytes() for field, dtype in TEAM_COLUMNS]
+    parts += [np.asarray(origins, dtype="<u4").tobytes(), np.asarray(protected, dtype="<u4").tobytes()]
+    parts += [np.asarray(pc[field], dtype=dtype).tobytes() for field, dtype in PLAYER_COLUMNS]
+    parts.append(np.asarray(table, dtype="<u4").tobytes())
+
+    body = zlib.compress(b"".join(parts), 1)
+    return _HEAD.pack(MAGIC, VERSION, len(body), generation) + body
+
+
+def decode_league(data):
+    """Inverse of encode_league: returns (teams, user, year, prev_table)."""
+    try:
+        return _decode_league(data)
+    except SaveFormatError:
+        raise
+    except (zlib.error, struct.error, IndexError, ValueError) as exc:
+        # truncated or corrupted file: short buffers, bad deflate data, indices out of range
+        raise SaveFormatError(f"Corrupt save file ({exc}).") from exc
+
+
+def save_generation(data):
+    """Generation id stored in the header of an encoded save."""
+    try:
+        magic, version, _, generation = _HEAD.unpack_from(data, 0)
+    except struct.error as exc:
+        raise SaveFormatError(f"Corrupt save file ({exc}).") from exc
+    if magic != MAGIC:
+        raise SaveFormatError("Not an MLSoccerMode save file.")
+    if version != VERSION:
+        raise SaveFormatError(f"Unsupported save version {version} (expected {VERSION}).")
+    return generation
+
+
+def _decode_league(data):
+    save_generation(data)
+    _, _, length, _ = _HEAD.unpack_from(data, 0)
+    body = zlib.decompress(data[_HEAD.size:_HEAD.size + length])
+
+    year, user_idx, n_teams, n_players, n_origins, n_protected, n_table = _BODY_HEAD.unpack_from(body, 0)
+    off = _BODY_HEAD.size
+    n_strings, blob_len = struct.unpack_from("<II", body, off)
+    off += 8
+    strings = body[off:off + blob_len].decode("utf-8").split("\0") if n_strings else []
+    off += blob_len
+
+    def take(dtype, n):
+        nonlocal off
+        arr = np.frombuffer(body, dtype=dtype, count=n, offset=off)
+        off += arr.nbytes
+        return arr
+
+    tc = {field: take(dtype, n_teams).tolist() for field, dtype in TEAM_COLUMNS}
+    origins = take("<u4", n_origins).tolist()
+    protected = take("<u4", n_protected).tolist()
+    pc = {field: take(dtype, n_players).tolist() for field, dtype in PLAYER_COLUMNS}
+    table = take("<u4", n_table).tolist()
+
+    teams = []
+    o_cursor = 0
+    for i in range(n_teams):
+        t = Team({
+            "name": strings[tc["name"][i]], "avg": tc["avg_target"][i], "budget": tc["budget"][i],
+            "objective": tc["objective"][i], "formation": strings[tc["formation"][i]],
+            "stadium": strings[tc["stadium"][i]],
+            "origins": [strings[s] for s in origins[o_cursor:o_cursor + tc["origin_count"][i]]],
+        })
+        o_cursor += tc["origin_count"][i]
+        for field in ("points", "gf", "ga", "top3_streak", "user_manager_seasons"):
+            setattr(t, field, tc[field][i])
+        t.user_manager_objective_met = bool(tc["user_manager_objective_met"][i])
+        teams.append(t)
+
+    players = []
+    for i in range(n_players):
+        rating, potential = pc["rating"][i], pc["potential"][i]
+        p = Player(strings[pc["name"][i]], strings[pc["pos"][i]], strings[pc["nation"][i]],
+                   pc["age"][i], rating, potential - rating)
+        injured = pc["injured_until"][i]
+        p.injured_until = date.fromordinal(injured) if injured else None
+        p.retiring_notice = bool(pc["flags"][i] & _FLAG_RETIRING)
+        p.display_potential_range = bool(pc["flags"][i] & _FLAG_SHOW_POT)
+        getattr(teams[pc["team"][i]], GROUPS[pc["group"][i]]).append(p)
+        players.append(p)
+
+    p_cursor = 0
+    for i, t in enumerate(teams):
+        t.poach_protected = [players[j] for j in protected[p_cursor:p_cursor + tc["protected_count"][i]]]
+        p_cursor += tc["protected_count"][i]
+
+    user = teams[user_idx] if user_idx >= 0 else None
+    prev_table = [teams[i] for i in table] or None
+    return teams, user, year, prev_table
+
+
+def save_league(path, teams, user, year, prev_table=None, generation=0):
+    """Write atomically so a crash mid-write never leaves a truncated save."""
+    data = encode_league(teams, user, year, prev_table, generation)
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+def load_league(path):
+    with open(path, "rb") as f:
+        return decode_league(f.read())
@@ -0,0 +1,263 @@
+import os
+import struct
+import zlib
+from datetime import date
+
+from models.player import Player
+from saveGame import (GROUPS, SaveFormatError, _FLAG_RETIRING, _FLAG_SHOW_POT,
+                      decode_league, league_players, save_generation, save_league, save_path)
+
+# Journal = header, then a sequence of frames appended after the last snapshot:
+#   header: magic "MLSJ" | u64 generation of the snapshot it extends
+#   frame:  u32 payload length | u32 crc32(payload) | zlib(payload)
+# A payload is a batch of ops. Each checkpoint diffs the live league against what
+# the journal already holds, so only changed teams, players and rosters are written.
+# A torn final frame (crash mid-write) fails its CRC and is ignored on recovery.
+# Compaction replaces the snapshot before the journal; a crash in between leaves an
+# old journal whose generation no longer matches, and recovery discards it.
+JOURNAL_MAGIC = b"MLSJ"
+_JOURNAL_HEAD = struct.Struct("<4sQ")
+_FRAME = struct.Struct("<II")
+
+OP_META, OP_TEAM, OP_NEW_PLAYER, OP_PLAYER, OP_ROSTER = range(5)
+PHASES = ("new", "preseason", "season")  # "new": season not started yet
+
+_META = struct.Struct("<iiBIH")         # year, user_idx, phase, cursor, prev_table count
+_TEAM = struct.Struct("<Iqiiihh?H")     # idx, budget, points, gf, ga, top3, tenure, met, protected count
+_PLAYER = struct.Struct("<IhhhiB")     # key, age, rating, potential, injured ordinal, flags
+_ROSTER = struct.Struct("<IBI")         # team, group, count
+
+
+def _pack_str(s):
+    raw = s.encode("utf-8")
+    return struct.pack("<H", len(raw)) + raw
+
+
+def _unpack_str(buf, off):
+    (n,) = struct.unpack_from("<H", buf, off)
+    off += 2
+    return buf[off:off + n].decode("utf-8"), off + n
+
+
+def _player_row(p):
+    flags = (_FLAG_RETIRING if p.retiring_notice else 0) | \
+            (_FLAG_SHOW_POT if getattr(p, "display_potential_range", False) else 0)
+    injured = p.injured_until.toordinal() if p.injured_until else 0
+    return p.name, p.age, p.rating, p.potential, injured, flags
+
+
+def _team_row(t, key_of):
+    return (t.budget, t.points, t.gf, t.ga, t.top3_streak, t.user_manager_seasons,
+            bool(t.user_manager_objective_met), t.formation,
+            tuple(key_of(p) for p in t.poach_protected))
+
+
+class Journal:
+    """
+    Crash-safe autosave: a full snapshot (saveGame) plus an append-only delta log.
+    Call checkpoint() at natural batch boundaries (a matchday, a preseason action);
+    every `compact_every` checkpoints the log is folded into a fresh snapshot, which
+    bounds both the journal size and the replay work on recovery.
+    """
+    def __init__(self, snapshot_path=None, journal_path=None, compact_every=24):
+        self.snapshot_path = snapshot_path or save_path()
+        self.journal_path = journal_path or self.snapshot_path + ".journal"
+        self.compact_every = compact_every
+        self.frames = 0
+        self.generation = 0
+        self._reset_baseline([])
+
+    # ---------- baseline bookkeeping ----------
+    def _reset_baseline(self, teams):
+        self.keys = {}        # id(player) -> (key, player); holding the player keeps id() stable
+        self.next_key = 0
+        self.players = {}     # key -> last written row
+        self.team_rows = {}
+        self.rosters = {}
+        self.meta = None
+        for p in league_players(teams):
+            self._key(p)
+            self.players[self.keys[id(p)][0]] = _player_row(p)
+        for i, t in enumerate(teams):
+            self.team_rows[i] = _team_row(t, self._key)
+            for gi, group in enumerate(GROUPS):
+                self.rosters[(i, gi)] = tuple(self._key(p) for p in getattr(t, group))
+
+    def _key(self, p):
+        entry = self.keys.get(id(p))
+        if entry is None:
+            entry = self.keys[id(p)] = (self.next_key, p)
+            self.next_key += 1
+        return entry[0]
+
+    # ---------- writing ----------
+    def compact(self, teams, user, year, prev_table=None, phase="new", cursor=0):
+        """Write a full snapshot and start an empty journal on top of it."""
+        self.generation = int.from_bytes(os.urandom(8), "little")
+        save_league(self.snapshot_path, teams, user, year, prev_table, self.generation)
+        self._start_journal()
+        self.frames = 0
+        self._reset_baseline(teams)
+        self._append(teams, user, year, prev_table, phase, cursor)
+
+    def checkpoint(self, teams, user, year, prev_table=None, phase="season", cursor=0):
+        if self.frames >= self.compact_every:
+            self.compact(teams, user, year, prev_table, phase, cursor)
+        else:
+            self._append(teams, user, year, prev_table, phase, cursor)
+
+    def _append(self, teams, user, year, prev_table, phase, cursor):
+        team_idx = {id(t): i for i, t in enumerate(teams)}
+        ops = []
+
+        meta = (year, team_idx.get(id(user), -1), PHASES.index(phase), cursor,
+                tuple(team_idx[id(t)] for t in (prev_table or [])))
+        if meta != self.meta:
+            self.meta = meta
+            ops.append(bytes([OP_META]) + _META.pack(*meta[:4], len(meta[4]))
+                       + struct.pack(f"<{len(meta[4])}H", *meta[4]))
+
+        for i, t in enumerate(teams):
+            for gi, group in enumerate(GROUPS):
+                for p in getattr(t, group):
+                    known = id(p) in self.keys
+                    key = self._key(p)
+                    row = _player_row(p)
+                    if not known:
+                        ops.append(bytes([OP_NEW_PLAYER]) + _PLAYER.pack(key, *row[1:])
+                                   + _pack_str(p.name) + _pack_str(p.pos) + _pack_str(p.nation))
+                    elif row != self.players.get(key):
+                        ops.append(bytes([OP_PLAYER]) + _PLAYER.pack(key, *row[1:]) + _pack_str(p.name))
+                    self.players[key] = row
+
+            for gi, group in enumerate(GROUPS):
+                keys = tuple(self._key(p) for p in getattr(t, group))
+                if keys != self.rosters.get((i, gi)):
+                    self.rosters[(i, gi)] = keys
+                    ops.append(bytes([OP_ROSTER]) + _ROSTER.pack(i, gi, len(keys))
+                               + struct.pack(f"<{len(keys)}I", *keys))
+
+            row = _team_row(t, self._key)
+            if row != self.team_rows.get(i):
+                self.team_rows[i] = row
+                protected = row[8]
+                ops.append(bytes([OP_TEAM]) + _TEAM.pack(i, *row[:7], len(protected))
+                           + struct.pack(f"<{len(protected)}I", *protected) + _pack_str(row[7]))
+
+        if not ops:
+            return
+        payload = zlib.compress(b"".join(ops), 1)
+        with open(self.journal_path, "ab") as f:
+            f.write(_FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+        self.frames += 1
+
+    def _start_journal(self):
+        """Atomically replace the journal with an empty one for the current generation."""
+        tmp = f"{self.journal_path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_JOURNAL_HEAD.pack(JOURNAL_MAGIC, self.generation))
+        os.replace(tmp, self.journal_path)
+
+    # ---------- recovery ----------
+    def recover(self):
+        """
+        Rebuild the league from snapshot + journal.
+        Returns (teams, user, year, prev_table, phase, cursor) or None if there is no save.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return None
+        with open(self.snapshot_path, "rb") as f:
+            snapshot = f.read()
+        self.generation = save_generation(snapshot)
+        teams, user, year, prev_table = decode_league(snapshot)
+        self._reset_baseline(teams)
+        phase, cursor = "new", 0
+        by_key = {key: p for key, p in self.keys.values()}
+
+        data = b""
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+        head = _JOURNAL_HEAD.pack(JOURNAL_MAGIC, self.generation)
+        if not data.startswith(head):
+            # missing, headerless, or left over from before the last compaction
+            self._start_journal()
+            data = head
+        off = len(head)
+        self.frames = 0
+        try:
+            while off + _FRAME.size <= len(data):
+                length, crc = _FRAME.unpack_from(data, off)
+                payload = data[off + _FRAME.size:off + _FRAME.size + length]
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    break  # torn tail from an interrupted write
+                off += _FRAME.size + length
+                self.frames += 1
+                year, user, prev_table, phase, cursor = self._replay(
+                    zlib.decompress(payload), teams, by_key, year, user, prev_table, phase, cursor)
+        except SaveFormatError:
+            raise
+        except (KeyError, IndexError, ValueError, struct.error, zlib.error) as exc:
+            raise SaveFormatError(f"Corrupt save journal ({exc}).") from exc
+
+        if off < len(data):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(off)
+        self.meta = (year, teams.index(user) if user in teams else -1, PHASES.index(phase), cursor,
+                     tuple(teams.index(t) for t in (prev_table or [])))
+        self.keys = {id(p): (key, p) for key, p in by_key.items()}
+        self.next_key = max(by_key, default=-1) + 1
+        self.players = {key: _player_row(p) for key, p in by_key.items()}
+        self.team_rows = {i: _team_row(t, self._key) for i, t in enumerate(teams)}
+        self.rosters = {(i, gi): tuple(self._key(p) for p in getattr(t, group))
+                        for i, t in enumerate(teams) for gi, group in enumerate(GROUPS)}
+        return teams, user, year, prev_table, phase, cursor
+
+    @staticmethod
+    def _replay(buf, teams, by_key, year, user, prev_table, phase, cursor):
+        off = 0
+        while off < len(buf):
+            op = buf[off]
+            off += 1
+            if op == OP_META:
+                year, user_idx, phase_code, cursor, n = _META.unpack_from(buf, off)
+                off += _META.size
+                order = struct.unpack_from(f"<{n}H", buf, off)
+                off += 2 * n
+                user = teams[user_idx] if user_idx >= 0 else None
+                prev_table = [teams[i] for i in order] or None
+                phase = PHASES[phase_code]
+            elif op in (OP_NEW_PLAYER, OP_PLAYER):
+                key, age, rating, potential, injured, flags = _PLAYER.unpack_from(buf, off)
+                off += _PLAYER.size
+                name, off = _unpack_str(buf, off)
+                if op == OP_NEW_PLAYER:
+                    pos, off = _unpack_str(buf, off)
+                    nation, off = _unpack_str(buf, off)
+                    by_key[key] = Player(name, pos, nation, age, rating, potential - rating)
+                p = by_key[key]
+                p.name, p.age, p.rating = name, age, rating
+                p.potential = potential
+                p.potential_range = p._assign_potential_range()
+                p.injured_until = date.fromordinal(injured) if injured else None
+                p.retiring_notice = bool(flags & _FLAG_RETIRING)
+                p.display_potential_range = bool(flags & _FLAG_SHOW_POT)
+            elif op == OP_ROSTER:
+                ti, gi, n = _ROSTER.unpack_from(buf, off)
+                off += _ROSTER.size
+                keys = struct.unpack_from(f"<{n}I", buf, off)
+                off += 4 * n
+                setattr(teams[ti], GROUPS[gi], [by_key[k] for k in keys])
+            elif op == OP_TEAM:
+                ti, budget, points, gf, ga, top3, tenure, met, n = _TEAM.unpack_from(buf, off)
+                off += _TEAM.size
+                protected = struct.unpack_from(f"<{n}I", buf, off)
+                off += 4 * n
+                t = teams[ti]
+                t.formation, off = _unpack_str(buf, off)
+                t.budget, t.points, t.gf, t.ga = budget, points, gf, ga
+                t.top3_streak, t.user_manager_seasons, t.user_manager_objective_met = top3, tenure, met
+                t.poach_protected = [by_key[k] for k in protected]
+            else:
+                raise SaveFormatError(f"Unknown journal op {op}.")
+        return year, user, prev_table, phase, cursor
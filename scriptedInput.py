@@ -0,0 +1,88 @@
+import random
+import re
+from collections import deque
+
+from terminal import DEBUG, log
+
+# Matches the range hint of every numeric prompt: "(1..12)", "(1–3)", "(1-3)", "(1–250M)"
+_RANGE = re.compile(r"\((\d+)\s*(?:\.\.|–|-)\s*(\d+)")
+
+
+class ScriptExhausted(Exception):
+    """Raised when a scripted session runs out of answers; ends the driven game loop."""
+
+
+class ScriptedInput:
+    """
+    Input provider for prompts.set_input_provider: replays `answers` in order, then
+    defers to `policy(msg)` (if any). Without a policy, running dry raises ScriptExhausted.
+    """
+    def __init__(self, answers=(), policy=None):
+        self.answers = deque(str(a) for a in answers)
+        self.policy = policy
+        self.prompts = 0
+
+    def __call__(self, msg):
+        if self.answers:
+            answer = self.answers.popleft()
+        elif self.policy is not None:
+            answer = str(self.policy(msg))
+        else:
+            raise ScriptExhausted(msg)
+        self.prompts += 1
+        log(DEBUG, "{}{}", msg, answer)
+        return answer
+
+
+class AutoManager:
+    """
+    Seeded policy that plays the interactive game: picks a club, visits random preseason
+    menu entries, answers yes/no prompts with probability `p_yes` and picks uniformly in
+    every numeric range. Raises ScriptExhausted once `seasons` preseasons have been played.
+    After `max_menu_actions` menu picks it closes the preseason with `close_with`.
+    Uses its own Random so the game's RNG stream is unaffected by policy decisions.
+    """
+    CONTINUE_OPTIONS = {4, 5}  # Transfer Hub and Continue both close the preseason menu
+
+    def __init__(self, seed=0, seasons=1, team=1, p_yes=0.35, max_menu_actions=4, close_with=5):
+        self.rng = random.Random(seed)
+        self.seasons = seasons
+        self.team = team
+        self.p_yes = p_yes
+        self.max_menu_actions = max_menu_actions
+        self.close_with = close_with
+        self.picked_team = False
+        self.played = 0
+        self.menu_actions = 0
+
+    def __call__(self, msg):
+        if msg.startswith("Resume saved career"):
+            return "n"
+        if "(y/n)" in msg:
+            return "y" if self.rng.random() < self.p_yes else "n"
+        if msg.startswith("Choice:"):
+            return self._menu()
+        m = _RANGE.search(msg)
+        if m:
+            lo, hi = int(m.group(1)), int(m.group(2))
+            if lo == 0 and self.rng.random() < 0.5:
+                return "0"
+            return str(self.rng.randint(max(lo, 1), hi) if hi >= 1 else lo)
+        return ""
+
+    def _menu(self):
+        if not self.picked_team:
+            # The first "Choice:" is the club pick
+            self.picked_team = True
+            return str(self.team)
+        if self.menu_actions >= self.max_menu_actions:
+            choice = self.close_with
+        else:
+            choice = self.rng.randint(1, 5)
+        self.menu_actions += 1
+        if choice in self.CONTINUE_OPTIONS:
+            self.played += 1
+            self.menu_actions = 0
+            if self.played > self.seasons:
+                raise ScriptExhausted(f"played {self.seasons} season(s)")
+        return str(choice)
@@ -0,0 +1,146 @@
+import os
+from bisect import bisect_left, insort
+from collections import namedtuple
+
+from injuries import recover_injuries
+from matchEngineSchedules import MATCH_MODELS, schedule_season, simulate_matchday
+from organizeSquad import organize_squad
+from rngStreams import streams
+from utils import season_dates
+
+# One played matchday. results: [(A, B, gA, gB), ...]; standings: ((team, points, gf, ga), ...)
+# in table order, copied at the time so later matchdays do not change it.
+Matchday = namedtuple("Matchday", "index date results standings")
+
+
+class Standings:
+    """
+    League table kept sorted as results come in. Each club has a key (-points, -GD, -GF,
+    index in `teams`): points, then goal difference, then goals for, with full ties left
+    in `teams` order. update() moves one club after its stats change; rank() and at()
+    are binary searches / index lookups.
+    """
+    def __init__(self, teams):
+        self.teams = list(teams)
+        self._index = {t: i for i, t in enumerate(self.teams)}
+        self._key = {t: self._make_key(t) for t in self.teams}
+        self._keys = sorted(self._key.values())
+
+    def _make_key(self, t):
+        return (-t.points, t.ga - t.gf, -t.gf, self._index[t])
+
+    def update(self, team):
+        old, new = self._key[team], self._make_key(team)
+        if old == new:
+            return
+        del self._keys[bisect_left(self._keys, old)]
+        insort(self._keys, new)
+        self._key[team] = new
+
+    def apply(self, results):
+        """Re-rank the clubs of [(A, B, gA, gB), ...] once their stats have been updated."""
+        for A, B, _, _ in results:
+            self.update(A)
+            self.update(B)
+
+    def rebuild(self):
+        """Resync after club stats were changed without update() (e.g. a season reset)."""
+        self._key = {t: self._make_key(t) for t in self.teams}
+        self._keys = sorted(self._key.values())
+
+    def rank(self, team):
+        """1-based table position."""
+        return bisect_left(self._keys, self._key[team]) + 1
+
+    def at(self, pos):
+        """Club at 1-based table position."""
+        return self.teams[self._keys[pos - 1][3]]
+
+    def table(self, n=None):
+        keys = self._keys if n is None else self._keys[:n]
+        return [self.teams[k[3]] for k in keys]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class Season:
+    """
+    A league season played as a stream of matchdays. iter_matchdays() plays one matchday
+    per step, so a consumer can show partial tables, stop once it has what it needs, or
+    drop the generator and pick up later from `cursor`. Club stats live on the Team
+    objects; together with to_dict() that is everything needed to resume elsewhere.
+    `model` picks the match engine (see MATCH_MODELS; default $MLSM_MATCH_MODEL or classic).
+    """
+    def __init__(self, teams, year, user=None, cursor=0, model=None):
+        self.model = model or os.environ.get("MLSM_MATCH_MODEL") or "classic"
+        if self.model not in MATCH_MODELS:
+            raise ValueError(f"unknown match model {self.model!r}; expected one of {MATCH_MODELS}")
+        self.teams = teams
+        self.year = year
+        self.user = user
+        self.cursor = cursor
+        _, _, _, self.start, self.end = season_dates(year)
+        self.matchdays = schedule_season(teams, self.start, self.end)
+        self.live = Standings(teams)
+        self.rng = streams.generator("matches")
+
+    @property
+    def finished(self):
+        return self.cursor >= len(self.matchdays)
+
+    def table(self):
+        return self.live.table()
+
+    def standings(self):
+        return tuple((t, t.points, t.gf, t.ga) for t in self.table())
+
+    def iter_matchdays(self, stop=None):
+        """
+        Play and yield the remaining matchdays (up to index `stop`). Closing the generator
+        or breaking out of the loop pauses the season after the last yielded matchday.
+        """
+        end = len(self.matchdays) if stop is None else min(stop, len(self.matchdays))
+        while self.cursor < end:
+            when, fixtures = self.matchdays[self.cursor]
+            for t in self.teams:
+                recover_injuries(t, when, is_user=(t is self.user))
+                organize_squad(t)
+            results = simulate_matchday(fixtures, when, self.rng, self.model)
+            self.live.apply(results)
+            self.cursor += 1
+            yield Matchday(self.cursor - 1, when, results, self.standings())
+
+    def play(self):
+        """Play every remaining matchday; returns the final table."""
+        for _ in self.iter_matchdays():
+            pass
+        return self.table()
+
+    def remaining_games(self):
+        left = {t: 0 for t in self.teams}
+        for _, fixtures in self.matchdays[self.cursor:]:
+            for A, B, _ in fixtures:
+                left[A] += 1
+                left[B] += 1
+        return left
+
+    def title_decided(self):
+        """True once no club can catch the leader on points, whatever the remaining results."""
+        table = self.table()
+        if len(table) < 2:
+            return True
+        left = self.remaining_games()
+        leader = table[0]
+        return all(t.points + 3 * left[t] < leader.points for t in table[1:])
+
+    def to_dict(self):
+        """Position in the season; pair it with a save of the teams to resume."""
+        return {"year": self.year, "cursor": self.cursor, "model": self.model,
+                "teams": [t.name for t in self.teams]}
+
+    @classmethod
+    def from_dict(cls, data, teams, user=None):
+        by_name = {t.name: t for t in teams}
+        ordered = [by_name[name] for name in data["teams"]]  # schedule depends on club order
+        return cls(ordered, data["year"], user, data["cursor"], data.get("model"))
@@ -0,0 +1,136 @@
+import os
+
+import numpy as np
+
+# Fixed-width records appended once per season. Files are plain arrays of these
+# dtypes, so queries memory-map them instead of loading every season into objects.
+# Text is stored as UTF-8; a value longer than its field is refused, never truncated.
+TABLE_DTYPE = np.dtype([
+    ("year", "<i2"), ("pos", "<u2"), ("team", "S32"), ("points", "<i2"),
+    ("gf", "<i2"), ("ga", "<i2"), ("budget", "<i8"), ("avg_rating", "<f4"), ("user", "?"),
+])
+PLAYER_DTYPE = np.dtype([
+    ("year", "<i2"), ("team", "S32"), ("name", "S48"), ("pos", "S3"), ("nation", "S16"),
+    ("age", "u1"), ("rating", "u1"), ("potential", "u1"),
+])
+
+
+def _text(value):
+    return value.decode("utf-8", errors="ignore")
+
+
+def _encode(values, dtype, field):
+    width = dtype[field].itemsize
+    out = [v.encode("utf-8") for v in values]
+    for v, raw in zip(values, out):
+        if len(raw) > width:
+            raise ValueError(f"{field} {v!r} is {len(raw)} bytes in UTF-8; the history field holds {width}")
+    return out
+
+
+class SeasonHistory:
+    def __init__(self, folder):
+        self.folder = folder
+        self.table_path = os.path.join(folder, "history_tables.bin")
+        self.players_path = os.path.join(folder, "history_players.bin")
+
+    def clear(self):
+        for path in (self.table_path, self.players_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    # ---------- writing ----------
+    def record_season(self, year, table, user=None):
+        """Append the final table and every rostered player's end-of-season line."""
+        seasons = self.tables()
+        if len(seasons) and seasons["year"][-1] >= year:
+            return  # already archived (e.g. resumed from a journal after the write)
+
+        rows = np.zeros(len(table), dtype=TABLE_DTYPE)
+        rows["year"] = year
+        rows["pos"] = np.arange(1, len(table) + 1)
+        rows["team"] = _encode([t.name for t in table], TABLE_DTYPE, "team")
+        rows["points"] = [t.points for t in table]
+        rows["gf"] = [t.gf for t in table]
+        rows["ga"] = [t.ga for t in table]
+        rows["budget"] = [t.budget for t in table]
+        rows["avg_rating"] = [t.avg_rating() for t in table]
+        rows["user"] = [t is user for t in table]
+
+        roster = [(t, p) for t in table for p in t.all_players()]
+        players = np.zeros(len(roster), dtype=PLAYER_DTYPE)
+        players["year"] = year
+        players["team"] = _encode([t.name for t, _ in roster], PLAYER_DTYPE, "team")
+        players["name"] = _encode([p.name for _, p in roster], PLAYER_DTYPE, "name")
+        players["pos"] = _encode([p.pos for _, p in roster], PLAYER_DTYPE, "pos")
+        players["nation"] = _encode([p.nation for _, p in roster], PLAYER_DTYPE, "nation")
+        players["age"] = [p.age for _, p in roster]
+        players["rating"] = [p.rating for _, p in roster]
+        players["potential"] = [p.potential for _, p in roster]
+
+        os.makedirs(self.folder, exist_ok=True)
+        # Players first: a crash between the two writes leaves no table row, so the
+        # season is retried; drop any orphaned player rows from that attempt.
+        self._truncate_players_from(year)
+        with open(self.players_path, "ab") as f:
+            f.write(players.tobytes())
+        with open(self.table_path, "ab") as f:
+            f.write(rows.tobytes())
+
+    def _truncate_players_from(self, year):
+        rows = self._map(self.players_path, PLAYER_DTYPE)
+        if not len(rows) or rows["year"][-1] < year:
+            return
+        keep = int(np.searchsorted(rows["year"], year))
+        del rows
+        with open(self.players_path, "r+b") as f:
+            f.truncate(keep * PLAYER_DTYPE.itemsize)
+
+    # ---------- reading ----------
+    @staticmethod
+    def _map(path, dtype):
+        if not os.path.exists(path):
+            return np.zeros(0, dtype=dtype)
+        n = os.path.getsize(path) // dtype.itemsize
+        if n == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(n,))
+
+    def tables(self):
+        return self._map(self.table_path, TABLE_DTYPE)
+
+    def players(self):
+        return self._map(self.players_path, PLAYER_DTYPE)
+
+    # ---------- queries ----------
+    def club_positions(self, team):
+        """[(year, position)] for every archived season of `team`."""
+        t = self.tables()
+        hit = t[t["team"] == team.encode("utf-8")]
+        return list(zip(hit["year"].tolist(), hit["pos"].tolist()))
+
+    def budget_trajectory(self, team):
+        t = self.tables()
+        hit = t[t["team"] == team.encode("utf-8")]
+        return list(zip(hit["year"].tolist(), hit["budget"].tolist()))
+
+    def champions(self):
+        t = self.tables()
+        hit = t[t["pos"] == 1]
+        return [(y, _text(n)) for y, n in zip(hit["year"].tolist(), hit["team"].tolist())]
+
+    def top_players(self, n=10, year=None):
+        """Highest single-season ratings ever (or in one season), best first."""
+        rows = self.players()
+        if year is not None:
+            rows = rows[rows["year"] == year]
+        if not len(rows):
+            return []
+        k = min(n, len(rows))
+        idx = np.argpartition(-rows["rating"].astype(np.int16), k - 1)[:k]
+        idx = idx[np.argsort(-rows["rating"][idx].astype(np.int16), kind="stable")]
+        return [
+            {"year": int(r["year"]), "team": _text(r["team"]), "name": _text(r["name"]),
+             "pos": _text(r["pos"]), "age": int(r["age"]), "rating": int(r["rating"])}
+            for r in rows[idx]
+        ]
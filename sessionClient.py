@@ -0,0 +1,69 @@
+"""
+Per-connection launcher for ttyd: hands this terminal to the session server and waits.
+Kept import-light (run with `python3 -S`) so a connection starts in milliseconds.
+Falls back to running main.py directly if no server is listening.
+
+The career to play is the first argument (ttyd -a: ?arg=<name>) or $MLSM_CAREER;
+without one the session is a guest whose save is discarded at the end.
+"""
+import os
+import signal
+import socket
+import struct
+import sys
+
+SOCKET_PATH = os.environ.get("MLSM_SOCKET", "/tmp/mlsm.sock")
+_STATUS = struct.Struct("<i")
+
+
+def _recv_int(sock):
+    data = b""
+    while len(data) < _STATUS.size:
+        chunk = sock.recv(_STATUS.size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return _STATUS.unpack(data)[0]
+
+
+def run_local():
+    here = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(here)
+    os.execv(sys.executable, [sys.executable, os.path.join(here, "main.py")])
+
+
+def main():
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(SOCKET_PATH)
+    except OSError:
+        run_local()
+
+    career = sys.argv[1] if len(sys.argv) > 1 else os.environ.get("MLSM_CAREER", "")
+    socket.send_fds(sock, [b"S" + career.encode("ascii", "replace")], [0, 1, 2])
+    pid = _recv_int(sock)
+    if pid == -2:
+        sys.stdout.write(f"Career {career!r} is already open in another session.\n")
+        sys.exit(1)
+    if pid is None or pid < 0:
+        sys.stdout.write("Server is full right now, please try again shortly.\n")
+        sys.exit(1)
+
+    # Ctrl-C and hang-ups reach this process (it owns the terminal); pass them on.
+    def forward(signum, _frame):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+        if signum in (signal.SIGHUP, signal.SIGTERM):
+            sys.exit(128 + signum)
+
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+        signal.signal(sig, forward)
+
+    status = _recv_int(sock)
+    sys.exit(1 if status is None else status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Pre-forked session server.
+
+The parent imports the game (pandas, scikit-learn, the pickled price model) once and
+listens on a Unix socket. Each ttyd connection runs the tiny sessionClient.py, which
+hands its terminal file descriptors to the server; the server forks a child that
+adopts those descriptors and runs main.main(). Children share the warmed interpreter
+and model copy-on-write instead of each re-importing and unpickling them.
+
+Every session saves into its own folder: data/sessions/<career>/ when the client
+names a career (one session at a time per career), else a temporary folder that is
+removed when the session ends.
+
+Usage:  python3 sessionServer.py            (socket: $MLSM_SOCKET or /tmp/mlsm.sock)
+"""
+import gc
+import os
+import re
+import shutil
+import signal
+import socket
+import struct
+import sys
+import tempfile
+
+SOCKET_PATH = os.environ.get("MLSM_SOCKET", "/tmp/mlsm.sock")
+MAX_SESSIONS = int(os.environ.get("MLSM_MAX_SESSIONS", "0"))  # 0 = unlimited
+SESSIONS_DIR = os.environ.get("MLSM_SESSIONS", os.path.join("data", "sessions"))
+_STATUS = struct.Struct("<i")
+FULL, BUSY = -1, -2  # refusals sent instead of a pid
+_CAREER = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def warm_up():
+    """Import everything a session needs and touch the model once."""
+    import main  # noqa: F401  (pulls in every game module)
+    from playerCost import est_cost_eur
+    est_cost_eur(25, 80)
+    # Move everything allocated so far out of the GC's reach so collections in the
+    # children do not write to (and un-share) these pages.
+    gc.collect()
+    gc.freeze()
+
+
+def _career(msg):
+    """Career name the client asked for (after the b"S" tag), or None for a guest."""
+    name = msg[1:].decode("ascii", "replace")
+    return name if _CAREER.fullmatch(name) else None
+
+
+def _save_folder(career):
+    """Where a session saves: the career's folder, or a fresh temporary one for a guest."""
+    if not career:
+        return tempfile.mkdtemp(prefix="mlsm-guest-")
+    folder = os.path.join(SESSIONS_DIR, career)
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+
+def _hang_up(signum, _frame):
+    # Closing the browser tab makes sessionClient forward SIGHUP; end like a normal
+    # exit so the session's buffers are flushed and a guest folder is removed.
+    raise SystemExit(128 + signum)
+
+
+def _run_session(conn, fds, ready, folder, guest):
+    """
+    Child side: run the game on the client's terminal, then report its exit status.
+    Never returns. Nothing is written to conn before the parent has sent our pid
+    there and signalled `ready`; if the parent gives up on the client instead, we exit.
+    """
+    status = 1
+    try:
+        if os.read(ready, 1) == b"\1":
+            status = _play(fds, folder, guest)
+            conn.sendall(_STATUS.pack(status))
+    except OSError:
+        pass  # client gone
+    finally:
+        os._exit(status)
+
+
+def _play(fds, folder, guest=False):
+    """Become the session's process and run main.main() saving into `folder`; returns its exit status."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    for sig in (signal.SIGHUP, signal.SIGTERM):
+        signal.signal(sig, _hang_up)
+    os.setsid()
+    for target, fd in enumerate(fds[:3]):
+        os.dup2(fd, target)
+    for fd in fds:
+        if fd > 2:
+            os.close(fd)
+    # The std streams were created for the server's own terminal; rebind them.
+    sys.stdin = os.fdopen(0, "r", encoding="utf-8", errors="replace", closefd=False)
+    sys.stdout = os.fdopen(1, "w", encoding="utf-8", errors="replace", closefd=False, buffering=1)
+    sys.stderr = os.fdopen(2, "w", encoding="utf-8", errors="replace", closefd=False, buffering=1)
+    os.environ["MLSM_SAVE"] = os.path.join(folder, "career.mlsm")
+
+    import main
+    from rngStreams import streams
+    streams.seed()  # main.main() reseeds too; never share the parent's streams
+    status = 0
+    try:
+        main.main()
+    except SystemExit as exc:
+        status = exc.code if isinstance(exc.code, int) else 0
+    except KeyboardInterrupt:
+        status = 130
+    except BaseException:
+        import traceback
+        traceback.print_exc()
+        status = 1
+    finally:
+        for sig in (signal.SIGHUP, signal.SIGTERM):
+            signal.signal(sig, signal.SIG_IGN)  # a second hang-up must not cut the cleanup short
+        from terminal import flush
+        from priceLabels import flush_all
+        flush()
+        flush_all()  # os._exit skips atexit
+        if guest:
+            shutil.rmtree(folder, ignore_errors=True)
+    return status
+
+
+def serve(path=SOCKET_PATH, max_sessions=MAX_SESSIONS):
+    warm_up()
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(64)
+
+    children = {}  # pid -> career name (None for guests)
+    careers = {}   # career name -> pid; single lookups stay safe while reap() runs
+    guests = {}    # pid -> temporary save folder, removed here too in case the child was killed
+
+    def reap(_signum=None, _frame=None):
+        while children:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                children.clear()
+                careers.clear()
+                return
+            if pid == 0:
+                return
+            careers.pop(children.pop(pid, None), None)
+            folder = guests.pop(pid, None)
+            if folder:
+                shutil.rmtree(folder, ignore_errors=True)
+
+    signal.signal(signal.SIGCHLD, reap)
+    print(f"MLSoccerMode session server ready on {path}", flush=True)
+
+    while True:
+        conn, _ = server.accept()
+        fds = []
+        try:
+            msg, fds, _, _ = socket.recv_fds(conn, 256, 3)
+            career = _career(msg)
+            if len(fds) < 3 or (max_sessions and len(children) >= max_sessions):
+                conn.sendall(_STATUS.pack(FULL))
+                continue
+            if career in careers:
+                conn.sendall(_STATUS.pack(BUSY))
+                continue
+
+            folder = _save_folder(career)
+            ready, go = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(go)
+                server.close()
+                _run_session(conn, fds, ready, folder, guest=not career)
+            os.close(ready)
+            children[pid] = career
+            if career:
+                careers[career] = pid
+            else:
+                guests[pid] = folder
+            try:
+                conn.sendall(_STATUS.pack(pid))
+                os.write(go, b"\1")  # pid is out; the child may now send its status
+            finally:
+                os.close(go)  # without the byte, the child exits without playing
+        except OSError:
+            pass  # the client hung up; drop it and keep serving
+        finally:
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1] if len(sys.argv) > 1 else SOCKET_PATH)
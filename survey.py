@@ -1,66 +1,60 @@
 # === Add these imports at top ===
-import csv, os
 from datetime import datetime
-import random
+from rngStreams import streams
 from prompts import prompt_int
 from playerCost import est_cost_eur
+from priceLabels import label_store
+from terminal import echo
 
 # === Add this helper (million-euro labeler + reward logic) ===
 def collect_price_labels(user, n=2, csv_path="price_labels.csv", year=None):
     """
     Ask the user to label realistic prices for n random players.
-    Stores rows: timestamp, team, year, rating, age, model_value, user_price.
+    Stores rows: timestamp, team, year, rating, age, model_value, user_price, through
+    the buffered label store for csv_path (see priceLabels).
     Outcome: 80% +€7M, 13% +€10M, 7% +3 potential to user's lowest-potential player.
     """
-    # Prepare CSV (write header if file doesn't exist)
-    new_file = not os.path.exists(csv_path)
-    with open(csv_path, "a", newline="") as f:
-        writer = csv.writer(f)
-        if new_file:
-            writer.writerow(["timestamp", "team", "year", "rating", "age", "model_value_M", "user_price_M"])
-
-        print("\nHelp improve the price model! Please give realistic market prices.\n"
-              "Consider real-world + FIFA/FC valuations.\n")
-
-        for i in range(1, n + 1):
-            rating = random.randint(69, 95)
-            age = random.randint(16, 34)
-
-            # Current model estimate (in millions) using your model function
-            model_val_M = est_cost_eur(age, rating)  # assumed to return "millions" like your budgets
-
-            print(f"\nPlayer #{i}")
-            print(f"  Rating: {rating}   Age: {age}")
-            print(f"  Model estimate: €{model_val_M:,}M")
-
-            user_price = prompt_int("Your price (1–250M): ", 1, 250)
-
-            writer.writerow([
-                datetime.utcnow().isoformat(timespec="seconds"),
-                getattr(user, "name", "UserTeam"),
-                year if year is not None else "",
-                rating,
-                age,
-                model_val_M,
-                user_price
-            ])
-        # === Reward / perk ===
-        roll = random.random()
-        if roll < 0.50:
-            user.receive(5)
-            print(f"\n🎁 Thanks! {user.name} receives €5M.")
-        elif roll < 0.90:
-            # 40% boost chance
-            squad = list(user.all_players())
-            if squad:
-                low = min(squad, key=lambda p: getattr(p, "potential", p.rating))
-                old_range = low.potential_range
-                low.apply_potential_boost(8)
-                print(
-                    f"\n✨ Development boost! {low.name}'s potential range is now revealed and improved: "
-                    f"{old_range} → {low.potential_range}"
-                )
-        else:
-            user.receive(15)
-            print(f"\n💰 Jackpot! {user.name} receives €10M.")
+    store = label_store(csv_path)
+    echo("\nHelp improve the price model! Please give realistic market prices.\n"
+         "Consider real-world + FIFA/FC valuations.\n")
+
+    rng = streams.random("survey")
+    for i in range(1, n + 1):
+        rating = rng.randint(69, 95)
+        age = rng.randint(16, 34)
+
+        # Current model estimate (in millions) using your model function
+        model_val_M = est_cost_eur(age, rating)  # assumed to return "millions" like your budgets
+
+        echo(f"\nPlayer #{i}")
+        echo(f"  Rating: {rating}   Age: {age}")
+        echo(f"  Model estimate: €{model_val_M:,}M")
+
+        user_price = prompt_int("Your price (1–250M): ", 1, 250)
+
+        store.add(getattr(user, "name", "UserTeam"), year, rating, age, model_val_M, user_price,
+                  timestamp=datetime.utcnow().isoformat(timespec="seconds"))
+    # One survey is a single interaction; write its labels now rather than hoping for
+    # atexit, which a hosted session killed on hang-up never reaches.
+    store.flush()
+
+    # === Reward / perk ===
+    roll = rng.random()
+    if roll < 0.50:
+        user.receive(5, "survey_reward")
+        echo(f"\n🎁 Thanks! {user.name} receives €5M.")
+    elif roll < 0.90:
+        # 40% boost chance
+        squad = list(user.all_players())
+        if squad:
+            low = min(squad, key=lambda p: getattr(p, "potential", p.rating))
+            old_range = low.potential_range
+            low.apply_potential_boost(8)
+            echo(
+                f"\n✨ Development boost! {low.name}'s potential range is now revealed and improved: "
+                f"{old_range} → {low.potential_range}"
+            )
+    else:
+        user.receive(15, "survey_reward")
+        echo(f"\n💰 Jackpot! {user.name} receives €10M.")
 
@@ -0,0 +1,93 @@
+import atexit
+import os
+import sys
+import time
+
+# Under ttyd every write to stdout becomes its own websocket frame. echo() collects
+# rendered lines and hands them to the terminal in one write when a prompt is about
+# to be shown, at PhaseTimer phase boundaries, after a SUMMARY-level message, or once
+# the buffer grows past FLUSH_BYTES / ages past FLUSH_SECONDS (checked on the next write).
+FLUSH_BYTES = 16 * 1024
+FLUSH_SECONDS = 0.05
+
+# Verbosity: a message is emitted when its level <= the current verbosity.
+SILENT, SUMMARY, NORMAL, DEBUG = range(4)
+LEVELS = {"silent": SILENT, "summary": SUMMARY, "normal": NORMAL, "debug": DEBUG}
+_verbosity = LEVELS.get(os.environ.get("MLSM_VERBOSITY", "normal").lower(), NORMAL)
+
+
+class TerminalBuffer:
+    def __init__(self, stream=None, max_bytes=FLUSH_BYTES, max_age=FLUSH_SECONDS):
+        self.stream = stream
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.parts = []
+        self.size = 0
+        self.since = None
+
+    def write(self, text):
+        if not self.parts:
+            self.since = time.monotonic()
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.max_bytes or time.monotonic() - self.since >= self.max_age:
+            self.flush()
+
+    def flush(self):
+        if not self.parts:
+            return
+        out = self.stream or sys.stdout
+        out.write("".join(self.parts))
+        out.flush()
+        self.parts.clear()
+        self.size = 0
+        self.since = None
+
+
+_buffer = TerminalBuffer()
+atexit.register(_buffer.flush)
+
+
+def set_verbosity(level):
+    """Accepts a level constant or its name ("silent", "summary", "normal", "debug")."""
+    global _verbosity
+    _verbosity = LEVELS[level.lower()] if isinstance(level, str) else level
+
+
+def enabled(level):
+    return level <= _verbosity
+
+
+def _emit(text, level):
+    _buffer.write(text)
+    if level <= SUMMARY:
+        _buffer.flush()  # headlines and tables are shown as soon as they are written
+
+
+def echo(*args, sep=" ", end="\n", level=NORMAL):
+    """Drop-in for print() that goes through the frame buffer."""
+    if level <= _verbosity:
+        _emit(sep.join(map(str, args)) + end, level)
+
+
+def echo_lines(lines, level=NORMAL):
+    """Render a whole table/listing with a single join. `lines` may be a generator;
+    it is not consumed when the level is muted."""
+    if level <= _verbosity:
+        _emit("\n".join(lines) + "\n", level)
+
+
+def log(level, fmt, *args, **kwargs):
+    """Lazily formatted message: fmt.format(...) only runs if the level is enabled."""
+    if level <= _verbosity:
+        _emit(fmt.format(*args, **kwargs) + "\n", level)
+
+
+def flush():
+    _buffer.flush()
+
+
+def set_stream(stream):
+    """Redirect terminal output (tests, headless runs); None restores sys.stdout."""
+    _buffer.flush()
+    _buffer.stream = stream
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from models.player import Player
+from models.team import Team
+from seasonHistory import PLAYER_DTYPE, TABLE_DTYPE, SeasonHistory
+
+
+def _club(name, player):
+    team = Team({"name": name, "avg": 80, "budget": 50, "objective": 5, "formation": "4-4-2",
+                 "stadium": "Ground", "origins": ["France"]})
+    team.starters = [player]
+    team.bench, team.reserves = [], []
+    return team
+
+
+def _fill(prefix, width):
+    # pads with ASCII up to exactly `width` UTF-8 bytes
+    return prefix + "x" * (width - len(prefix.encode("utf-8")))
+
+
+def test_max_length_fields_round_trip(tmp_path):
+    team = _fill("Olympique Épinal ", TABLE_DTYPE["team"].itemsize)
+    name = _fill("❖ Jean-Étienne Ødegård ", PLAYER_DTYPE["name"].itemsize)
+    nation = _fill("Côte d'Ivoire ", PLAYER_DTYPE["nation"].itemsize)
+    club = _club(team, Player(name, "CAM", nation, 19, 77, 10))
+
+    history = SeasonHistory(str(tmp_path))
+    history.record_season(2025, [club], user=club)
+
+    assert history.champions() == [(2025, team)]
+    assert history.club_positions(team) == [(2025, 1)]
+    [top] = history.top_players()
+    assert (top["team"], top["name"], top["pos"]) == (team, name, "CAM")
+    assert history.players()["nation"][0].decode("utf-8") == nation
+
+
+@pytest.mark.parametrize("field, value", [
+    ("team", "y" * (TABLE_DTYPE["team"].itemsize + 1)),
+    ("name", "é" * (PLAYER_DTYPE["name"].itemsize // 2 + 1)),
+    ("nation", "z" * (PLAYER_DTYPE["nation"].itemsize + 1)),
+])
+def test_overlong_field_is_refused(tmp_path, field, value):
+    player = Player(value if field == "name" else "Ann Lee", "ST",
+                    value if field == "nation" else "France", 24, 70, 5)
+    club = _club(value if field == "team" else "Lens", player)
+
+    history = SeasonHistory(str(tmp_path))
+    with pytest.raises(ValueError, match=field):
+        history.record_season(2025, [club])
+    assert not os.path.exists(history.table_path)
+    assert not os.path.exists(history.players_path)
@@ -1,11 +1,13 @@
-import random
+from rngStreams import streams
 from playerCost import est_cost_eur
 from constants import *
 from randomName import random_name
 from models.player import Player
 from organizeSquad import organize_squad
+from terminal import DEBUG, NORMAL, echo, log
 
 def trim_ai_reserves(team):
+    rng = streams.random("transfers")
     over = len(team.reserves) - RESERVES
     if over <= 0:
         return
@@ -17,7 +19,7 @@ def trim_ai_reserves(team):
     k = min(2, over, len(oldest5))
     victims = set()
     if k > 0:
-        drop = set(random.sample(oldest5, k))
+        drop = set(rng.sample(oldest5, k))
         victims.update(drop)
         over -= k
 
@@ -29,16 +31,17 @@ def trim_ai_reserves(team):
     # Apply the trimming and fees
     team.reserves = [p for p in team.reserves if p not in victims]
     total_fee = len(victims) * 1  # €1 per release
-    team.budget -= total_fee
+    team.charge(total_fee, "release_fee")
 
-    print(f"{team.name} released {len(victims)} reserve(s), paying €{total_fee} in total fees.")
+    log(NORMAL, "{} released {} reserve(s), paying €{} in total fees.", team.name, len(victims), total_fee)
 
 
 def ai_transfers(team, free_agents):
     """Handle AI-controlled team transfers automatically during transfer windows."""
+    rng = streams.random("transfers")
     # Skip entire window if budget is below €5M at this point
     if team.budget < 5:
-        print(f"{team.name} skips transfers (budget €{team.budget:,}M < €5M).")
+        log(NORMAL, "{} skips transfers (budget €{:,}M < €5M).", team.name, team.budget)
         return
 
     organize_squad(team)
@@ -66,15 +69,15 @@ def ai_transfers(team, free_agents):
             price = est_cost_eur(prospect.age, prospect.rating)
             if price > team.budget:
                 continue
-            if team.pay(price):
+            if team.pay(price, "signing"):
                 free_agents.remove(prospect)
                 team.reserves.append(prospect)
-                print(f"{team.name} has signed {prospect.name} a future start")
+                log(NORMAL, "{} has signed {} a future start", team.name, prospect.name)
                 organize_squad(team)
                 return True
         return False
 
-    n_transfers = random.randint(1, 3)
+    n_transfers = rng.randint(1, 3)
     lock_primary_need = False
 
     # If planned multi-signing leaves < €40M per signing, do just one
@@ -86,7 +89,7 @@ def ai_transfers(team, free_agents):
     for i in range(n_transfers):
         # If budget dropped under €5M during the window, stop signing more
         if team.budget < 5:
-            print(f"{team.name} stops transfers (budget €{team.budget:,}M < €5M).")
+            log(NORMAL, "{} stops transfers (budget €{:,}M < €5M).", team.name, team.budget)
             break
         if not free_agents:
             break
@@ -94,7 +97,7 @@ def ai_transfers(team, free_agents):
         weakest_by_avg, priority_by_delta = capture_needs()
         if not priority_by_delta:
             break
-        print(f"Weakest positions: {', '.join(weakest_by_avg)}")
+        log(DEBUG, "Weakest positions: {}", ", ".join(weakest_by_avg))
 
         if lock_primary_need:
             target_positions = priority_by_delta[:1]
@@ -137,7 +140,7 @@ def ai_transfers(team, free_agents):
         candidates = same_pos if same_pos else [
             p for p in free_agents if est_cost_eur(p.age, p.rating) <= val
         ]
-        print(f"Available candidates: {len(candidates)}")
+        log(DEBUG, "Available candidates: {}", len(candidates))
         if not candidates:
             try_sign_future_star()
             continue
@@ -149,25 +152,36 @@ def ai_transfers(team, free_agents):
 
         # Prefer top-rated affordable targets;  add a little randomness
         target_pool = sorted(viable, key=lambda x: x.rating, reverse=True)[:6]
-        signing = random.choice(target_pool)
+        signing = rng.choice(target_pool)
         price = est_cost_eur(signing.age, signing.rating)
 
-        if team.pay(price):
+        if team.pay(price, "signing"):
             free_agents.remove(signing)
             team.reserves.append(signing)
-            print(f"📝 {team.name} signed {signing.name} ({signing.pos}, {signing.rating} OVR, Age {signing.age}) "
-          f"for €{price:,}M.")
+            log(NORMAL, "📝 {} signed {} ({}, {} OVR, Age {}) for €{:,}M.",
+                team.name, signing.name, signing.pos, signing.rating, signing.age, price)
             organize_squad(team)
 
 
+# Default odds of each champion_poach_user roll
+POACH_TOP_CHANCE = 0.90
+POACH_DOUBLE_CHANCE = 0.30
+POACH_BOTTOM_CHANCE = 0.30
+POACH_FREE_MOVE_CHANCE = 0.95
+
+
 def champion_poach_user(
     prev_table,
     user,
-    top_chance=0.90,
-    bottom_chance=0.30,
+    top_chance=None,
+    bottom_chance=None,
     premium_rate=0.15,
-    free_roll_chance=0.95
+    free_roll_chance=None
 ):
+    rng = streams.random("transfers")
+    top_chance = POACH_TOP_CHANCE if top_chance is None else top_chance
+    bottom_chance = POACH_BOTTOM_CHANCE if bottom_chance is None else bottom_chance
+    free_roll_chance = POACH_FREE_MOVE_CHANCE if free_roll_chance is None else free_roll_chance
     if not prev_table or not user.all_players():
         return
 
@@ -182,11 +196,11 @@ def champion_poach_user(
 
     def remove_from_user_and_add_to_buyer(target, buyer, base, prem, total, allow_negative=False):
         if not allow_negative and buyer.budget < total:
-            print(f"\n{buyer.name} wanted {target.name} but cannot afford €{total:,}. No transfer.")
+            echo(f"\n{buyer.name} wanted {target.name} but cannot afford €{total:,}. No transfer.")
             return False
 
-        buyer.budget -= total  # may go negative if allow_negative=True
-        user.receive(total)
+        buyer.charge(total, "poach_paid", user)  # may go negative if allow_negative=True
+        user.receive(total, "poach_received", buyer)
 
         source_group = "Reserves"
         for label, group in (("Starters", user.starters), ("Bench", user.bench), ("Reserves", user.reserves)):
@@ -207,12 +221,12 @@ def champion_poach_user(
 
         flag = target.flag() if hasattr(target, "flag") else f"({target.nation})"
         neg_note = " (budget now negative)" if buyer.budget < 0 else ""
-        print(
+        echo(
             f"\nPOACH! {buyer.name} signed {target.name} {flag} "
             f"({target.pos}, {target.rating} OVR) from your {source_label} "
             f"for €{base:,} + {int(premium_rate*100)}% (€{prem:,}) = €{total:,}."
         )
-        print(f"{user.name} receives €{total:,}. {buyer.name} budget: €{buyer.budget:,}{neg_note}")
+        echo(f"{user.name} receives €{total:,}. {buyer.name} budget: €{buyer.budget:,}{neg_note}")
         return True
 
     def free_move_from_user_reserves(target, dest_team):
@@ -237,7 +251,7 @@ def champion_poach_user(
             user.unprotect_player(target)
         protected.discard(target)
         flag = target.flag() if hasattr(target, "flag") else f"({target.nation})"
-        print(
+        echo(
             f"\nFREE TRANSFER: {target.name} {flag} left {user.name} "
             f"({target.pos}, {target.rating} OVR, {source_label}) for {dest_team.name} "
             f"(lowest avg rating: {dest_team.avg_rating():.1f})."
@@ -258,12 +272,12 @@ def champion_poach_user(
         return p.rating
 
     # ---------- Roll 1: 90% — richest top-2 non-user teams buy affordable top-3 ----------
-    double_poach_chance = 0.30
-    if random.random() < top_chance:
+    double_poach_chance = POACH_DOUBLE_CHANCE
+    if rng.random() < top_chance:
         non_user = [t for t in prev_table if t is not user]
         richest_top2 = sorted(non_user, key=lambda t: t.budget, reverse=True)[:2]
         if richest_top2:
-            buyer = random.choice(richest_top2)
+            buyer = rng.choice(richest_top2)
             affordable = []
             for p in user.all_players():
                 if p in protected:
@@ -273,11 +287,11 @@ def champion_poach_user(
                     affordable.append((p, total))
             if affordable:
                 top3_affordable = sorted(affordable, key=lambda pt: pt[0].rating, reverse=True)[:3]
-                target, total = random.choice(top3_affordable)
+                target, total = rng.choice(top3_affordable)
                 base, prem, _ = est_price_with_premium(target)
                 poach_success = remove_from_user_and_add_to_buyer(target, buyer, base, prem, total, allow_negative=False)
 
-                if poach_success and random.random() < double_poach_chance:
+                if poach_success and rng.random() < double_poach_chance:
                     # Follow-up attempt: same buyer tries to poach another player 20% of the time
                     followup_affordable = []
                     for p in user.all_players():
@@ -288,7 +302,7 @@ def champion_poach_user(
                             followup_affordable.append((p, followup_total))
                     if followup_affordable:
                         followup_top3 = sorted(followup_affordable, key=lambda pt: pt[0].rating, reverse=True)[:3]
-                        followup_target, followup_total = random.choice(followup_top3)
+                        followup_target, followup_total = rng.choice(followup_top3)
                         followup_base, followup_prem, _ = est_price_with_premium(followup_target)
                         remove_from_user_and_add_to_buyer(
                             followup_target,
@@ -300,53 +314,54 @@ def champion_poach_user(
                         )
 
     # ---------- Roll 2: 30% — bottom-3 in table buy from top-5 potential reserves (can go negative) ----------
-    if random.random() < bottom_chance:
+    if rng.random() < bottom_chance:
         bottom3 = [t for t in prev_table[-3:] if t is not user]
         if bottom3 and user.reserves:
-            buyer = random.choice(bottom3)
+            buyer = rng.choice(bottom3)
             reserves_by_pot = [
                 p for p in user.reserves if p not in protected
             ]
             reserves_by_pot = sorted(reserves_by_pot, key=lambda p: calc_max_potential(p), reverse=True)[:5]
             if reserves_by_pot:
-                target = random.choice(reserves_by_pot)
+                target = rng.choice(reserves_by_pot)
                 base, prem, total = est_price_with_premium(target)
                 remove_from_user_and_add_to_buyer(target, buyer, base, prem, total, allow_negative=True)
 
     # ---------- Roll 3: 95% — free move if >3 reserves rated >81 to lowest-avg team ----------
-    if random.random() < free_roll_chance:
+    if rng.random() < free_roll_chance:
         strong_reserves = [p for p in user.reserves if p.rating > 81 and p not in protected]
         candidates = [t for t in prev_table if t is not user]
         if len(strong_reserves) > 3 and candidates:
             dest = min(candidates, key=lambda t: t.avg_rating())
-            target = random.choice(strong_reserves)
+            target = rng.choice(strong_reserves)
             free_move_from_user_reserves(target, dest)
 
 
 
 def make_free_agent_pool(num=75):
+    rng = streams.random("transfers")
     base_positions = ["GK", "CB", "LB", "RB", "CDM", "CAM", "CM", "ST", "LW", "RW"]
     all_origins = [n for arr in ORIGINS.values() for n in arr]
 
     def pick_origin():
-        return random.choice(all_origins)
+        return rng.choice(all_origins)
 
     def roll_potential(rating):
-        pot = random.randint(79, 94)
+        pot = rng.randint(79, 94)
         pot = max(rating + 1, pot) if pot <= rating else pot
-        if pot > 91 and random.randint(1, 25) != 1:  # 98% cap at 91
+        if pot > 91 and rng.randint(1, 25) != 1:  # 98% cap at 91
             pot = 91
         return pot
 
     def make_player(pos, age_lo, age_hi, rating_lo, rating_hi):
         nation = pick_origin()
-        age = random.randint(age_lo, age_hi)
-        rating = random.randint(rating_lo, rating_hi)
+        age = rng.randint(age_lo, age_hi)
+        rating = rng.randint(rating_lo, rating_hi)
         pot = roll_potential(rating)
         return Player(random_name(nation), pos, nation, age, rating, pot - rating)
 
     # Create full pool
-    pool = [make_player(random.choice(base_positions), 18, 34, 74, 88) for _ in range(num)]
+    pool = [make_player(rng.choice(base_positions), 18, 34, 74, 88) for _ in range(num)]
 
     # 1) Remove 5 lowest-rated players age ≥ 30
     over29 = [p for p in pool if p.age >= 30]
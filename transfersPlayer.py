@@ -1,30 +1,44 @@
 from constants import RESERVES
 from prompts import prompt_int
-import random
+from rngStreams import streams
 from organizeSquad import organize_squad
 from utils import yesno
+from terminal import echo, echo_lines
+from ui import ListingView
+
+def _reserve_row(p):
+    flag = p.flag() if hasattr(p, "flag") else f"({p.nation})"
+    return f"{p.pos:<3} {p.name:<28} {flag} {p.rating} OVR  {p.age}y  Value €{p.value():,}"
+
+
+def _poach_row(entry):
+    club, bucket_name, _, player, base, premium, total = entry
+    flag = player.flag() if hasattr(player, "flag") else f"({player.nation})"
+    return (
+        f"{player.name:<28} {flag}  {player.rating:>2} OVR  {player.age:>2}y  "
+        f"{club.name:<18} {bucket_name:<8}  "
+        f"€{total:,} (Base €{base:,} + Premium €{premium:,})"
+    )
+
 
 def trim_user_reserves(team, severance_rate=0.0):
     """Ensure user reserves ≤ RESERVES. Let user choose who to release.
        Optionally charge severance (0.0 means no fee)."""
+    # Show reserves, lowest value first (easiest cuts first)
+    view = ListingView("Reserves (lowest value first)", row=_reserve_row,
+                       sort_key=lambda p: p.value(), price=lambda p: p.value())
     while len(team.reserves) > RESERVES:
-        print(f"\nYou have {len(team.reserves)} reserves. Pick one to release to reach {RESERVES}.")
-        # Show reserves, lowest value first (easiest cuts first)
-        sorted_res = sorted(team.reserves, key=lambda p: p.value())
-        for i, p in enumerate(sorted_res, 1):
-            flag = p.flag() if hasattr(p, "flag") else f"({p.nation})"
-            print(f"  {i:>2}. {p.pos:<3} {p.name:<28} {flag} {p.rating} OVR  {p.age}y  Value €{p.value():,}")
-
-        idx = prompt_int(f"Release which (1..{len(sorted_res)}): ", 1, len(sorted_res)) - 1
-        victim = sorted_res[idx]
+        echo(f"\nYou have {len(team.reserves)} reserves. Pick one to release to reach {RESERVES}.")
+        view.update(team.reserves)
+        victim = view.choose("Release which ")
         if severance_rate > 0:
             fee = max(1, int(round(victim.value() * severance_rate)))
-            team.budget -= fee
-            print(f"Paid severance €{fee:,}. New budget €{team.budget:,}")
+            team.charge(fee, "severance")
+            echo(f"Paid severance €{fee:,}. New budget €{team.budget:,}")
         team.reserves.remove(victim)
         if hasattr(team, "unprotect_player"):
             team.unprotect_player(victim)
-        print(f"Released {victim.name}. Reserves now {len(team.reserves)}/{RESERVES}.")
+        echo(f"Released {victim.name}. Reserves now {len(team.reserves)}/{RESERVES}.")
 
 def user_poach_players(user, teams, premium_rate=0.15):
     """Allow the user to poach players from other teams using the same premium rate."""
@@ -51,12 +65,12 @@ def user_poach_players(user, teams, premium_rate=0.15):
         return pos_map
 
     if not opponent_teams():
-        print("\nNo opponent clubs currently have players available to poach.")
+        echo("\nNo opponent clubs currently have players available to poach.")
         return
 
     while True:
         if user.budget <= 0:
-            print("\nYou have no budget remaining to fund a poach.")
+            echo("\nYou have no budget remaining to fund a poach.")
             break
 
         if not yesno("\nAttempt to poach a player from another club? (y/n): "):
@@ -64,56 +78,46 @@ def user_poach_players(user, teams, premium_rate=0.15):
 
         affordable_by_pos = gather_affordable_by_position()
         if not affordable_by_pos:
-            print("\nNo players match your budget across any positions right now.")
+            echo("\nNo players match your budget across any positions right now.")
             break
 
         positions = sorted(affordable_by_pos.keys())
-        print(f"\nAvailable positions to poach (budget €{user.budget:,}):")
-        for idx, pos in enumerate(positions, 1):
-            print(f"  {idx:>2}. {pos:<3}  Affordable players: {len(affordable_by_pos[pos])}")
+        echo(f"\nAvailable positions to poach (budget €{user.budget:,}):")
+        echo_lines([
+            f"  {idx:>2}. {pos:<3}  Affordable players: {len(affordable_by_pos[pos])}"
+            for idx, pos in enumerate(positions, 1)
+        ])
 
         pos_idx = prompt_int(f"Pick a position (1..{len(positions)}): ", 1, len(positions)) - 1
         selected_pos = positions[pos_idx]
-        roster_entries = sorted(
-            affordable_by_pos[selected_pos],
-            key=lambda entry: (-entry[3].rating, entry[6])
-        )
-
-        print("\nBudget filter active: listing only players you can afford right now.")
-        print(
-            f"\nAffordable {selected_pos} targets "
-            f"(cost includes {int(premium_rate * 100)}% poach premium):"
+        echo("\nBudget filter active: listing only players you can afford right now.")
+        view = ListingView(
+            f"Affordable {selected_pos} targets (cost includes {int(premium_rate * 100)}% poach premium)",
+            row=_poach_row, sort_key=lambda entry: (-entry[3].rating, entry[6]),
+            player=lambda entry: entry[3], price=lambda entry: entry[6],
         )
-        for idx, (club, bucket_name, _, player, base, premium, total) in enumerate(roster_entries, 1):
-            flag = player.flag() if hasattr(player, "flag") else f"({player.nation})"
-            print(
-                f"  {idx:>2}. {player.name:<28} {flag}  {player.rating:>2} OVR  {player.age:>2}y  "
-                f"{club.name:<18} {bucket_name:<8}  "
-                f"€{total:,} (Base €{base:,} + Premium €{premium:,})"
-            )
-
-        pick_idx = prompt_int(f"Poach which player (1..{len(roster_entries)}): ", 1, len(roster_entries)) - 1
-        club, bucket_name, bucket, player, base, premium, total = roster_entries[pick_idx]
+        view.update(affordable_by_pos[selected_pos])
+        club, bucket_name, bucket, player, base, premium, total = view.choose("Poach which player ")
 
         if total > user.budget:
-            print(
+            echo(
                 f"Insufficient funds for {player.name}: costs €{total:,} "
                 f"but you have €{user.budget:,}."
             )
             continue
 
-        print(
+        echo(
             f"\n{player.name} will cost €{base:,} + {int(premium_rate * 100)}% premium "
             f"(€{premium:,}) = €{total:,}."
         )
         if not yesno("Confirm this poach? (y/n): "):
             continue
 
-        if not user.pay(total):
-            print("Transaction failed due to insufficient funds.")
+        if not user.pay(total, "poach_paid", club):
+            echo("Transaction failed due to insufficient funds.")
             continue
 
-        club.receive(total)
+        club.receive(total, "poach_received", user)
         if player in bucket:
             bucket.remove(player)
         else:
@@ -128,22 +132,25 @@ def user_poach_players(user, teams, premium_rate=0.15):
         trim_user_reserves(user)
 
         flag = player.flag() if hasattr(player, "flag") else f"({player.nation})"
-        print(
+        echo(
             f"\nPOACH COMPLETE: {user.name} signed {player.name} {flag} from {club.name} "
             f"for €{total:,}."
         )
-        print(f"{user.name} budget: €{user.budget:,}. {club.name} budget: €{club.budget:,}.")
+        echo(f"{user.name} budget: €{user.budget:,}. {club.name} budget: €{club.budget:,}.")
 
         if not yesno("Poach another player? (y/n): "):
             break
 
 def user_transfers(team, free_agents):
-    print(f"\nYour budget: €{team.budget:,}")
-    print("Sign as many players as you want until you run out of money.")
+    view = ListingView("Free Agents (affordable options)", sort_key=lambda p: p.value(),
+                       reverse=True, price=lambda p: p.value())
+    echo(f"\nYour budget: €{team.budget:,}")
+    echo("Sign as many players as you want until you run out of money.")
 
     # Activate display_potential_range for 50% of all free agents
     half_count = max(1, int(len(free_agents) * 0.5))
-    selected_for_display = set(random.sample(range(len(free_agents)), half_count))
+    rng = streams.random("transfers")
+    selected_for_display = set(rng.sample(range(len(free_agents)), half_count))
     for i, p in enumerate(free_agents):
         p.display_potential_range = i in selected_for_display
 
@@ -153,39 +160,22 @@ def user_transfers(team, free_agents):
 
         affordable = [p for p in free_agents if p.value() <= team.budget]
         if not affordable:
-            print("No affordable free agents right now.")
+            echo("No affordable free agents right now.")
             break
 
-        affordable.sort(key=lambda x: x.value(), reverse=True)
-        print("\nFree Agents (affordable options):")
-
-        for i, p in enumerate(affordable, 1):
-            flag = p.flag() if hasattr(p, "flag") else f"({p.nation})"
-            pot_display = f"| Pot {getattr(p, 'potential_range', ''):<7}" if getattr(p, "display_potential_range", False) else " " * 13
-
-            print(
-                f"  {i:>2}. "
-                f"{p.pos:<3} "
-                f"{p.rating:>2} OVR  "
-                f"{p.name:<28} "
-                f"{p.age:>2}y  "
-                f"{pot_display}  "
-                f"Value €{p.value():,}  {flag}"
-            )
-
-        k = prompt_int(f"Sign which (1..{len(affordable)}): ", 1, len(affordable)) - 1
-        signing = affordable[k]
+        view.update(affordable)
+        signing = view.choose("Sign which ")
         price = signing.value()
 
         if team.budget < price:
-            print("Insufficient funds.")
+            echo("Insufficient funds.")
             continue
 
-        team.pay(price)
+        team.pay(price, "signing")
         free_agents.remove(signing)
         team.reserves.append(signing)
         organize_squad(team)
         trim_user_reserves(team)
 
-        print(f"Signed {signing.name} ({signing.nation}) for €{price:,}. Added to Reserves.")
-        print(f"Remaining budget: €{team.budget:,}")
+        echo(f"Signed {signing.name} ({signing.nation}) for €{price:,}. Added to Reserves.")
+        echo(f"Remaining budget: €{team.budget:,}")
@@ -1,38 +1,189 @@
-from prompts import prompt_int
+from prompts import prompt_choice, prompt_int, read_input
+from terminal import echo, echo_lines
 
 def print_header(title: str):
     line = "=" * 46
-    print(f"\n{line}\n{title}\n{line}")
+    echo(f"\n{line}\n{title}\n{line}")
 
 def print_subtitle(title: str):
-    print(f"\n--- {title} ---")
+    echo(f"\n--- {title} ---")
 
-def run_menu(title: str, options: list[tuple[str, callable]]):
+def run_menu(title: str, options: list[tuple[str, callable]], after_action=None):
     while True:
         print_header(title)
         for i, (label, _) in enumerate(options, 1):
-            print(f"  {i}) {label}")
+            echo(f"  {i}) {label}")
         choice = prompt_int("Choice: ", 1, len(options))
         action = options[choice - 1][1]
         res = action()
+        if after_action is not None:
+            after_action()
         if res == "back":
             return
 
+PAGE_SIZE = 20
+_ROW_CACHE_LIMIT = 4096
+_row_cache = {}
+
+
+def _player_signature(p):
+    return (p.name, p.pos, p.nation, p.age, p.rating,
+            getattr(p, "potential_range", ""), getattr(p, "display_potential_range", False))
+
+
+def player_row_body(p):
+    """Display row without the index prefix; rebuilt only when the player's shown fields change."""
+    sig = _player_signature(p)
+    hit = _row_cache.get(id(p))
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    flag = p.flag() if hasattr(p, "flag") else f"({p.nation})"
+    pot_display = f"| Pot {getattr(p, 'potential_range', ''):<7}" \
+                  if getattr(p, "display_potential_range", False) else " " * 13
+    body = (
+        f"{p.pos:<3} "
+        f"{p.rating:>2} OVR  "
+        f"{p.name:<28} "
+        f"{p.age:>2}y  "
+        f"{pot_display}  "
+        f"Value €{p.value():,}  {flag}"
+    )
+    if len(_row_cache) >= _ROW_CACHE_LIMIT:
+        _row_cache.clear()
+    _row_cache[id(p)] = (sig, body)
+    return body
+
+
+def format_player_row(i, p):
+    return f"  {i:>2}. {player_row_body(p)}"
+
+
 def show_player_list(label, players):
-    print(f"\n{label}:")
+    echo(f"\n{label}:")
     if not players:
-        print("  (none)")
+        echo("  (none)")
         return
-    for i, p in enumerate(players, 1):
-        flag = p.flag() if hasattr(p, "flag") else f"({p.nation})"
-        pot_display = f"| Pot {getattr(p, 'potential_range', ''):<7}" \
-                      if getattr(p, "display_potential_range", False) else " " * 13
-        print(
-            f"  {i:>2}. "
-            f"{p.pos:<3} "
-            f"{p.rating:>2} OVR  "
-            f"{p.name:<28} "
-            f"{p.age:>2}y  "
-            f"{pot_display}  "
-            f"Value €{p.value():,}  {flag}"
-        )
+    echo_lines([format_player_row(i, p) for i, p in enumerate(players, 1)])
+
+
+class ListingView:
+    """
+    Sorted, filterable, paged listing over players (or records wrapping a player).
+    Display rows and sort keys are computed once per list version; choose() only
+    redraws when the underlying list, filter or page actually changed.
+    """
+    def __init__(self, label, row=player_row_body, sort_key=None, reverse=False,
+                 player=lambda item: item, price=None, page_size=PAGE_SIZE):
+        self.label = label
+        self.row = row
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.player = player
+        self.price = price
+        self.page_size = page_size
+        self.version = None
+        self.entries = []
+        self.filters = {}
+        self.page = 0
+        self.drawn = None
+
+    def update(self, items):
+        """Adopt a new item list; returns True if anything visible changed."""
+        version = tuple((id(self.player(item)), _player_signature(self.player(item))) for item in items)
+        if version == self.version:
+            return False
+        self.version = version
+        entries = [(item, self.row(item)) for item in items]
+        if self.sort_key is not None:
+            entries.sort(key=lambda e: self.sort_key(e[0]), reverse=self.reverse)
+        self.entries = entries
+        return True
+
+    def set_filter(self, pos=None, min_rating=None, max_price=None):
+        self.filters = {k: v for k, v in (("pos", pos), ("min_rating", min_rating),
+                                         ("max_price", max_price)) if v is not None}
+        self.page = 0
+
+    def visible(self):
+        out = self.entries
+        pos = self.filters.get("pos")
+        if pos:
+            out = [e for e in out if self.player(e[0]).pos == pos]
+        min_rating = self.filters.get("min_rating")
+        if min_rating is not None:
+            out = [e for e in out if self.player(e[0]).rating >= min_rating]
+        max_price = self.filters.get("max_price")
+        if max_price is not None and self.price is not None:
+            out = [e for e in out if self.price(e[0]) <= max_price]
+        return out
+
+    def pages(self, visible=None):
+        n = len(self.visible() if visible is None else visible)
+        return max(1, -(-n // self.page_size))
+
+    def render(self):
+        visible = self.visible()
+        pages = self.pages(visible)
+        self.page = min(self.page, pages - 1)
+        start = self.page * self.page_size
+        lines = [f"\n{self.label}:"]
+        if self.filters:
+            shown = ", ".join(f"{k.replace('_', ' ')} {v}" for k, v in self.filters.items())
+            lines.append(f"  (filter: {shown} — {len(visible)} of {len(self.entries)})")
+        if not visible:
+            lines.append("  (none)")
+        lines += [f"  {i:>2}. {row}" for i, (_, row) in
+                  enumerate(visible[start:start + self.page_size], start + 1)]
+        if pages > 1:
+            lines.append(f"  -- page {self.page + 1}/{pages} --")
+        return lines, visible
+
+    def show(self):
+        lines, _ = self.render()
+        echo_lines(lines)
+        self.drawn = (self.version, self.page, tuple(self.filters.items()))
+
+    def _prompt_filter(self):
+        pos = read_input("Position (blank = any): ").strip().upper() or None
+        rating = read_input("Min rating (blank = any): ").strip()
+        price = read_input("Max price €M (blank = any): ").strip() if self.price else ""
+        self.set_filter(pos, int(rating) if rating.isdigit() else None,
+                        int(price) if price.isdigit() else None)
+
+    def choose(self, msg, allow_cancel=False):
+        """
+        Let the user pick an item. Returns the item, or None if cancelled (0).
+        Short lists behave like a plain numbered prompt; longer ones add
+        n/p (page) and f (filter) commands.
+        """
+        first = True
+        while True:
+            state = (self.version, self.page, tuple(self.filters.items()))
+            if state != self.drawn:
+                self.show()
+            elif first:
+                echo(f"({self.label} unchanged — enter r to list again.)")
+            first = False
+            _, visible = self.render()
+            paged = len(self.entries) > self.page_size
+            commands = ("n", "p", "f", "r") if paged else ("r",)
+            hint = " (n/p page, f filter)" if paged else ""
+            lo = 0 if allow_cancel else 1
+            if not visible:
+                if not paged:
+                    return None
+                self.set_filter()
+                continue
+            choice = prompt_choice(f"{msg}({lo}..{len(visible)}){hint}: ", lo, len(visible), commands)
+            if choice == "n":
+                self.page = min(self.page + 1, self.pages(visible) - 1)
+            elif choice == "p":
+                self.page = max(self.page - 1, 0)
+            elif choice == "f":
+                self._prompt_filter()
+            elif choice == "r":
+                self.drawn = None
+            elif choice == 0:
+                return None
+            else:
+                return visible[choice - 1][0]
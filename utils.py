@@ -1,7 +1,8 @@
 from datetime import date
 from typing import Callable, Optional
 
-from prompts import prompt_int
+from prompts import prompt_int, read_input
+from terminal import echo
 
 YesNoHandler = Callable[[str], bool]
 _yesno_handler: Optional[YesNoHandler] = None
@@ -25,7 +26,7 @@ def season_dates(year: int):
 def yesno(msg: str) -> bool:
     if _yesno_handler is not None:
         return _yesno_handler(msg)
-    return input(msg).strip().lower().startswith("y")
+    return read_input(msg).strip().lower().startswith("y")
 
 
 def clamp(x, lo, hi):
@@ -42,44 +43,44 @@ def manager_switch_option(user, table, forced=False, firing_message=None):
     # Only show teams that are NOT user-managed
     options = [t for t in bottom2 if not is_user_team(t)]
 
-    print("\n" + "=" * 55)
+    echo("\n" + "=" * 55)
     title = " ⚙️  MANDATORY REASSIGNMENT " if forced else " ⚙️  MANAGER SWITCH OPTION "
-    print(title.center(55, " "))
-    print("=" * 55)
+    echo(title.center(55, " "))
+    echo("=" * 55)
 
     if forced and firing_message:
-        print(f"{firing_message}\n")
+        echo(f"{firing_message}\n")
 
     if not options:
-        print("No eligible bottom-2 teams available for switching.")
-        print("You will remain with your current club.")
-        print("=" * 55)
+        echo("No eligible bottom-2 teams available for switching.")
+        echo("You will remain with your current club.")
+        echo("=" * 55)
         return user
 
-    print("📉  Bottom 2 teams this season:")
-    print("-" * 55)
+    echo("📉  Bottom 2 teams this season:")
+    echo("-" * 55)
     for i, t in enumerate(options, 1):
-        print(f"  {i}. {t.name:<20} | Points: {t.points:>3} | GD: {t.gf - t.ga:+d}")
-    print("-" * 55)
+        echo(f"  {i}. {t.name:<20} | Points: {t.points:>3} | GD: {t.gf - t.ga:+d}")
+    echo("-" * 55)
 
     if forced:
-        print("You must accept a role at one of these clubs.")
+        echo("You must accept a role at one of these clubs.")
         k = prompt_int(f"Pick (1–{len(options)}): ", 1, len(options)) - 1
         choice = options[k]
-        print("\n" + "-" * 55)
-        print(f"🆕  You are now managing: {choice.name}")
-        print("-" * 55)
+        echo("\n" + "-" * 55)
+        echo(f"🆕  You are now managing: {choice.name}")
+        echo("-" * 55)
         return choice
 
     if yesno("Would you like to switch to one of these clubs? (y/n): "):
         k = prompt_int(f"Pick (1–{len(options)}): ", 1, len(options)) - 1
         choice = options[k]
 
-        print("\n" + "-" * 55)
-        print(f"🎯  You are now managing: {choice.name}")
-        print("-" * 55)
+        echo("\n" + "-" * 55)
+        echo(f"🎯  You are now managing: {choice.name}")
+        echo("-" * 55)
         return choice
 
-    print("🔒  You decided to stay with your current team.")
-    print("=" * 55)
+    echo("🔒  You decided to stay with your current team.")
+    echo("=" * 55)
     return user